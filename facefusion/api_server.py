@@ -0,0 +1,189 @@
+import json
+import mimetypes
+import os
+import threading
+from argparse import ArgumentParser
+from http import HTTPStatus
+from queue import Full, Queue
+from typing import Any, Dict, Iterable, Optional
+from uuid import uuid4
+from wsgiref.simple_server import WSGIServer, make_server
+
+from facefusion import logger, state_manager, wording
+from facefusion.args import reduce_step_args
+from facefusion.filesystem import create_directory, get_file_size, is_file
+from facefusion.jobs import job_helper, job_manager, job_runner, job_store, job_worker
+from facefusion.program import collect_step_program
+from facefusion.program_helper import validate_step_args
+from facefusion.types import ApiEnvironment, ApiResponse, ApiStartResponse, Args, ProcessStep
+
+API_STEP_ARGS : Args = {}
+API_STEP_PROGRAM : Optional[ArgumentParser] = None
+API_JOB_QUEUE : Optional['Queue[str]'] = None
+
+
+def create_api_server(args : Args) -> WSGIServer:
+	global API_STEP_ARGS, API_STEP_PROGRAM, API_JOB_QUEUE
+
+	API_STEP_ARGS = reduce_step_args(args)
+	API_STEP_PROGRAM = collect_step_program()
+	API_JOB_QUEUE = Queue(state_manager.get_item('api_queue_limit'))
+	create_directory(state_manager.get_item('api_output_path'))
+	return make_server(state_manager.get_item('api_host'), state_manager.get_item('api_port'), handle_api_request)
+
+
+def run(args : Args, process_step : ProcessStep) -> None:
+	api_server = create_api_server(args)
+	start_api_runner(process_step)
+	logger.info(wording.get('api_listening').format(api_host = api_server.server_address[0], api_port = api_server.server_port), __name__)
+	api_server.serve_forever()
+
+
+def start_api_runner(process_step : ProcessStep) -> threading.Thread:
+	state_manager.set_item('video_memory_strategy', 'tolerant')
+	api_runner = threading.Thread(target = run_api_jobs, args = (process_step,), daemon = True)
+	api_runner.start()
+	return api_runner
+
+
+def run_api_jobs(process_step : ProcessStep) -> None:
+	job_runner.recover_stale_jobs()
+
+	for job_id in job_manager.find_job_ids('queued'):
+		run_api_job(job_id, process_step)
+
+	while API_JOB_QUEUE:
+		job_id = API_JOB_QUEUE.get()
+		run_api_job(job_id, process_step)
+		API_JOB_QUEUE.task_done()
+
+
+def run_api_job(job_id : str, process_step : ProcessStep) -> bool:
+	try:
+		return job_worker.run_worker_job(job_id, process_step)
+	except BaseException as exception:
+		logger.error(wording.get('processing_job_crashed').format(job_id = job_id, exception = repr(exception)), __name__)
+		job_worker.fail_worker_job(job_id)
+	return False
+
+
+def handle_api_request(environment : ApiEnvironment, start_response : ApiStartResponse) -> Iterable[bytes]:
+	request_method = environment.get('REQUEST_METHOD')
+	path_parts = environment.get('PATH_INFO', '').strip('/').split('/')
+
+	if request_method == 'POST' and path_parts == [ 'jobs' ]:
+		return respond_json(start_response, submit_api_job(read_request_json(environment)))
+	if request_method == 'GET' and len(path_parts) == 2 and path_parts[0] == 'jobs':
+		return respond_json(start_response, report_api_job(path_parts[1]))
+	if request_method == 'GET' and len(path_parts) == 4 and path_parts[0] == 'jobs' and path_parts[2] == 'outputs':
+		return stream_api_output(environment, start_response, path_parts[1], path_parts[3])
+	return respond_json(start_response, (HTTPStatus.NOT_FOUND, { 'error': wording.get('api_route_not_found') }))
+
+
+def submit_api_job(request_body : Any) -> ApiResponse:
+	request_steps = request_body.get('steps') if isinstance(request_body, dict) else None
+
+	if not request_steps or not isinstance(request_steps, list) or not all(is_api_step(request_step) for request_step in request_steps):
+		return HTTPStatus.BAD_REQUEST, { 'error': wording.get('api_invalid_request') }
+
+	job_id = job_helper.suggest_job_id('api') + '-' + uuid4().hex[:8]
+
+	if job_manager.create_job(job_id):
+		for request_step in request_steps:
+			step_args = API_STEP_ARGS.copy()
+			step_args.update(request_step)
+			step_args['output_path'] = resolve_api_output_path(request_step.get('output_path'))
+			job_manager.add_step(job_id, step_args)
+
+		if job_manager.submit_job(job_id):
+			try:
+				API_JOB_QUEUE.put_nowait(job_id)
+				return HTTPStatus.ACCEPTED, { 'job_id': job_id, 'job_status': 'queued' }
+			except Full:
+				job_manager.delete_job(job_id)
+				return HTTPStatus.SERVICE_UNAVAILABLE, { 'error': wording.get('api_queue_full') }
+
+	return HTTPStatus.INTERNAL_SERVER_ERROR, { 'error': wording.get('job_not_created').format(job_id = job_id) }
+
+
+def is_api_step(request_step : Any) -> bool:
+	if isinstance(request_step, dict) and all(step_key in job_store.get_step_keys() for step_key in request_step):
+		step_args = { step_key: step_value for step_key, step_value in request_step.items() if step_key not in [ 'source_paths', 'target_path', 'output_path' ] }
+		return validate_step_args(API_STEP_PROGRAM, step_args) and is_api_input_paths(request_step) and bool(resolve_api_output_path(request_step.get('output_path')))
+	return False
+
+
+def is_api_input_paths(request_step : Dict[str, Any]) -> bool:
+	source_paths = request_step.get('source_paths', [])
+	target_path = request_step.get('target_path')
+
+	if not isinstance(source_paths, list) or not all(isinstance(source_path, str) and is_file(source_path) for source_path in source_paths):
+		return False
+	return target_path is None or isinstance(target_path, str) and is_file(target_path)
+
+
+def resolve_api_output_path(output_path : Any) -> Optional[str]:
+	api_output_path = os.path.realpath(state_manager.get_item('api_output_path'))
+
+	if isinstance(output_path, str) and output_path:
+		output_path = os.path.realpath(os.path.join(api_output_path, output_path))
+
+		if output_path != api_output_path and os.path.commonpath([ api_output_path, output_path ]) == api_output_path:
+			return output_path
+	return None
+
+
+def report_api_job(job_id : str) -> ApiResponse:
+	job_status = job_manager.get_job_status(job_id)
+
+	if job_status:
+		steps = job_manager.get_steps(job_id)
+		output_paths = list(dict.fromkeys(step.get('args').get('output_path') for step in steps))
+		api_report : Dict[str, Any] =\
+		{
+			'job_id': job_id,
+			'job_status': job_status,
+			'step_total': len(steps),
+			'step_completed': sum(step.get('status') == 'completed' for step in steps),
+			'output_paths': output_paths
+		}
+		return HTTPStatus.OK, api_report
+	return HTTPStatus.NOT_FOUND, { 'error': wording.get('api_job_not_found').format(job_id = job_id) }
+
+
+def stream_api_output(environment : ApiEnvironment, start_response : ApiStartResponse, job_id : str, output_index : str) -> Iterable[bytes]:
+	status_code, api_report = report_api_job(job_id)
+	output_paths = api_report.get('output_paths', [])
+
+	if status_code == HTTPStatus.OK and api_report.get('job_status') != 'completed':
+		return respond_json(start_response, (HTTPStatus.CONFLICT, { 'error': wording.get('api_job_not_completed').format(job_id = job_id) }))
+	if status_code == HTTPStatus.OK and output_index.isdigit() and int(output_index) < len(output_paths) and is_api_output(output_paths[int(output_index)]):
+		output_path = output_paths[int(output_index)]
+		output_type = mimetypes.guess_type(output_path)[0] or 'application/octet-stream'
+		start_response(format_status(HTTPStatus.OK), [ ('Content-Type', output_type), ('Content-Length', str(get_file_size(output_path))) ])
+		return environment.get('wsgi.file_wrapper')(open(output_path, 'rb'), 1024 * 1024)
+	return respond_json(start_response, (HTTPStatus.NOT_FOUND, { 'error': wording.get('api_output_not_found').format(job_id = job_id) }))
+
+
+def is_api_output(output_path : Any) -> bool:
+	return resolve_api_output_path(output_path) == output_path and is_file(output_path)
+
+
+def read_request_json(environment : ApiEnvironment) -> Any:
+	try:
+		content_length = int(environment.get('CONTENT_LENGTH') or 0)
+		return json.loads(environment.get('wsgi.input').read(content_length))
+	except ValueError:
+		return None
+
+
+def respond_json(start_response : ApiStartResponse, api_response : ApiResponse) -> Iterable[bytes]:
+	status_code, response_body = api_response
+	response_content = json.dumps(response_body).encode()
+	start_response(format_status(status_code), [ ('Content-Type', 'application/json'), ('Content-Length', str(len(response_content))) ])
+	return [ response_content ]
+
+
+def format_status(status_code : int) -> str:
+	return str(status_code) + ' ' + HTTPStatus(status_code).phrase
+
@@ -45,6 +45,8 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	# paths
 	apply_state_item('temp_path', args.get('temp_path'))
 	apply_state_item('jobs_path', args.get('jobs_path'))
+	apply_state_item('job_storage', args.get('job_storage'))
+	apply_state_item('job_cache_limit', args.get('job_cache_limit'))
 	apply_state_item('source_paths', args.get('source_paths'))
 	apply_state_item('target_path', args.get('target_path'))
 	apply_state_item('output_path', args.get('output_path'))
@@ -57,6 +59,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_detector_size', args.get('face_detector_size'))
 	apply_state_item('face_detector_angles', args.get('face_detector_angles'))
 	apply_state_item('face_detector_score', args.get('face_detector_score'))
+	apply_state_item('face_detector_interval', args.get('face_detector_interval'))
 	# face landmarker
 	apply_state_item('face_landmarker_model', args.get('face_landmarker_model'))
 	apply_state_item('face_landmarker_score', args.get('face_landmarker_score'))
@@ -82,6 +85,11 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('trim_frame_start', args.get('trim_frame_start'))
 	apply_state_item('trim_frame_end', args.get('trim_frame_end'))
 	apply_state_item('temp_frame_format', args.get('temp_frame_format'))
+	apply_state_item('pipeline_mode', args.get('pipeline_mode'))
+	apply_state_item('pipeline_stage_workers', args.get('pipeline_stage_workers'))
+	apply_state_item('video_segment_count', args.get('video_segment_count'))
+	apply_state_item('video_segment_workers', args.get('video_segment_workers'))
+	apply_state_item('face_index_only', args.get('face_index_only'))
 	apply_state_item('keep_temp', args.get('keep_temp'))
 	# output creation
 	apply_state_item('output_image_quality', args.get('output_image_quality'))
@@ -122,18 +130,45 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('execution_providers', args.get('execution_providers'))
 	apply_state_item('execution_thread_count', args.get('execution_thread_count'))
 	apply_state_item('execution_queue_count', args.get('execution_queue_count'))
+	apply_state_item('execution_worker_mode', args.get('execution_worker_mode'))
+	apply_state_item('execution_schedule_mode', args.get('execution_schedule_mode'))
+	apply_state_item('execution_batch_size', args.get('execution_batch_size'))
+	apply_state_item('execution_batch_wait', args.get('execution_batch_wait'))
+	apply_state_item('execution_intra_op_thread_count', args.get('execution_intra_op_thread_count'))
+	apply_state_item('execution_inter_op_thread_count', args.get('execution_inter_op_thread_count'))
+	apply_state_item('execution_session_mode', args.get('execution_session_mode'))
+	apply_state_item('execution_graph_optimization', args.get('execution_graph_optimization'))
+	apply_state_item('execution_memory_arena', args.get('execution_memory_arena'))
+	apply_state_item('execution_graph_cache_path', args.get('execution_graph_cache_path'))
+	apply_state_item('execution_session_count', args.get('execution_session_count'))
 	# download
 	apply_state_item('download_providers', args.get('download_providers'))
 	apply_state_item('download_scope', args.get('download_scope'))
 	# benchmark
 	apply_state_item('benchmark_resolutions', args.get('benchmark_resolutions'))
 	apply_state_item('benchmark_cycle_count', args.get('benchmark_cycle_count'))
+	apply_state_item('benchmark_suite', args.get('benchmark_suite'))
+	apply_state_item('benchmark_report_path', args.get('benchmark_report_path'))
+	apply_state_item('benchmark_compare_path', args.get('benchmark_compare_path'))
+	apply_state_item('benchmark_regression_tolerance', args.get('benchmark_regression_tolerance'))
 	# memory
 	apply_state_item('video_memory_strategy', args.get('video_memory_strategy'))
 	apply_state_item('system_memory_limit', args.get('system_memory_limit'))
+	apply_state_item('session_memory_limit', args.get('session_memory_limit'))
+	apply_state_item('face_store_limit', args.get('face_store_limit'))
 	# misc
 	apply_state_item('log_level', args.get('log_level'))
 	apply_state_item('halt_on_error', args.get('halt_on_error'))
+	apply_state_item('instrument_stages', args.get('instrument_stages'))
+	apply_state_item('trace_path', args.get('trace_path'))
+	apply_state_item('job_runner_workers', args.get('job_runner_workers'))
+	apply_state_item('job_worker_interval', args.get('job_worker_interval'))
+	apply_state_item('job_worker_memory_limit', args.get('job_worker_memory_limit'))
+	# api
+	apply_state_item('api_host', args.get('api_host'))
+	apply_state_item('api_port', args.get('api_port'))
+	apply_state_item('api_queue_limit', args.get('api_queue_limit'))
+	apply_state_item('api_output_path', args.get('api_output_path'))
 	# jobs
 	apply_state_item('job_id', args.get('job_id'))
 	apply_state_item('job_status', args.get('job_status'))
@@ -3,18 +3,30 @@ import os
 import statistics
 import tempfile
 from time import perf_counter
-from typing import Generator, List
+from typing import Any, Callable, Generator, List, Optional, Tuple
+
+import numpy
 
 import facefusion.choices
-from facefusion import core, state_manager
+from facefusion import core, face_detector, face_landmarker, face_masker, face_recognizer, logger, process_manager, state_manager, wording
 from facefusion.cli_helper import render_table
 from facefusion.download import conditional_download, resolve_download_url
-from facefusion.filesystem import get_file_extension
-from facefusion.types import BenchmarkCycleSet
-from facefusion.vision import count_video_frame_total, detect_video_fps, detect_video_resolution, pack_resolution
+from facefusion.face_helper import WARP_TEMPLATE_SET, paste_back, warp_face_by_face_landmark_5
+from facefusion.ffmpeg import create_synthetic_video, extract_frames, merge_video
+from facefusion.filesystem import get_file_extension, remove_file
+from facefusion.json import read_json, write_json
+from facefusion.processors.core import load_processor_module
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, resolve_temp_frame_paths
+from facefusion.types import BenchmarkCycleSet, BenchmarkRegression, BenchmarkResolution, BenchmarkStage, BenchmarkStageMetrics, BenchmarkStageReport, BenchmarkStageTimes, BoundingBox, ErrorCode, Face, FaceLandmark5, Mask, Resolution, VisionFrame
+from facefusion.vision import count_video_frame_total, detect_video_fps, detect_video_resolution, pack_resolution, read_image, write_image
+
+BENCHMARK_STAGE_FPS = 25
+BENCHMARK_STAGE_DURATION = 1
 
 
 def pre_check() -> bool:
+	if state_manager.get_item('benchmark_suite') == 'stages':
+		return True
 	conditional_download('.assets/examples',
 	[
 		resolve_download_url('examples-3.0.0', 'source.jpg'),
@@ -104,3 +116,228 @@ def render() -> None:
 
 	contents = [ list(benchmark_set.values()) for benchmark_set in benchmarks ]
 	render_table(headers, contents)
+
+
+def run_stages() -> BenchmarkStageReport:
+	benchmark_resolutions = state_manager.get_item('benchmark_resolutions')
+	benchmark_cycle_count = state_manager.get_item('benchmark_cycle_count')
+
+	state_manager.init_item('face_landmarker_score', 0)
+	state_manager.init_item('temp_frame_format', 'bmp')
+	state_manager.init_item('output_video_preset', 'ultrafast')
+	state_manager.init_item('video_memory_strategy', 'tolerant')
+
+	benchmark_report : BenchmarkStageReport =\
+	{
+		'suite': 'stages',
+		'execution_providers': state_manager.get_item('execution_providers'),
+		'cycle_count': benchmark_cycle_count,
+		'resolutions': {}
+	}
+
+	process_manager.start()
+
+	for benchmark_resolution in benchmark_resolutions:
+		stage_times = collect_stage_times(benchmark_resolution, benchmark_cycle_count)
+		benchmark_report['resolutions'][benchmark_resolution] = { stage: calc_stage_metrics(times) for stage, times in stage_times.items() }
+
+	process_manager.end()
+	return benchmark_report
+
+
+def collect_stage_times(benchmark_resolution : BenchmarkResolution, cycle_count : int) -> BenchmarkStageTimes:
+	target_path = os.path.join(state_manager.get_item('temp_path'), 'facefusion-benchmark-' + benchmark_resolution + '.mp4')
+	source_path = os.path.join(state_manager.get_item('temp_path'), 'facefusion-benchmark-' + benchmark_resolution + '.png')
+	target_resolution = resolve_benchmark_resolution(benchmark_resolution)
+	stage_times : BenchmarkStageTimes = {}
+
+	state_manager.set_item('target_path', target_path)
+	state_manager.set_item('source_paths', [ source_path ])
+
+	if create_synthetic_video(target_path, pack_resolution(target_resolution), BENCHMARK_STAGE_FPS, BENCHMARK_STAGE_DURATION) and write_image(source_path, create_synthetic_frame(target_resolution)):
+		for cycle_index in range(cycle_count + 1):
+			cycle_times = cycle_stages(target_path, target_resolution)
+
+			if cycle_index > 0:
+				for stage, times in cycle_times.items():
+					stage_times.setdefault(stage, []).extend(times)
+
+	clear_temp_directory(target_path)
+	remove_file(target_path)
+	remove_file(source_path)
+	return stage_times
+
+
+def cycle_stages(target_path : str, target_resolution : Resolution) -> BenchmarkStageTimes:
+	stage_times : BenchmarkStageTimes = {}
+	bounding_box, face_landmark_5 = create_synthetic_face_geometry(target_resolution)
+	source_face = create_synthetic_face(bounding_box, face_landmark_5)
+	frame_total = BENCHMARK_STAGE_FPS * BENCHMARK_STAGE_DURATION
+
+	create_temp_directory(target_path)
+	measure_stage(stage_times, 'frame_extraction', extract_frames, target_path, pack_resolution(target_resolution), BENCHMARK_STAGE_FPS, 0, frame_total)
+
+	for temp_frame_path in resolve_temp_frame_paths(target_path):
+		temp_vision_frame = measure_stage(stage_times, 'frame_read', read_image, temp_frame_path)
+		measure_stage(stage_times, 'face_detection', face_detector.detect_faces, temp_vision_frame)
+		measure_stage(stage_times, 'face_landmarking', face_landmarker.detect_face_landmark, temp_vision_frame, bounding_box, 0)
+		measure_stage(stage_times, 'face_embedding', face_recognizer.calc_embedding, temp_vision_frame, face_landmark_5)
+		crop_vision_frame, affine_matrix = measure_stage(stage_times, 'face_warping', warp_face_by_face_landmark_5, temp_vision_frame, face_landmark_5, 'arcface_128', (512, 512))
+
+		if 'face_swapper' in state_manager.get_item('processors'):
+			measure_stage(stage_times, 'face_swapping', swap_synthetic_face, source_face, temp_vision_frame, face_landmark_5)
+
+		crop_mask = measure_stage(stage_times, 'face_masking', create_synthetic_mask, crop_vision_frame)
+		temp_vision_frame = measure_stage(stage_times, 'paste_back', paste_back, temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+		measure_stage(stage_times, 'frame_write', write_image, temp_frame_path, temp_vision_frame)
+
+	measure_stage(stage_times, 'frame_merge', merge_video, target_path, BENCHMARK_STAGE_FPS, pack_resolution(target_resolution), BENCHMARK_STAGE_FPS, 0, frame_total)
+	return stage_times
+
+
+def measure_stage(stage_times : BenchmarkStageTimes, stage : BenchmarkStage, stage_method : Callable[..., Any], *stage_args : Any) -> Any:
+	start_time = perf_counter()
+	stage_result = stage_method(*stage_args)
+	stage_times.setdefault(stage, []).append((perf_counter() - start_time) * 1000)
+	return stage_result
+
+
+def calc_stage_metrics(stage_times : List[float]) -> BenchmarkStageMetrics:
+	p50, p90, p99 = numpy.percentile(stage_times, [ 50, 90, 99 ])
+	return\
+	{
+		'count': len(stage_times),
+		'mean': round(statistics.mean(stage_times), 3),
+		'p50': round(float(p50), 3),
+		'p90': round(float(p90), 3),
+		'p99': round(float(p99), 3)
+	}
+
+
+def resolve_benchmark_resolution(benchmark_resolution : BenchmarkResolution) -> Resolution:
+	height = int(benchmark_resolution.rstrip('p'))
+	width = round(height * 16 / 9 / 2) * 2
+	return width, height
+
+
+def create_synthetic_frame(resolution : Resolution) -> VisionFrame:
+	width, height = resolution
+	return numpy.random.default_rng(0).integers(0, 255, (height, width, 3), dtype = numpy.uint8)
+
+
+def create_synthetic_face_geometry(resolution : Resolution) -> Tuple[BoundingBox, FaceLandmark5]:
+	width, height = resolution
+	face_size = height / 2
+	bounding_box = numpy.array([ (width - face_size) / 2, (height - face_size) / 2, (width + face_size) / 2, (height + face_size) / 2 ])
+	face_landmark_5 = WARP_TEMPLATE_SET.get('arcface_112_v2') * face_size + bounding_box[:2]
+	return bounding_box, face_landmark_5.astype(numpy.float32)
+
+
+def create_synthetic_face(bounding_box : BoundingBox, face_landmark_5 : FaceLandmark5) -> Face:
+	embedding = numpy.random.default_rng(0).standard_normal(512).astype(numpy.float32)
+	return Face(
+		bounding_box = bounding_box,
+		score_set = { 'detector': 1.0, 'landmarker': 1.0 },
+		landmark_set = { '5': face_landmark_5, '5/68': face_landmark_5 },
+		angle = 0,
+		embedding = embedding,
+		normed_embedding = embedding / numpy.linalg.norm(embedding),
+		gender = None,
+		age = None,
+		race = None,
+		track_id = None
+	)
+
+
+def swap_synthetic_face(source_face : Face, temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> VisionFrame:
+	face_swapper = load_processor_module('face_swapper')
+	model_template = face_swapper.get_model_options().get('template')
+	model_size = face_swapper.get_model_options().get('size')
+	crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+	crop_vision_frame = face_swapper.prepare_crop_frame(crop_vision_frame)
+	crop_vision_frame = face_swapper.forward_swap_face(source_face, crop_vision_frame)
+	return face_swapper.normalize_crop_frame(crop_vision_frame)
+
+
+def create_synthetic_mask(crop_vision_frame : VisionFrame) -> Mask:
+	box_mask = face_masker.create_box_mask(crop_vision_frame, state_manager.get_item('face_mask_blur'), state_manager.get_item('face_mask_padding'))
+	occlusion_mask = face_masker.create_occlusion_mask(crop_vision_frame)
+	return numpy.minimum(box_mask, occlusion_mask)
+
+
+def compare_stage_reports(benchmark_report : BenchmarkStageReport, baseline_report : BenchmarkStageReport, regression_tolerance : int) -> List[BenchmarkRegression]:
+	benchmark_regressions : List[BenchmarkRegression] = []
+
+	for benchmark_resolution, stage_metrics_set in benchmark_report.get('resolutions').items():
+		baseline_metrics_set = baseline_report.get('resolutions', {}).get(benchmark_resolution, {})
+
+		for stage, stage_metrics in stage_metrics_set.items():
+			if stage in baseline_metrics_set:
+				baseline_p50 = baseline_metrics_set.get(stage).get('p50')
+				current_p50 = stage_metrics.get('p50')
+				difference = round((current_p50 / max(baseline_p50, 1e-6) - 1) * 100, 2)
+				benchmark_regressions.append(
+				{
+					'resolution': benchmark_resolution,
+					'stage': stage,
+					'baseline_p50': baseline_p50,
+					'current_p50': current_p50,
+					'difference': difference,
+					'is_regression': difference > regression_tolerance
+				})
+	return benchmark_regressions
+
+
+def render_stages() -> ErrorCode:
+	benchmark_report = run_stages()
+	benchmark_report_path = state_manager.get_item('benchmark_report_path')
+	benchmark_compare_path = state_manager.get_item('benchmark_compare_path')
+	headers =\
+	[
+		'resolution',
+		'stage',
+		'count',
+		'mean',
+		'p50',
+		'p90',
+		'p99'
+	]
+	contents = []
+
+	for benchmark_resolution, stage_metrics_set in benchmark_report.get('resolutions').items():
+		for stage, stage_metrics in stage_metrics_set.items():
+			contents.append([ benchmark_resolution, stage ] + list(stage_metrics.values()))
+	render_table(headers, contents)
+
+	if benchmark_report_path and not write_json(benchmark_report_path, benchmark_report): #type:ignore[arg-type]
+		return 1
+
+	if benchmark_compare_path:
+		baseline_report : Optional[BenchmarkStageReport] = read_json(benchmark_compare_path) #type:ignore[assignment]
+
+		if not baseline_report:
+			return 1
+		return render_stage_regressions(compare_stage_reports(benchmark_report, baseline_report, state_manager.get_item('benchmark_regression_tolerance')))
+	return 0
+
+
+def render_stage_regressions(benchmark_regressions : List[BenchmarkRegression]) -> ErrorCode:
+	headers =\
+	[
+		'resolution',
+		'stage',
+		'baseline_p50',
+		'current_p50',
+		'difference',
+		'is_regression'
+	]
+	contents = [ list(benchmark_regression.values()) for benchmark_regression in benchmark_regressions ]
+	render_table(headers, contents)
+
+	for benchmark_regression in benchmark_regressions:
+		if benchmark_regression.get('is_regression'):
+			logger.error(wording.get('benchmark_regression').format(stage = benchmark_regression.get('stage'), resolution = benchmark_regression.get('resolution'), difference = benchmark_regression.get('difference')), __name__)
+
+	if any(benchmark_regression.get('is_regression') for benchmark_regression in benchmark_regressions):
+		return 1
+	return 0
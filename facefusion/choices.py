@@ -2,7 +2,7 @@ import logging
 from typing import List, Sequence
 
 from facefusion.common_helper import create_float_range, create_int_range
-from facefusion.types import Angle, AudioEncoder, AudioFormat, AudioTypeSet, BenchmarkResolution, BenchmarkSet, DownloadProvider, DownloadProviderSet, DownloadScope, EncoderSet, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskArea, FaceMaskAreaSet, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, ImageFormat, ImageTypeSet, JobStatus, LogLevel, LogLevelSet, Race, Score, TempFrameFormat, UiWorkflow, VideoEncoder, VideoFormat, VideoMemoryStrategy, VideoPreset, VideoTypeSet, WebcamMode
+from facefusion.types import Angle, AudioEncoder, AudioFormat, AudioTypeSet, BenchmarkResolution, BenchmarkSet, BenchmarkSuite, DownloadProvider, DownloadProviderSet, DownloadScope, EncoderSet, ExecutionGraphOptimization, ExecutionMemoryArena, ExecutionProvider, ExecutionProviderSet, ExecutionSessionMode, ExecutionWorkerMode, FaceAttribute, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskArea, FaceMaskAreaSet, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, ImageFormat, ImageTypeSet, JobStatus, JobStorage, LogLevel, LogLevelSet, PipelineMode, PipelineStage, Race, ScheduleMode, Score, TempFrameFormat, UiWorkflow, VideoEncoder, VideoFormat, VideoMemoryStrategy, VideoPreset, VideoTypeSet, WebcamMode
 
 face_detector_set : FaceDetectorSet =\
 {
@@ -14,9 +14,10 @@ face_detector_set : FaceDetectorSet =\
 face_detector_models : List[FaceDetectorModel] = list(face_detector_set.keys())
 face_landmarker_models : List[FaceLandmarkerModel] = [ 'many', '2dfan4', 'peppa_wutz' ]
 face_selector_modes : List[FaceSelectorMode] = [ 'many', 'one', 'reference' ]
-face_selector_orders : List[FaceSelectorOrder] = [ 'left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best' ]
+face_selector_orders : List[FaceSelectorOrder] = [ 'left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best', 'track' ]
 face_selector_genders : List[Gender] = [ 'female', 'male' ]
 face_selector_races : List[Race] = [ 'white', 'black', 'latino', 'asian', 'indian', 'arabic' ]
+face_attributes : List[FaceAttribute] = [ 'embedding', 'gender', 'age', 'race' ]
 face_occluder_models : List[FaceOccluderModel] = [ 'xseg_1', 'xseg_2', 'xseg_3' ]
 face_parser_models : List[FaceParserModel] = [ 'bisenet_resnet_18', 'bisenet_resnet_34' ]
 face_mask_types : List[FaceMaskType] = [ 'box', 'occlusion', 'area', 'region' ]
@@ -72,6 +73,8 @@ audio_formats : List[AudioFormat] = list(audio_type_set.keys())
 image_formats : List[ImageFormat] = list(image_type_set.keys())
 video_formats : List[VideoFormat] = list(video_type_set.keys())
 temp_frame_formats : List[TempFrameFormat] = [ 'bmp', 'jpeg', 'png', 'tiff' ]
+pipeline_modes : List[PipelineMode] = [ 'sequential', 'fused', 'staged', 'streaming' ]
+pipeline_stages : List[PipelineStage] = [ 'read', 'analyse', 'process', 'write' ]
 
 output_encoder_set : EncoderSet =\
 {
@@ -96,6 +99,7 @@ benchmark_set : BenchmarkSet =\
 	'2160p': '.assets/examples/target-2160p.mp4'
 }
 benchmark_resolutions : List[BenchmarkResolution] = list(benchmark_set.keys())
+benchmark_suites : List[BenchmarkSuite] = [ 'resolutions', 'stages' ]
 
 webcam_modes : List[WebcamMode] = [ 'inline', 'udp', 'v4l2' ]
 webcam_resolutions : List[str] = [ '320x240', '640x480', '800x600', '1024x768', '1280x720', '1280x960', '1920x1080', '2560x1440', '3840x2160' ]
@@ -111,6 +115,11 @@ execution_provider_set : ExecutionProviderSet =\
 	'cpu': 'CPUExecutionProvider'
 }
 execution_providers : List[ExecutionProvider] = list(execution_provider_set.keys())
+execution_worker_modes : List[ExecutionWorkerMode] = [ 'thread', 'process' ]
+execution_schedule_modes : List[ScheduleMode] = [ 'locality', 'fifo' ]
+execution_session_modes : List[ExecutionSessionMode] = [ 'sequential', 'parallel' ]
+execution_graph_optimizations : List[ExecutionGraphOptimization] = [ 'disabled', 'basic', 'extended', 'all' ]
+execution_memory_arenas : List[ExecutionMemoryArena] = [ 'enabled', 'disabled' ]
 download_provider_set : DownloadProviderSet =\
 {
 	'github':
@@ -146,14 +155,31 @@ log_level_set : LogLevelSet =\
 log_levels : List[LogLevel] = list(log_level_set.keys())
 
 ui_workflows : List[UiWorkflow] = [ 'instant_runner', 'job_runner', 'job_manager' ]
-job_statuses : List[JobStatus] = [ 'drafted', 'queued', 'completed', 'failed' ]
+job_statuses : List[JobStatus] = [ 'drafted', 'queued', 'started', 'completed', 'failed' ]
+job_storages : List[JobStorage] = [ 'json', 'sqlite' ]
 
 benchmark_cycle_count_range : Sequence[int] = create_int_range(1, 10, 1)
+benchmark_regression_tolerance_range : Sequence[int] = create_int_range(0, 100, 1)
 execution_thread_count_range : Sequence[int] = create_int_range(1, 32, 1)
 execution_queue_count_range : Sequence[int] = create_int_range(1, 4, 1)
+execution_batch_size_range : Sequence[int] = create_int_range(1, 32, 1)
+execution_batch_wait_range : Sequence[int] = create_int_range(0, 100, 1)
+execution_op_thread_count_range : Sequence[int] = create_int_range(0, 64, 1)
+execution_session_count_range : Sequence[int] = create_int_range(0, 32, 1)
+pipeline_stage_workers_range : Sequence[int] = create_int_range(1, 32, 1)
+video_segment_count_range : Sequence[int] = create_int_range(1, 64, 1)
+video_segment_workers_range : Sequence[int] = create_int_range(1, 16, 1)
 system_memory_limit_range : Sequence[int] = create_int_range(0, 128, 4)
+session_memory_limit_range : Sequence[int] = create_int_range(0, 128, 1)
+face_store_limit_range : Sequence[int] = create_int_range(0, 65536, 256)
+job_cache_limit_range : Sequence[int] = create_int_range(0, 1024, 1)
+job_runner_workers_range : Sequence[int] = create_int_range(1, 32, 1)
+job_worker_interval_range : Sequence[int] = create_int_range(1, 60, 1)
+job_worker_memory_limit_range : Sequence[int] = create_int_range(0, 128, 1)
+api_queue_limit_range : Sequence[int] = create_int_range(1, 256, 1)
 face_detector_angles : Sequence[Angle] = create_int_range(0, 270, 90)
 face_detector_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
+face_detector_interval_range : Sequence[int] = create_int_range(1, 30, 1)
 face_landmarker_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
 face_mask_blur_range : Sequence[float] = create_float_range(0.0, 1.0, 0.05)
 face_mask_padding_range : Sequence[int] = create_int_range(0, 100, 1)
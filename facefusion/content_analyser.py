@@ -8,6 +8,7 @@ from facefusion import inference_manager, state_manager, wording, logger
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.filesystem import resolve_relative_path
+from facefusion.instrumentation import instrument
 from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.types import Detection, DownloadScope, DownloadSet, ExecutionProvider, Fps, InferencePool, ModelSet, VisionFrame
 from facefusion.vision import detect_video_fps, fit_frame, read_image, read_video_frame
@@ -100,6 +101,11 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	_, model_source_set = collect_model_downloads()
+	return list(model_source_set.keys())
+
+
 def resolve_execution_providers() -> List[ExecutionProvider]:
 	if has_execution_provider('coreml'):
 		return [ 'cpu' ]
@@ -203,12 +209,13 @@ def detect_with_nsfw_3(vision_frame : VisionFrame) -> bool:
 	return result
 
 
+@instrument('content_analyser.forward_nsfw')
 def forward_nsfw(vision_frame : VisionFrame, nsfw_model : str) -> Detection:
 	logger.debug('Starting forward_nsfw for model: ' + nsfw_model, __name__)
 	content_analyser = get_inference_pool().get(nsfw_model)
 
-	with conditional_thread_semaphore():
-		detection = content_analyser.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(content_analyser) as inference_session:
+		detection = inference_session.run(None,
 		{
 			'input': vision_frame
 		})[0]
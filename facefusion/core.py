@@ -3,30 +3,38 @@ import itertools
 import shutil
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from time import time
+from types import ModuleType
+from typing import List
 
 import numpy
 
-from facefusion import benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, logger, process_manager, state_manager, video_manager, voice_extractor, wording
+from facefusion import api_server, benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, inference_manager, instrumentation, logger, process_manager, state_manager, video_manager, voice_extractor, wording
 from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
 from facefusion.common_helper import get_first
 from facefusion.content_analyser import analyse_image, analyse_video
 from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import hard_exit, signal_exit
-from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face
+from facefusion.face_analyser import collect_demanded_face_attributes, get_average_face, get_demanded_face_attributes, get_many_faces, get_one_face
+from facefusion.face_index import get_face_index_path, load_face_index, process_index_frames, save_face_index
 from facefusion.face_selector import sort_and_filter_faces
-from facefusion.face_store import append_reference_face, clear_reference_faces, get_reference_faces
-from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, merge_video, replace_audio, restore_audio
-from facefusion.filesystem import filter_audio_paths, get_file_name, is_image, is_video, resolve_file_paths, resolve_file_pattern
-from facefusion.jobs import job_helper, job_manager, job_runner
+from facefusion.face_store import append_reference_face, clear_reference_faces, get_reference_faces, get_static_face_stats, scope_static_faces, set_index_faces
+from facefusion.face_tracker import clear_face_trackers
+from facefusion.ffmpeg import copy_image, detect_keyframe_numbers, extract_frames, finalize_image, merge_video, open_frame_reader, open_frame_writer, replace_audio, restore_audio
+from facefusion.filesystem import filter_audio_paths, get_file_name, has_image, is_file, is_image, is_video, move_file, resolve_file_paths, resolve_file_pattern
+from facefusion.frame_journal import close_frame_journal, count_frame_journal, create_frame_journal, create_frame_journal_key, open_frame_journal, select_frame_journal_pass
+from facefusion.jobs import job_helper, job_manager, job_runner, job_worker
 from facefusion.jobs.job_list import compose_job_list
 from facefusion.memory import limit_system_memory
-from facefusion.processors.core import get_processors_modules
+from facefusion.processors.core import get_processors_modules, get_source_faces, multi_process_frames, multi_stage_frames, multi_stream_frames, multi_thread_frames, process_fused_frames, process_vision_frame
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
-from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, move_temp_file, resolve_temp_frame_paths
-from facefusion.types import Args, ErrorCode
-from facefusion.vision import pack_resolution, read_image, read_static_images, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
+from facefusion.segment_helper import create_video_segments
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, get_temp_journal_path, move_temp_file, resolve_temp_frame_paths
+from facefusion.types import Args, ErrorCode, FaceIndexSet, Fps
+from facefusion.vision import pack_resolution, predict_video_frame_total, read_image, read_static_images, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
 
 
 def cli() -> None:
@@ -40,6 +48,7 @@ def cli() -> None:
 
 			if state_manager.get_item('command'):
 				logger.init(state_manager.get_item('log_level'))
+				instrumentation.init(state_manager.get_item('instrument_stages'), state_manager.get_item('trace_path'))
 				route(args)
 			else:
 				program.print_help()
@@ -62,10 +71,13 @@ def route(args : Args) -> None:
 	if state_manager.get_item('command') == 'benchmark':
 		if not common_pre_check() or not processors_pre_check() or not benchmarker.pre_check():
 			return hard_exit(2)
+		if state_manager.get_item('benchmark_suite') == 'stages':
+			error_code = benchmarker.render_stages()
+			return hard_exit(error_code)
 		benchmarker.render()
 
-	if state_manager.get_item('command') in [ 'job-list', 'job-create', 'job-submit', 'job-submit-all', 'job-delete', 'job-delete-all', 'job-add-step', 'job-remix-step', 'job-insert-step', 'job-remove-step' ]:
-		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if state_manager.get_item('command') in [ 'job-list', 'job-create', 'job-submit', 'job-submit-all', 'job-delete', 'job-delete-all', 'job-add-step', 'job-remix-step', 'job-insert-step', 'job-remove-step', 'job-export' ]:
+		if not job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 			hard_exit(1)
 		error_code = route_job_manager(args)
 		hard_exit(error_code)
@@ -82,23 +94,35 @@ def route(args : Args) -> None:
 		ui.launch()
 
 	if state_manager.get_item('command') == 'headless-run':
-		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
+		if not job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 			hard_exit(1)
 		error_core = process_headless(args)
 		hard_exit(error_core)
 
+	if state_manager.get_item('command') == 'api-run':
+		if not job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
+			hard_exit(1)
+		if not common_pre_check() or not processors_pre_check():
+			return hard_exit(2)
+		api_server.run(args, process_step)
+
 	if state_manager.get_item('command') == 'batch-run':
-		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
+		if not job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 			hard_exit(1)
 		error_core = process_batch(args)
 		hard_exit(error_core)
 
 	if state_manager.get_item('command') in [ 'job-run', 'job-run-all', 'job-retry', 'job-retry-all' ]:
-		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
+		if not job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 			hard_exit(1)
 		error_code = route_job_runner()
 		hard_exit(error_code)
 
+	if state_manager.get_item('command') == 'job-worker':
+		if not job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
+			hard_exit(1)
+		job_worker.run_worker(process_step)
+
 
 def pre_check() -> bool:
 	if sys.version_info < (3, 10):
@@ -224,6 +248,13 @@ def route_job_manager(args : Args) -> ErrorCode:
 		logger.error(wording.get('job_all_not_deleted'), __name__)
 		return 1
 
+	if state_manager.get_item('command') == 'job-export':
+		if job_manager.export_jobs():
+			logger.info(wording.get('job_all_exported'), __name__)
+			return 0
+		logger.error(wording.get('job_all_not_exported'), __name__)
+		return 1
+
 	if state_manager.get_item('command') == 'job-add-step':
 		step_args = reduce_step_args(args)
 
@@ -271,7 +302,7 @@ def route_job_runner() -> ErrorCode:
 
 	if state_manager.get_item('command') == 'job-run-all':
 		logger.info(wording.get('running_jobs'), __name__)
-		if job_runner.run_jobs(process_step, state_manager.get_item('halt_on_error')):
+		if job_runner.run_jobs(process_step, state_manager.get_item('halt_on_error'), state_manager.get_item('job_runner_workers')):
 			logger.info(wording.get('processing_jobs_succeed'), __name__)
 			return 0
 		logger.info(wording.get('processing_jobs_failed'), __name__)
@@ -287,7 +318,7 @@ def route_job_runner() -> ErrorCode:
 
 	if state_manager.get_item('command') == 'job-retry-all':
 		logger.info(wording.get('retrying_jobs'), __name__)
-		if job_runner.retry_jobs(process_step, state_manager.get_item('halt_on_error')):
+		if job_runner.retry_jobs(process_step, state_manager.get_item('halt_on_error'), state_manager.get_item('job_runner_workers')):
 			logger.info(wording.get('processing_jobs_succeed'), __name__)
 			return 0
 		logger.info(wording.get('processing_jobs_failed'), __name__)
@@ -299,11 +330,56 @@ def process_headless(args : Args) -> ErrorCode:
 	job_id = job_helper.suggest_job_id('headless')
 	step_args = reduce_step_args(args)
 
+	if state_manager.get_item('video_segment_count') > 1 and is_video(step_args.get('target_path')):
+		return process_segments(args)
 	if job_manager.create_job(job_id) and job_manager.add_step(job_id, step_args) and job_manager.submit_job(job_id) and job_runner.run_job(job_id, process_step):
 		return 0
 	return 1
 
 
+def process_segments(args : Args) -> ErrorCode:
+	start_time = time()
+	job_id = job_helper.suggest_job_id('segment')
+	step_args = reduce_step_args(args)
+	target_path = step_args.get('target_path')
+	output_path = step_args.get('output_path')
+	trim_frame_start, trim_frame_end = restrict_trim_frame(target_path, step_args.get('trim_frame_start'), step_args.get('trim_frame_end'))
+	video_segments = create_video_segments(trim_frame_start, trim_frame_end, detect_keyframe_numbers(target_path), state_manager.get_item('video_segment_count'))
+	logger.info(wording.get('processing_segments').format(segment_total = len(video_segments), worker_total = state_manager.get_item('video_segment_workers')), __name__)
+
+	if job_manager.create_job(job_id):
+		for segment_frame_start, segment_frame_end in video_segments:
+			step_args['trim_frame_start'] = segment_frame_start
+			step_args['trim_frame_end'] = segment_frame_end
+			step_args['output_audio_volume'] = 0
+			if not job_manager.add_step(job_id, step_args):
+				return 1
+
+		if job_manager.submit_job(job_id) and job_runner.run_job(job_id, process_step, state_manager.get_item('video_segment_workers')):
+			apply_args(args, state_manager.set_item)
+			return finalize_segments(start_time, target_path, output_path, trim_frame_start, trim_frame_end)
+	return 1
+
+
+def finalize_segments(start_time : float, target_path : str, output_path : str, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
+	process_manager.start()
+	clear_temp_directory(target_path)
+	create_temp_directory(target_path)
+	move_file(output_path, get_temp_file_path(target_path))
+	error_code = restore_video_audio(target_path, output_path, trim_frame_start, trim_frame_end)
+	clear_temp_directory(target_path)
+	process_manager.end()
+
+	if error_code:
+		return error_code
+	if is_video(output_path):
+		seconds = '{:.2f}'.format((time() - start_time))
+		logger.info(wording.get('processing_video_succeed').format(seconds = seconds), __name__)
+		return 0
+	logger.error(wording.get('processing_video_failed'), __name__)
+	return 1
+
+
 def process_batch(args : Args) -> ErrorCode:
 	job_id = job_helper.suggest_job_id('batch')
 	step_args = reduce_step_args(args)
@@ -365,6 +441,11 @@ def conditional_process() -> ErrorCode:
 			return 2
 		logger.debug('pre_process completed for: ' + processor_module.__name__, __name__)
 
+	state_manager.set_item('demanded_face_attributes', collect_demanded_face_attributes())
+	if state_manager.get_item('execution_worker_mode') != 'process':
+		warm_up_inference_pools()
+
+	scope_static_faces(state_manager.get_item('target_path'))
 	logger.debug('Starting conditional_append_reference_faces', __name__)
 	conditional_append_reference_faces()
 	logger.debug('Completed conditional_append_reference_faces', __name__)
@@ -378,17 +459,54 @@ def conditional_process() -> ErrorCode:
 		logger.debug('Processing as image', __name__)
 		error_code = process_image(start_time)
 		logger.debug('process_image returned error_code: ' + str(error_code), __name__)
+		logger.debug('Face store stats: ' + str(get_static_face_stats()), __name__)
 		return error_code
 	if is_video(target_path):
 		logger.debug('Processing as video', __name__)
 		error_code = process_video(start_time)
 		logger.debug('process_video returned error_code: ' + str(error_code), __name__)
+		logger.debug('Face store stats: ' + str(get_static_face_stats()), __name__)
 		return error_code
 
 	logger.debug('No valid target found', __name__)
 	return 0
 
 
+def warm_up_inference_pools() -> None:
+	inference_modules = collect_inference_modules()
+	logger.debug('Warming up inference pools: ' + ', '.join(inference_module.__name__ for inference_module in inference_modules), __name__)
+
+	with ThreadPoolExecutor(max_workers = len(inference_modules)) as executor:
+		for inference_module, is_warmed_up in zip(inference_modules, executor.map(warm_up_inference_module, inference_modules)):
+			if not is_warmed_up:
+				logger.debug('Warm up skipped for: ' + inference_module.__name__, __name__)
+
+
+def warm_up_inference_module(inference_module : ModuleType) -> bool:
+	inference_pool = inference_module.get_inference_pool()
+
+	if inference_pool:
+		return inference_manager.warm_up_inference_pool(inference_pool)
+	return False
+
+
+def collect_inference_modules() -> List[ModuleType]:
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	face_attributes = get_demanded_face_attributes()
+	requires_faces = bool(face_attributes) or any(processor_module.requires_target_faces() for processor_module in processor_modules)
+	inference_modules : List[ModuleType] = []
+
+	if requires_faces:
+		inference_modules.extend([ face_detector, face_landmarker ])
+	if 'embedding' in face_attributes or requires_faces and has_image(state_manager.get_item('source_paths')):
+		inference_modules.append(face_recognizer)
+	if set(face_attributes) & { 'gender', 'age', 'race' }:
+		inference_modules.append(face_classifier)
+	if set(state_manager.get_item('face_mask_types')) & { 'occlusion', 'region' }:
+		inference_modules.append(face_masker)
+	return inference_modules + processor_modules
+
+
 def conditional_append_reference_faces() -> None:
 	face_selector_mode = state_manager.get_item('face_selector_mode')
 	logger.debug('Face selector mode: ' + str(face_selector_mode), __name__)
@@ -396,7 +514,7 @@ def conditional_append_reference_faces() -> None:
 	if 'reference' in face_selector_mode and not get_reference_faces():
 		logger.debug('Appending reference faces', __name__)
 		source_frames = read_static_images(state_manager.get_item('source_paths'))
-		source_faces = get_many_faces(source_frames)
+		source_faces = get_many_faces(source_frames, [ 'embedding' ])
 		logger.debug('Source faces count: ' + str(len(source_faces)), __name__)
 		source_face = get_average_face(source_faces)
 		logger.debug('Source face found: ' + str(source_face is not None), __name__)
@@ -431,6 +549,8 @@ def conditional_append_reference_faces() -> None:
 def process_image(start_time : float) -> ErrorCode:
 	logger.debug('Starting process_image', __name__)
 	target_path = state_manager.get_item('target_path')
+	instrumentation.clear_stage_timers()
+	instrumentation.clear_trace_events()
 
 	logger.debug('Skipping image analysis (NSFW detection disabled)', __name__)
 
@@ -482,6 +602,8 @@ def process_image(start_time : float) -> ErrorCode:
 	if is_image(output_path):
 		seconds = '{:.2f}'.format((time() - start_time) % 60)
 		logger.info(wording.get('processing_image_succeed').format(seconds = seconds), __name__)
+		instrumentation.render_stage_metrics()
+		instrumentation.write_trace_events()
 		logger.debug('Image processing completed successfully', __name__)
 	else:
 		logger.error(wording.get('processing_image_failed'), __name__)
@@ -496,6 +618,8 @@ def process_image(start_time : float) -> ErrorCode:
 def process_video(start_time : float) -> ErrorCode:
 	logger.debug('Starting process_video', __name__)
 	target_path = state_manager.get_item('target_path')
+	instrumentation.clear_stage_timers()
+	instrumentation.clear_trace_events()
 	logger.debug('Target video path: ' + str(target_path), __name__)
 
 	trim_frame_start, trim_frame_end = restrict_trim_frame(target_path, state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
@@ -503,10 +627,14 @@ def process_video(start_time : float) -> ErrorCode:
 
 	logger.debug('Skipping video analysis (NSFW detection disabled)', __name__)
 
-	logger.debug(wording.get('clearing_temp'), __name__)
-	clear_temp_directory(target_path)
-	logger.debug(wording.get('creating_temp'), __name__)
-	create_temp_directory(target_path)
+	journal_path = get_temp_journal_path(target_path, create_frame_journal_key())
+	is_resumable = state_manager.get_item('pipeline_mode') != 'streaming' and is_file(journal_path) and bool(resolve_temp_frame_paths(target_path))
+
+	if not is_resumable:
+		logger.debug(wording.get('clearing_temp'), __name__)
+		clear_temp_directory(target_path)
+		logger.debug(wording.get('creating_temp'), __name__)
+		create_temp_directory(target_path)
 
 	process_manager.start()
 	logger.debug('Process manager started', __name__)
@@ -514,59 +642,133 @@ def process_video(start_time : float) -> ErrorCode:
 	temp_video_resolution = pack_resolution(restrict_video_resolution(target_path, unpack_resolution(state_manager.get_item('output_video_resolution'))))
 	temp_video_fps = restrict_video_fps(target_path, state_manager.get_item('output_video_fps'))
 	logger.debug('Video settings: resolution=' + str(temp_video_resolution) + ', fps=' + str(temp_video_fps), __name__)
+	clear_face_trackers()
+	face_index_path = get_face_index_path(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
 
-	logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
-	logger.debug('Starting frame extraction', __name__)
-	if extract_frames(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
-		logger.debug(wording.get('extracting_frames_succeed'), __name__)
+	if state_manager.get_item('face_index_only'):
+		return index_video(start_time, target_path, face_index_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+	set_index_faces(load_face_index(face_index_path))
+
+	if state_manager.get_item('pipeline_mode') == 'streaming':
+		logger.info(wording.get('streaming_video').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+		if stream_video(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+			logger.debug(wording.get('streaming_video_succeed'), __name__)
+		else:
+			if is_process_stopping():
+				logger.debug('Process stopping during video streaming', __name__)
+				process_manager.end()
+				return 4
+			logger.error(wording.get('streaming_video_failed'), __name__)
+			process_manager.end()
+			return 1
 	else:
-		if is_process_stopping():
-			logger.debug('Process stopping during frame extraction', __name__)
+		if not is_resumable:
+			logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+			logger.debug('Starting frame extraction', __name__)
+			if extract_frames(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+				logger.debug(wording.get('extracting_frames_succeed'), __name__)
+			else:
+				if is_process_stopping():
+					logger.debug('Process stopping during frame extraction', __name__)
+					process_manager.end()
+					return 4
+				logger.error(wording.get('extracting_frames_failed'), __name__)
+				logger.debug('Frame extraction failed', __name__)
+				process_manager.end()
+				return 1
+			create_frame_journal(journal_path)
+
+		open_frame_journal(journal_path)
+		if is_resumable:
+			logger.info(wording.get('resuming_frames').format(frame_total = count_frame_journal(0)), __name__)
+
+		logger.debug('Resolving temp frame paths', __name__)
+		temp_frame_paths = resolve_temp_frame_paths(target_path)
+		logger.debug('Temp frame paths count: ' + str(len(temp_frame_paths) if temp_frame_paths else 0), __name__)
+
+		if temp_frame_paths:
+			logger.debug('Processing video frames with processors', __name__)
+			processors = state_manager.get_item('processors')
+			if state_manager.get_item('pipeline_mode') == 'fused':
+				processor_modules = get_processors_modules(processors)
+				logger.debug('Starting fused video processors: ' + str(processors), __name__)
+				logger.info(wording.get('processing'), __name__)
+				multi_process_frames(state_manager.get_item('source_paths'), temp_frame_paths, partial(process_fused_frames, processors))
+				for processor_module in processor_modules:
+					processor_module.post_process()
+				logger.debug('Completed fused video processors', __name__)
+			elif state_manager.get_item('pipeline_mode') == 'staged':
+				processor_modules = get_processors_modules(processors)
+				logger.debug('Starting staged video processors: ' + str(processors), __name__)
+				logger.info(wording.get('processing'), __name__)
+				multi_stage_frames(processors, state_manager.get_item('source_paths'), temp_frame_paths)
+				for processor_module in processor_modules:
+					processor_module.post_process()
+				logger.debug('Completed staged video processors', __name__)
+			else:
+				for journal_pass, processor_module in enumerate(get_processors_modules(processors)):
+					logger.debug('Starting video processor: ' + processor_module.__name__, __name__)
+					logger.info(wording.get('processing'), processor_module.__name__)
+					select_frame_journal_pass(journal_pass)
+					clear_face_trackers()
+					processor_module.process_video(state_manager.get_item('source_paths'), temp_frame_paths)
+					if processor_module.invalidates_face_geometry():
+						set_index_faces({})
+					logger.debug('Completed video processor: ' + processor_module.__name__, __name__)
+					processor_module.post_process()
+					logger.debug('Post-processed video: ' + processor_module.__name__, __name__)
+			close_frame_journal()
+			if is_process_stopping():
+				logger.debug('Process stopping during video processing', __name__)
+				return 4
+		else:
+			logger.error(wording.get('temp_frames_not_found'), __name__)
+			logger.debug('No temp frames found for video processing', __name__)
 			process_manager.end()
-			return 4
-		logger.error(wording.get('extracting_frames_failed'), __name__)
-		logger.debug('Frame extraction failed', __name__)
-		process_manager.end()
-		return 1
+			return 1
 
-	logger.debug('Resolving temp frame paths', __name__)
-	temp_frame_paths = resolve_temp_frame_paths(target_path)
-	logger.debug('Temp frame paths count: ' + str(len(temp_frame_paths) if temp_frame_paths else 0), __name__)
+		logger.debug('Starting video merging', __name__)
+		logger.info(wording.get('merging_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
+		if merge_video(target_path, temp_video_fps, state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+			logger.debug(wording.get('merging_video_succeed'), __name__)
+		else:
+			if is_process_stopping():
+				logger.debug('Process stopping during video merging', __name__)
+				process_manager.end()
+				return 4
+			logger.error(wording.get('merging_video_failed'), __name__)
+			logger.debug('Video merging failed', __name__)
+			process_manager.end()
+			return 1
 
-	if temp_frame_paths:
-		logger.debug('Processing video frames with processors', __name__)
-		processors = state_manager.get_item('processors')
-		for processor_module in get_processors_modules(processors):
-			logger.debug('Starting video processor: ' + processor_module.__name__, __name__)
-			logger.info(wording.get('processing'), processor_module.__name__)
-			processor_module.process_video(state_manager.get_item('source_paths'), temp_frame_paths)
-			logger.debug('Completed video processor: ' + processor_module.__name__, __name__)
-			processor_module.post_process()
-			logger.debug('Post-processed video: ' + processor_module.__name__, __name__)
-		if is_process_stopping():
-			logger.debug('Process stopping during video processing', __name__)
-			return 4
-	else:
-		logger.error(wording.get('temp_frames_not_found'), __name__)
-		logger.debug('No temp frames found for video processing', __name__)
+	output_path = state_manager.get_item('output_path')
+	error_code = restore_video_audio(target_path, output_path, trim_frame_start, trim_frame_end)
+
+	if error_code:
 		process_manager.end()
-		return 1
+		return error_code
+
+	logger.debug(wording.get('clearing_temp'), __name__)
+	clear_temp_directory(target_path)
 
-	logger.debug('Starting video merging', __name__)
-	logger.info(wording.get('merging_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
-	if merge_video(target_path, temp_video_fps, state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
-		logger.debug(wording.get('merging_video_succeed'), __name__)
+	logger.debug('Checking final output video: ' + str(output_path), __name__)
+	if is_video(output_path):
+		seconds = '{:.2f}'.format((time() - start_time))
+		logger.info(wording.get('processing_video_succeed').format(seconds = seconds), __name__)
+		logger.debug('Video processing completed successfully', __name__)
+		instrumentation.render_stage_metrics()
+		instrumentation.write_trace_events()
 	else:
-		if is_process_stopping():
-			logger.debug('Process stopping during video merging', __name__)
-			process_manager.end()
-			return 4
-		logger.error(wording.get('merging_video_failed'), __name__)
-		logger.debug('Video merging failed', __name__)
+		logger.error(wording.get('processing_video_failed'), __name__)
+		logger.debug('Video processing failed - output file not found', __name__)
 		process_manager.end()
 		return 1
+	process_manager.end()
+	logger.debug('process_video completed with success', __name__)
+	return 0
 
-	output_path = state_manager.get_item('output_path')
+
+def restore_video_audio(target_path : str, output_path : str, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
 	output_audio_volume = state_manager.get_item('output_audio_volume')
 	logger.debug('Audio volume: ' + str(output_audio_volume), __name__)
 
@@ -589,7 +791,6 @@ def process_video(start_time : float) -> ErrorCode:
 				video_manager.clear_video_pool()
 				if is_process_stopping():
 					logger.debug('Process stopping during audio replacement', __name__)
-					process_manager.end()
 					return 4
 				logger.warn(wording.get('replacing_audio_skipped'), __name__)
 				logger.debug('Audio replacement failed, moving temp file', __name__)
@@ -603,30 +804,70 @@ def process_video(start_time : float) -> ErrorCode:
 				video_manager.clear_video_pool()
 				if is_process_stopping():
 					logger.debug('Process stopping during audio restoration', __name__)
-					process_manager.end()
 					return 4
 				logger.warn(wording.get('restoring_audio_skipped'), __name__)
 				logger.debug('Audio restoration failed, moving temp file', __name__)
 				move_temp_file(target_path, output_path)
+	return 0
+
+
+def index_video(start_time : float, target_path : str, face_index_path : str, temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> ErrorCode:
+	face_set : FaceIndexSet = {}
+
+	logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+	if extract_frames(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+		logger.debug(wording.get('extracting_frames_succeed'), __name__)
+	else:
+		if is_process_stopping():
+			process_manager.end()
+			return 4
+		logger.error(wording.get('extracting_frames_failed'), __name__)
+		process_manager.end()
+		return 1
+
+	temp_frame_paths = resolve_temp_frame_paths(target_path)
+	if temp_frame_paths:
+		multi_thread_frames(state_manager.get_item('source_paths'), temp_frame_paths, partial(process_index_frames, face_set))
+		if is_process_stopping():
+			return 4
+	else:
+		logger.error(wording.get('temp_frames_not_found'), __name__)
+		process_manager.end()
+		return 1
 
 	logger.debug(wording.get('clearing_temp'), __name__)
 	clear_temp_directory(target_path)
 
-	logger.debug('Checking final output video: ' + str(output_path), __name__)
-	if is_video(output_path):
+	if save_face_index(face_index_path, face_set):
 		seconds = '{:.2f}'.format((time() - start_time))
-		logger.info(wording.get('processing_video_succeed').format(seconds = seconds), __name__)
-		logger.debug('Video processing completed successfully', __name__)
+		logger.info(wording.get('indexing_faces_succeed').format(seconds = seconds), __name__)
 	else:
-		logger.error(wording.get('processing_video_failed'), __name__)
-		logger.debug('Video processing failed - output file not found', __name__)
+		logger.error(wording.get('indexing_faces_failed'), __name__)
 		process_manager.end()
 		return 1
 	process_manager.end()
-	logger.debug('process_video completed with success', __name__)
 	return 0
 
 
+def stream_video(target_path : str, temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
+	output_video_resolution = state_manager.get_item('output_video_resolution')
+	output_video_fps = state_manager.get_item('output_video_fps')
+	stream_frame_total = predict_video_frame_total(target_path, temp_video_fps, trim_frame_start, trim_frame_end)
+	frame_reader = open_frame_reader(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+	frame_writer = open_frame_writer(target_path, temp_video_fps, output_video_resolution, output_video_fps)
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = get_average_face(get_source_faces(state_manager.get_item('source_paths')))
+	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	logger.debug('Streaming frames with processors: ' + str(state_manager.get_item('processors')), __name__)
+
+	is_streamed = multi_stream_frames(frame_reader, frame_writer, unpack_resolution(temp_video_resolution), unpack_resolution(output_video_resolution), stream_frame_total, partial(process_vision_frame, processor_modules, reference_faces, source_face, source_audio_path, temp_video_fps))
+
+	for processor_module in processor_modules:
+		processor_module.post_process()
+	return is_streamed
+
+
 def is_process_stopping() -> bool:
 	if process_manager.is_stopping():
 		logger.debug('Process is stopping, ending process manager', __name__)
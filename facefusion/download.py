@@ -1,7 +1,7 @@
 import os
 import subprocess
 from functools import lru_cache
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from tqdm import tqdm
@@ -12,6 +12,8 @@ from facefusion.filesystem import get_file_name, get_file_size, is_file, remove_
 from facefusion.hash_helper import validate_hash
 from facefusion.types import Commands, DownloadProvider, DownloadSet
 
+VALIDATED_SOURCE_SET : Dict[str, Tuple[int, int]] = {}
+
 
 def open_curl(commands : Commands) -> subprocess.Popen[bytes]:
 	commands = curl_builder.run(commands)
@@ -145,7 +147,7 @@ def validate_source_paths(source_paths : List[str]) -> Tuple[List[str], List[str
 	invalid_source_paths = []
 
 	for source_path in source_paths:
-		if validate_hash(source_path):
+		if validate_source_path(source_path):
 			valid_source_paths.append(source_path)
 		else:
 			invalid_source_paths.append(source_path)
@@ -153,6 +155,19 @@ def validate_source_paths(source_paths : List[str]) -> Tuple[List[str], List[str
 	return valid_source_paths, invalid_source_paths
 
 
+def validate_source_path(source_path : str) -> bool:
+	if is_file(source_path):
+		source_stat = os.stat(source_path)
+		source_signature = (source_stat.st_size, source_stat.st_mtime_ns)
+
+		if VALIDATED_SOURCE_SET.get(source_path) == source_signature:
+			return True
+		if validate_hash(source_path):
+			VALIDATED_SOURCE_SET[source_path] = source_signature
+			return True
+	return False
+
+
 def resolve_download_url(base_name : str, file_name : str) -> Optional[str]:
 	download_providers = state_manager.get_item('download_providers')
 
@@ -4,10 +4,10 @@ import xml.etree.ElementTree as ElementTree
 from functools import lru_cache
 from typing import List, Optional
 
-from onnxruntime import get_available_providers, set_default_logger_severity
+from onnxruntime import ExecutionMode, GraphOptimizationLevel, SessionOptions, get_available_providers, set_default_logger_severity
 
 import facefusion.choices
-from facefusion.types import ExecutionDevice, ExecutionProvider, InferenceSessionProvider, ValueAndUnit
+from facefusion.types import ExecutionDevice, ExecutionProvider, InferenceSessionConfig, InferenceSessionProvider, ValueAndUnit
 
 set_default_logger_severity(3)
 
@@ -72,6 +72,23 @@ def create_inference_session_providers(execution_device_id : str, execution_prov
 	return inference_session_providers
 
 
+def create_inference_session_options(inference_session_config : InferenceSessionConfig) -> SessionOptions:
+	inference_session_options = SessionOptions()
+	inference_session_options.intra_op_num_threads = inference_session_config.get('intra_op_thread_count')
+	inference_session_options.inter_op_num_threads = inference_session_config.get('inter_op_thread_count')
+	inference_session_options.enable_cpu_mem_arena = inference_session_config.get('memory_arena') == 'enabled'
+
+	if inference_session_config.get('session_mode') == 'parallel':
+		inference_session_options.execution_mode = ExecutionMode.ORT_PARALLEL
+	if inference_session_config.get('graph_optimization') == 'disabled':
+		inference_session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+	if inference_session_config.get('graph_optimization') == 'basic':
+		inference_session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_BASIC
+	if inference_session_config.get('graph_optimization') == 'extended':
+		inference_session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+	return inference_session_options
+
+
 def resolve_cudnn_conv_algo_search() -> str:
 	execution_devices = detect_static_execution_devices()
 	product_names = ('GeForce GTX 1630', 'GeForce GTX 1650', 'GeForce GTX 1660')
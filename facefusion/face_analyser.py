@@ -2,6 +2,7 @@ from typing import List, Optional
 
 import numpy
 
+import facefusion.choices
 from facefusion import state_manager
 from facefusion.common_helper import get_first
 from facefusion.face_classifier import classify_face
@@ -9,8 +10,9 @@ from facefusion.face_detector import detect_faces, detect_rotated_faces
 from facefusion.face_helper import apply_nms, convert_to_face_landmark_5, estimate_face_angle, get_nms_threshold
 from facefusion.face_landmarker import detect_face_landmark, estimate_face_landmark_68_5
 from facefusion.face_recognizer import calc_embedding
-from facefusion.face_store import get_static_faces, set_static_faces
-from facefusion.types import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame
+from facefusion.face_store import create_frame_key, get_index_faces, get_static_faces, set_static_faces
+from facefusion.face_tracker import track_faces, update_face_tracker
+from facefusion.types import BoundingBox, Face, FaceAttribute, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame
 
 
 def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_scores : List[Score], face_landmarks_5 : List[FaceLandmark5]) -> List[Face]:
@@ -45,22 +47,64 @@ def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox],
 			'detector': face_score,
 			'landmarker': face_landmark_score_68
 		}
-		embedding, normed_embedding = calc_embedding(vision_frame, face_landmark_set.get('5/68'))
-		gender, age, race = classify_face(vision_frame, face_landmark_set.get('5/68'))
 		faces.append(Face(
 			bounding_box = bounding_box,
 			score_set = face_score_set,
 			landmark_set = face_landmark_set,
 			angle = face_angle,
-			embedding = embedding,
-			normed_embedding = normed_embedding,
-			gender = gender,
-			age = age,
-			race = race
+			embedding = None,
+			normed_embedding = None,
+			gender = None,
+			age = None,
+			race = None,
+			track_id = None
 		))
 	return faces
 
 
+def complete_faces(vision_frame : VisionFrame, faces : List[Face], face_attributes : List[FaceAttribute]) -> List[Face]:
+	complete_faces = []
+
+	for face in faces:
+		if 'embedding' in face_attributes and face.embedding is None:
+			embedding, normed_embedding = calc_embedding(vision_frame, face.landmark_set.get('5/68'))
+			face = face._replace(embedding = embedding, normed_embedding = normed_embedding)
+		if set(face_attributes) & { 'gender', 'age', 'race' } and face.gender is None:
+			gender, age, race = classify_face(vision_frame, face.landmark_set.get('5/68'))
+			face = face._replace(gender = gender, age = age, race = race)
+		complete_faces.append(face)
+	return complete_faces
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	demanded_face_attributes = state_manager.get_item('demanded_face_attributes')
+
+	if demanded_face_attributes is None:
+		demanded_face_attributes = collect_demanded_face_attributes()
+	return demanded_face_attributes
+
+
+def collect_demanded_face_attributes() -> List[FaceAttribute]:
+	from facefusion.processors.core import get_processors_modules
+
+	if state_manager.get_item('face_index_only') or state_manager.get_item('processors') is None:
+		return facefusion.choices.face_attributes
+
+	face_attributes : List[FaceAttribute] = []
+
+	if state_manager.get_item('face_selector_mode') == 'reference':
+		face_attributes.append('embedding')
+	if state_manager.get_item('face_selector_gender'):
+		face_attributes.append('gender')
+	if state_manager.get_item('face_selector_age_start') or state_manager.get_item('face_selector_age_end'):
+		face_attributes.append('age')
+	if state_manager.get_item('face_selector_race'):
+		face_attributes.append('race')
+	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+		face_attributes.extend(processor_module.get_demanded_face_attributes())
+	return face_attributes
+
+
 def get_one_face(faces : List[Face], position : int = 0) -> Optional[Face]:
 	if faces:
 		position = min(position, len(faces) - 1)
@@ -84,41 +128,78 @@ def get_average_face(faces : List[Face]) -> Optional[Face]:
 			score_set = first_face.score_set,
 			landmark_set = first_face.landmark_set,
 			angle = first_face.angle,
-			embedding = numpy.mean(embeddings, axis = 0),
-			normed_embedding = numpy.mean(normed_embeddings, axis = 0),
+			embedding = numpy.mean(embeddings, axis = 0) if first_face.embedding is not None else None,
+			normed_embedding = numpy.mean(normed_embeddings, axis = 0) if first_face.normed_embedding is not None else None,
 			gender = first_face.gender,
 			age = first_face.age,
-			race = first_face.race
+			race = first_face.race,
+			track_id = first_face.track_id
 		)
 	return None
 
 
-def get_many_faces(vision_frames : List[VisionFrame]) -> List[Face]:
+def get_many_faces(vision_frames : List[VisionFrame], face_attributes : Optional[List[FaceAttribute]] = None) -> List[Face]:
 	many_faces : List[Face] = []
 
+	if face_attributes is None:
+		face_attributes = get_demanded_face_attributes()
+
 	for vision_frame in vision_frames:
 		if numpy.any(vision_frame):
-			static_faces = get_static_faces(vision_frame)
-			if static_faces:
+			frame_key = create_frame_key(vision_frame)
+			static_faces = get_static_faces(frame_key)
+			if static_faces is not None:
+				static_faces = complete_faces(vision_frame, static_faces, face_attributes)
 				many_faces.extend(static_faces)
+				set_static_faces(frame_key, static_faces)
 			else:
-				all_bounding_boxes = []
-				all_face_scores = []
-				all_face_landmarks_5 = []
-
-				for face_detector_angle in state_manager.get_item('face_detector_angles'):
-					if face_detector_angle == 0:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_faces(vision_frame)
-					else:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_rotated_faces(vision_frame, face_detector_angle)
-					all_bounding_boxes.extend(bounding_boxes)
-					all_face_scores.extend(face_scores)
-					all_face_landmarks_5.extend(face_landmarks_5)
-
-				if all_bounding_boxes and all_face_scores and all_face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
-					faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
-
-					if faces:
-						many_faces.extend(faces)
-						set_static_faces(vision_frame, faces)
+				faces = detect_many_faces(vision_frame)
+				if faces:
+					faces = complete_faces(vision_frame, faces, face_attributes)
+					many_faces.extend(faces)
+					set_static_faces(frame_key, faces)
 	return many_faces
+
+
+def get_frame_faces(vision_frame : VisionFrame, frame_number : Optional[int]) -> List[Face]:
+	if frame_number is None:
+		return get_many_faces([ vision_frame ])
+
+	face_attributes = get_demanded_face_attributes()
+	index_faces = get_index_faces(frame_number)
+
+	if index_faces is not None:
+		return complete_faces(vision_frame, index_faces, face_attributes)
+	if numpy.any(vision_frame):
+		frame_key = create_frame_key(vision_frame)
+		faces = get_static_faces(frame_key)
+
+		if faces is None:
+			faces = track_faces(vision_frame, frame_number)
+		if faces is None:
+			faces = update_face_tracker(vision_frame, frame_number, detect_many_faces(vision_frame))
+		faces = complete_faces(vision_frame, faces, face_attributes)
+		if faces:
+			set_static_faces(frame_key, faces)
+		return faces
+	return []
+
+
+def detect_many_faces(vision_frame : VisionFrame) -> List[Face]:
+	all_bounding_boxes = []
+	all_face_scores = []
+	all_face_landmarks_5 = []
+	faces = []
+
+	for face_detector_angle in state_manager.get_item('face_detector_angles'):
+		if face_detector_angle == 0:
+			bounding_boxes, face_scores, face_landmarks_5 = detect_faces(vision_frame)
+		else:
+			bounding_boxes, face_scores, face_landmarks_5 = detect_rotated_faces(vision_frame, face_detector_angle)
+		all_bounding_boxes.extend(bounding_boxes)
+		all_face_scores.extend(face_scores)
+		all_face_landmarks_5.extend(face_landmarks_5)
+
+	if all_bounding_boxes and all_face_scores and all_face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
+		faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
+	return faces
@@ -7,7 +7,7 @@ from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.instrumentation import instrument
 from facefusion.types import Age, DownloadScope, FaceLandmark5, Gender, InferencePool, ModelOptions, ModelSet, Race, VisionFrame
 
 
@@ -53,6 +53,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return list(get_model_options().get('sources').keys())
+
+
 def get_model_options() -> ModelOptions:
 	return create_static_model_set('full').get('fairface')
 
@@ -82,14 +86,14 @@ def classify_face(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmar
 	return gender, age, race
 
 
+@instrument('face_classifier.forward')
 def forward(crop_vision_frame : VisionFrame) -> Tuple[List[int], List[int], List[int]]:
 	face_classifier = get_inference_pool().get('face_classifier')
 
-	with conditional_thread_semaphore():
-		race_id, gender_id, age_id = face_classifier.run(None,
-		{
-			'input': crop_vision_frame
-		})
+	race_id, gender_id, age_id = inference_manager.run_inference(face_classifier,
+	{
+		'input': crop_vision_frame
+	})
 
 	return gender_id, age_id, race_id
 
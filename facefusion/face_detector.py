@@ -8,6 +8,7 @@ from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import create_rotated_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_box, transform_bounding_box, transform_points
 from facefusion.filesystem import resolve_relative_path
+from facefusion.instrumentation import instrument
 from facefusion.thread_helper import thread_semaphore
 from facefusion.types import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferencePool, ModelSet, Score, VisionFrame
 from facefusion.vision import restrict_frame, unpack_resolution
@@ -271,6 +272,7 @@ def detect_with_yolo_face(vision_frame : VisionFrame, face_detector_size : str)
 	return bounding_boxes, face_scores, face_landmarks_5
 
 
+@instrument('face_detector.forward_with_retinaface')
 def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('retinaface')
 
@@ -283,6 +285,7 @@ def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
 	return detection
 
 
+@instrument('face_detector.forward_with_scrfd')
 def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('scrfd')
 
@@ -295,6 +298,7 @@ def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
 	return detection
 
 
+@instrument('face_detector.forward_with_yolo_face')
 def forward_with_yolo_face(detect_vision_frame : VisionFrame) -> Detection:
 	face_detector = get_inference_pool().get('yolo_face')
 
@@ -0,0 +1,146 @@
+import os
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy
+from numpy.typing import NDArray
+
+from facefusion import process_manager, state_manager
+from facefusion.face_analyser import get_frame_faces
+from facefusion.filesystem import create_directory, is_file
+from facefusion.hash_helper import create_hash
+from facefusion.jobs import job_manager
+from facefusion.types import Face, FaceIndex, FaceIndexSet, Fps, QueuePayload, UpdateProgress
+from facefusion.vision import read_image
+
+
+def get_face_index_directory_path() -> str:
+	if job_manager.JOBS_PATH:
+		return os.path.join(job_manager.JOBS_PATH, 'face_index')
+	return os.path.join(state_manager.get_item('temp_path'), 'facefusion', 'face_index')
+
+
+def get_face_index_path(target_path : str, temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> Optional[str]:
+	target_hash = create_target_hash(target_path)
+
+	if target_hash:
+		face_index_keys =\
+		[
+			trim_frame_start,
+			trim_frame_end,
+			temp_video_resolution,
+			temp_video_fps,
+			state_manager.get_item('temp_frame_format'),
+			state_manager.get_item('face_detector_model'),
+			state_manager.get_item('face_detector_size'),
+			state_manager.get_item('face_detector_angles'),
+			state_manager.get_item('face_detector_score'),
+			state_manager.get_item('face_landmarker_model'),
+			state_manager.get_item('face_landmarker_score')
+		]
+		face_index_hash = create_hash(str(face_index_keys).encode())
+		return os.path.join(get_face_index_directory_path(), target_hash + '-' + face_index_hash + '.npz')
+	return None
+
+
+def create_target_hash(target_path : str) -> Optional[str]:
+	if is_file(target_path):
+		target_stat = os.stat(target_path)
+		target_keys =\
+		[
+			os.path.abspath(target_path),
+			target_stat.st_size,
+			target_stat.st_mtime_ns
+		]
+		return create_hash(str(target_keys).encode())
+	return None
+
+
+def load_face_index(face_index_path : str) -> FaceIndexSet:
+	face_set : FaceIndexSet = {}
+
+	if is_file(face_index_path):
+		with numpy.load(face_index_path) as face_index_file:
+			face_index : FaceIndex = dict(face_index_file)
+		face_offsets = face_index.get('face_offsets')
+
+		for index, frame_number in enumerate(face_index.get('frame_numbers')):
+			face_set[int(frame_number)] = [ create_index_face(face_index, face_offset) for face_offset in range(face_offsets[index], face_offsets[index + 1]) ]
+	return face_set
+
+
+def save_face_index(face_index_path : str, face_set : FaceIndexSet) -> bool:
+	frame_numbers = []
+	face_offsets = [ 0 ]
+	faces : List[Face] = []
+
+	for frame_number, frame_faces in sorted(face_set.items()):
+		frame_numbers.append(frame_number)
+		faces.extend(frame_faces)
+		face_offsets.append(len(faces))
+
+	if face_index_path and create_directory(os.path.dirname(face_index_path)):
+		temp_face_index_path = face_index_path + '.tmp'
+		face_index : FaceIndex =\
+		{
+			'frame_numbers': numpy.array(frame_numbers, dtype = numpy.int64),
+			'face_offsets': numpy.array(face_offsets, dtype = numpy.int64),
+			'bounding_boxes': stack_face_values([ face.bounding_box for face in faces ], (4,)),
+			'detector_scores': numpy.array([ face.score_set.get('detector') for face in faces ], dtype = numpy.float32),
+			'landmarker_scores': numpy.array([ face.score_set.get('landmarker') for face in faces ], dtype = numpy.float32),
+			'face_landmarks_5': stack_face_values([ face.landmark_set.get('5') for face in faces ], (5, 2)),
+			'face_landmarks_5_68': stack_face_values([ face.landmark_set.get('5/68') for face in faces ], (5, 2)),
+			'face_landmarks_68': stack_face_values([ face.landmark_set.get('68') for face in faces ], (68, 2)),
+			'face_landmarks_68_5': stack_face_values([ face.landmark_set.get('68/5') for face in faces ], (68, 2)),
+			'angles': numpy.array([ face.angle for face in faces ], dtype = numpy.int16),
+			'embeddings': stack_face_values([ face.embedding for face in faces ], (512,)),
+			'normed_embeddings': stack_face_values([ face.normed_embedding for face in faces ], (512,)),
+			'genders': numpy.array([ face.gender for face in faces ], dtype = str),
+			'ages': numpy.array([ (face.age.start, face.age.stop) for face in faces ], dtype = numpy.int16).reshape(-1, 2),
+			'races': numpy.array([ face.race for face in faces ], dtype = str),
+			'track_ids': numpy.array([ -1 if face.track_id is None else face.track_id for face in faces ], dtype = numpy.int64)
+		}
+
+		with open(temp_face_index_path, 'wb') as face_index_file:
+			numpy.savez(face_index_file, allow_pickle = False, **face_index)
+		os.replace(temp_face_index_path, face_index_path)
+		return is_file(face_index_path)
+	return False
+
+
+def stack_face_values(face_values : List[NDArray[Any]], face_value_shape : Tuple[int, ...]) -> NDArray[Any]:
+	return numpy.array(face_values, dtype = numpy.float32).reshape((len(face_values),) + face_value_shape)
+
+
+def create_index_face(face_index : FaceIndex, face_offset : int) -> Face:
+	age_start, age_stop = face_index.get('ages')[face_offset]
+	track_id = int(face_index.get('track_ids')[face_offset])
+
+	return Face(
+		bounding_box = face_index.get('bounding_boxes')[face_offset],
+		score_set =
+		{
+			'detector': float(face_index.get('detector_scores')[face_offset]),
+			'landmarker': float(face_index.get('landmarker_scores')[face_offset])
+		},
+		landmark_set =
+		{
+			'5': face_index.get('face_landmarks_5')[face_offset],
+			'5/68': face_index.get('face_landmarks_5_68')[face_offset],
+			'68': face_index.get('face_landmarks_68')[face_offset],
+			'68/5': face_index.get('face_landmarks_68_5')[face_offset]
+		},
+		angle = int(face_index.get('angles')[face_offset]),
+		embedding = face_index.get('embeddings')[face_offset],
+		normed_embedding = face_index.get('normed_embeddings')[face_offset],
+		gender = str(face_index.get('genders')[face_offset]),
+		age = range(int(age_start), int(age_stop)),
+		race = str(face_index.get('races')[face_offset]),
+		track_id = None if track_id < 0 else track_id
+	)
+
+
+def process_index_frames(face_set : FaceIndexSet, source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
+	for queue_payload in process_manager.manage(queue_payloads):
+		vision_frame = read_image(queue_payload.get('frame_path'))
+		face_set[queue_payload.get('frame_number')] = get_frame_faces(vision_frame, queue_payload.get('frame_number'))
+		update_progress(1)
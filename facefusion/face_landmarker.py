@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import cv2
 import numpy
@@ -8,7 +8,7 @@ from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import create_rotated_matrix_and_size, estimate_matrix_by_face_landmark_5, transform_points, warp_face_by_translation
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.instrumentation import instrument
 from facefusion.types import Angle, BoundingBox, DownloadScope, DownloadSet, FaceLandmark5, FaceLandmark68, InferencePool, ModelSet, Prediction, Score, VisionFrame
 
 
@@ -90,6 +90,11 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	_, model_source_set = collect_model_downloads()
+	return list(model_source_set.keys())
+
+
 def collect_model_downloads() -> Tuple[DownloadSet, DownloadSet]:
 	model_set = create_static_model_set('full')
 	model_hash_set =\
@@ -186,37 +191,37 @@ def estimate_face_landmark_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark
 	return face_landmark_68_5
 
 
+@instrument('face_landmarker.forward_with_2dfan4')
 def forward_with_2dfan4(crop_vision_frame : VisionFrame) -> Tuple[Prediction, Prediction]:
 	face_landmarker = get_inference_pool().get('2dfan4')
 
-	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
-		{
-			'input': [ crop_vision_frame ]
-		})
+	face_landmark_68, face_heatmap = inference_manager.run_inference(face_landmarker,
+	{
+		'input': [ crop_vision_frame ]
+	})
 
-	return prediction
+	return face_landmark_68, face_heatmap
 
 
+@instrument('face_landmarker.forward_with_peppa_wutz')
 def forward_with_peppa_wutz(crop_vision_frame : VisionFrame) -> Prediction:
 	face_landmarker = get_inference_pool().get('peppa_wutz')
 
-	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
+	prediction = inference_manager.run_inference(face_landmarker,
+	{
+		'input': crop_vision_frame
+	})[0]
 
 	return prediction
 
 
+@instrument('face_landmarker.forward_fan_68_5')
 def forward_fan_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark68:
 	face_landmarker = get_inference_pool().get('fan_68_5')
 
-	with conditional_thread_semaphore():
-		face_landmark_68_5 = face_landmarker.run(None,
-		{
-			'input': [ face_landmark_5 ]
-		})[0][0]
+	face_landmark_68_5 = inference_manager.run_inference(face_landmarker,
+	{
+		'input': [ face_landmark_5 ]
+	})[0][0]
 
 	return face_landmark_68_5
@@ -8,7 +8,7 @@ import facefusion.choices
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.instrumentation import instrument
 from facefusion.types import DownloadScope, DownloadSet, FaceLandmark68, FaceMaskArea, FaceMaskRegion, InferencePool, Mask, ModelSet, Padding, VisionFrame
 
 
@@ -131,6 +131,11 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	_, model_source_set = collect_model_downloads()
+	return list(model_source_set.keys())
+
+
 def collect_model_downloads() -> Tuple[DownloadSet, DownloadSet]:
 	model_set = create_static_model_set('full')
 	model_hash_set = {}
@@ -155,6 +160,7 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hash_set) and conditional_download_sources(model_source_set)
 
 
+@instrument('box_mask')
 def create_box_mask(crop_vision_frame : VisionFrame, face_mask_blur : float, face_mask_padding : Padding) -> Mask:
 	crop_size = crop_vision_frame.shape[:2][::-1]
 	blur_amount = int(crop_size[0] * 0.5 * face_mask_blur)
@@ -170,6 +176,7 @@ def create_box_mask(crop_vision_frame : VisionFrame, face_mask_blur : float, fac
 	return box_mask
 
 
+@instrument('occlusion_mask')
 def create_occlusion_mask(crop_vision_frame : VisionFrame) -> Mask:
 	model_name = state_manager.get_item('face_occluder_model')
 	model_size = create_static_model_set('full').get(model_name).get('size')
@@ -183,6 +190,7 @@ def create_occlusion_mask(crop_vision_frame : VisionFrame) -> Mask:
 	return occlusion_mask
 
 
+@instrument('area_mask')
 def create_area_mask(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLandmark68, face_mask_areas : List[FaceMaskArea]) -> Mask:
 	crop_size = crop_vision_frame.shape[:2][::-1]
 	landmark_points = []
@@ -198,6 +206,7 @@ def create_area_mask(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLan
 	return area_mask
 
 
+@instrument('region_mask')
 def create_region_mask(crop_vision_frame : VisionFrame, face_mask_regions : List[FaceMaskRegion]) -> Mask:
 	model_name = state_manager.get_item('face_parser_model')
 	model_size = create_static_model_set('full').get(model_name).get('size')
@@ -214,27 +223,27 @@ def create_region_mask(crop_vision_frame : VisionFrame, face_mask_regions : List
 	return region_mask
 
 
+@instrument('face_masker.forward_occlude_face')
 def forward_occlude_face(prepare_vision_frame : VisionFrame) -> Mask:
 	model_name = state_manager.get_item('face_occluder_model')
 	face_occluder = get_inference_pool().get(model_name)
 
-	with conditional_thread_semaphore():
-		occlusion_mask : Mask = face_occluder.run(None,
-		{
-			'input': prepare_vision_frame
-		})[0][0]
+	occlusion_mask : Mask = inference_manager.run_inference(face_occluder,
+	{
+		'input': prepare_vision_frame
+	})[0][0]
 
 	return occlusion_mask
 
 
+@instrument('face_masker.forward_parse_face')
 def forward_parse_face(prepare_vision_frame : VisionFrame) -> Mask:
 	model_name = state_manager.get_item('face_parser_model')
 	face_parser = get_inference_pool().get(model_name)
 
-	with conditional_thread_semaphore():
-		region_mask : Mask = face_parser.run(None,
-		{
-			'input': prepare_vision_frame
-		})[0][0]
+	region_mask : Mask = inference_manager.run_inference(face_parser,
+	{
+		'input': prepare_vision_frame
+	})[0][0]
 
 	return region_mask
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy
 
@@ -7,7 +7,7 @@ from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.instrumentation import instrument
 from facefusion.types import DownloadScope, Embedding, FaceLandmark5, InferencePool, ModelOptions, ModelSet, VisionFrame
 
 
@@ -51,6 +51,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return list(get_model_options().get('sources').keys())
+
+
 def get_model_options() -> ModelOptions:
 	return create_static_model_set('full').get('arcface')
 
@@ -75,13 +79,13 @@ def calc_embedding(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandma
 	return embedding, normed_embedding
 
 
+@instrument('face_recognizer.forward')
 def forward(crop_vision_frame : VisionFrame) -> Embedding:
 	face_recognizer = get_inference_pool().get('face_recognizer')
 
-	with conditional_thread_semaphore():
-		embedding = face_recognizer.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
+	embedding = inference_manager.run_inference(face_recognizer,
+	{
+		'input': crop_vision_frame
+	})[0]
 
 	return embedding
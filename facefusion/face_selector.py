@@ -61,6 +61,8 @@ def sort_faces_by_order(faces : List[Face], order : FaceSelectorOrder) -> List[F
 		return sorted(faces, key = get_face_detector_score, reverse = True)
 	if order == 'worst-best':
 		return sorted(faces, key = get_face_detector_score)
+	if order == 'track':
+		return sorted(faces, key = get_face_track_id)
 	return faces
 
 
@@ -80,6 +82,12 @@ def get_face_detector_score(face : Face) -> Score:
 	return face.score_set.get('detector')
 
 
+def get_face_track_id(face : Face) -> int:
+	if face.track_id is None:
+		return -1
+	return face.track_id
+
+
 def filter_faces_by_gender(faces : List[Face], gender : Gender) -> List[Face]:
 	filter_faces = []
 
@@ -1,11 +1,22 @@
+from collections import OrderedDict
 from typing import List, Optional
 
+from facefusion import state_manager
 from facefusion.hash_helper import create_hash
-from facefusion.types import Face, FaceSet, FaceStore, VisionFrame
+from facefusion.thread_helper import thread_lock
+from facefusion.types import Face, FaceIndexSet, FaceSet, FaceStore, FaceStoreStats, VisionFrame
 
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {},
+	'static_faces': OrderedDict(),
+	'static_face_scope': None,
+	'static_face_stats':
+	{
+		'hits': 0,
+		'misses': 0,
+		'evictions': 0
+	},
+	'index_faces': {},
 	'reference_faces': {}
 }
 
@@ -14,19 +25,62 @@ def get_face_store() -> FaceStore:
 	return FACE_STORE
 
 
-def get_static_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
-	vision_hash = create_hash(vision_frame.tobytes())
-	return FACE_STORE.get('static_faces').get(vision_hash)
+def create_frame_key(vision_frame : VisionFrame) -> str:
+	return create_hash(vision_frame[::4, ::4].tobytes())
 
 
-def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	vision_hash = create_hash(vision_frame.tobytes())
-	if vision_hash:
-		FACE_STORE['static_faces'][vision_hash] = faces
+def get_static_faces(frame_key : str) -> Optional[List[Face]]:
+	with thread_lock():
+		static_faces = FACE_STORE.get('static_faces').get(frame_key)
+
+		if static_faces is not None:
+			FACE_STORE['static_faces'].move_to_end(frame_key)
+			FACE_STORE['static_face_stats']['hits'] += 1
+		else:
+			FACE_STORE['static_face_stats']['misses'] += 1
+		return static_faces
+
+
+def set_static_faces(frame_key : str, faces : List[Face]) -> None:
+	face_store_limit = state_manager.get_item('face_store_limit')
+
+	with thread_lock():
+		FACE_STORE['static_faces'][frame_key] = faces
+		FACE_STORE['static_faces'].move_to_end(frame_key)
+
+		while face_store_limit and len(FACE_STORE.get('static_faces')) > face_store_limit:
+			FACE_STORE['static_faces'].popitem(last = False)
+			FACE_STORE['static_face_stats']['evictions'] += 1
+
+
+def scope_static_faces(scope : str) -> None:
+	if FACE_STORE.get('static_face_scope') != scope:
+		clear_static_faces()
+		FACE_STORE['static_face_scope'] = scope
+
+
+def get_static_face_stats() -> FaceStoreStats:
+	return FACE_STORE.get('static_face_stats')
 
 
 def clear_static_faces() -> None:
 	FACE_STORE['static_faces'].clear()
+	FACE_STORE['index_faces'].clear()
+	FACE_STORE['static_face_scope'] = None
+	FACE_STORE['static_face_stats'] =\
+	{
+		'hits': 0,
+		'misses': 0,
+		'evictions': 0
+	}
+
+
+def get_index_faces(frame_number : int) -> Optional[List[Face]]:
+	return FACE_STORE.get('index_faces').get(frame_number)
+
+
+def set_index_faces(index_faces : FaceIndexSet) -> None:
+	FACE_STORE['index_faces'] = index_faces
 
 
 def get_reference_faces() -> Optional[FaceSet]:
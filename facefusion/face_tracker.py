@@ -0,0 +1,160 @@
+import itertools
+import threading
+from typing import Iterator, List, Optional
+
+import cv2
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_helper import convert_to_face_landmark_5, estimate_face_angle
+from facefusion.face_landmarker import detect_face_landmark, estimate_face_landmark_68_5
+from facefusion.types import BoundingBox, Face, FaceLandmark68, FaceTracker, FaceTrackerKey, FaceTrackerSet, VisionFrame
+
+FACE_TRACKER_SET : FaceTrackerSet = {}
+FACE_TRACKER_LOCK : threading.Lock = threading.Lock()
+FACE_TRACKER_LIMIT = 256
+TRACK_IDS : Iterator[int] = itertools.count()
+
+
+def get_face_tracker_key(frame_number : int) -> FaceTrackerKey:
+	return state_manager.get_item('target_path'), frame_number
+
+
+def is_face_tracking() -> bool:
+	return state_manager.get_item('face_detector_interval') > 1 or state_manager.get_item('face_selector_order') == 'track'
+
+
+def track_faces(vision_frame : VisionFrame, frame_number : int) -> Optional[List[Face]]:
+	if state_manager.get_item('face_detector_interval') == 1:
+		return None
+
+	face_tracker = pop_face_tracker(frame_number - 1)
+
+	if face_tracker and face_tracker.get('faces') and face_tracker.get('frame_count') < state_manager.get_item('face_detector_interval'):
+		scene_vision_frame = create_scene_frame(vision_frame)
+
+		if not detect_scene_change(face_tracker.get('scene_vision_frame'), scene_vision_frame):
+			tracked_faces = []
+
+			for face in face_tracker.get('faces'):
+				tracked_face = track_face(vision_frame, face)
+				if not tracked_face:
+					return None
+				tracked_faces.append(tracked_face)
+
+			set_face_tracker(frame_number,
+			{
+				'scene_vision_frame': scene_vision_frame,
+				'faces': tracked_faces,
+				'frame_count': face_tracker.get('frame_count') + 1
+			})
+			return tracked_faces
+	return None
+
+
+def track_face(vision_frame : VisionFrame, face : Face) -> Optional[Face]:
+	face_landmark_68, face_landmark_score_68 = detect_face_landmark(vision_frame, face.bounding_box, face.angle)
+
+	if face_landmark_score_68 > state_manager.get_item('face_landmarker_score'):
+		face_landmark_5_68 = convert_to_face_landmark_5(face_landmark_68)
+		face_landmark_68_5 = estimate_face_landmark_68_5(face_landmark_5_68)
+
+		return face._replace(
+			bounding_box = move_bounding_box(face.bounding_box, face.landmark_set.get('68'), face_landmark_68),
+			score_set =
+			{
+				'detector': face.score_set.get('detector'),
+				'landmarker': face_landmark_score_68
+			},
+			landmark_set =
+			{
+				'5': face_landmark_5_68,
+				'5/68': face_landmark_5_68,
+				'68': face_landmark_68,
+				'68/5': face_landmark_68_5
+			},
+			angle = estimate_face_angle(face_landmark_68_5)
+		)
+	return None
+
+
+def update_face_tracker(vision_frame : VisionFrame, frame_number : int, faces : List[Face]) -> List[Face]:
+	if not is_face_tracking():
+		return faces
+
+	face_tracker = pop_face_tracker(frame_number - 1)
+	previous_faces = face_tracker.get('faces') if face_tracker else []
+	faces = assign_track_ids(faces, previous_faces)
+
+	set_face_tracker(frame_number,
+	{
+		'scene_vision_frame': create_scene_frame(vision_frame) if state_manager.get_item('face_detector_interval') > 1 else None,
+		'faces': faces,
+		'frame_count': 1
+	})
+	return faces
+
+
+def pop_face_tracker(frame_number : int) -> Optional[FaceTracker]:
+	with FACE_TRACKER_LOCK:
+		return FACE_TRACKER_SET.pop(get_face_tracker_key(frame_number), None)
+
+
+def set_face_tracker(frame_number : int, face_tracker : FaceTracker) -> None:
+	with FACE_TRACKER_LOCK:
+		FACE_TRACKER_SET[get_face_tracker_key(frame_number)] = face_tracker
+
+		while len(FACE_TRACKER_SET) > FACE_TRACKER_LIMIT:
+			FACE_TRACKER_SET.pop(next(iter(FACE_TRACKER_SET)))
+
+
+def clear_face_trackers() -> None:
+	with FACE_TRACKER_LOCK:
+		FACE_TRACKER_SET.clear()
+
+
+def assign_track_ids(faces : List[Face], previous_faces : List[Face]) -> List[Face]:
+	track_id_faces = []
+	track_ids = []
+
+	for face in faces:
+		track_id = None
+		track_iou = 0.3
+
+		for previous_face in previous_faces:
+			previous_iou = calc_bounding_box_iou(face.bounding_box, previous_face.bounding_box)
+			if previous_iou > track_iou and previous_face.track_id not in track_ids:
+				track_id = previous_face.track_id
+				track_iou = previous_iou
+
+		if track_id is None:
+			track_id = next(TRACK_IDS)
+		track_ids.append(track_id)
+		track_id_faces.append(face._replace(track_id = track_id))
+	return track_id_faces
+
+
+def move_bounding_box(bounding_box : BoundingBox, previous_face_landmark_68 : FaceLandmark68, face_landmark_68 : FaceLandmark68) -> BoundingBox:
+	previous_face_size = numpy.ptp(previous_face_landmark_68, axis = 0).max().clip(1, None)
+	face_size = numpy.ptp(face_landmark_68, axis = 0).max()
+	face_offset = numpy.mean(face_landmark_68, axis = 0) - numpy.mean(previous_face_landmark_68, axis = 0)
+	bounding_box_center = numpy.add(bounding_box[:2], bounding_box[2:]) * 0.5 + face_offset
+	bounding_box_size = numpy.subtract(bounding_box[2:], bounding_box[:2]) * face_size / previous_face_size
+	return numpy.concatenate([ bounding_box_center - bounding_box_size * 0.5, bounding_box_center + bounding_box_size * 0.5 ])
+
+
+def calc_bounding_box_iou(bounding_box : BoundingBox, previous_bounding_box : BoundingBox) -> float:
+	x1, y1 = numpy.maximum(bounding_box[:2], previous_bounding_box[:2])
+	x2, y2 = numpy.minimum(bounding_box[2:], previous_bounding_box[2:])
+	intersection_area = max(x2 - x1, 0) * max(y2 - y1, 0)
+	union_area = numpy.prod(numpy.subtract(bounding_box[2:], bounding_box[:2])) + numpy.prod(numpy.subtract(previous_bounding_box[2:], previous_bounding_box[:2])) - intersection_area
+	return float(intersection_area / union_area) if union_area > 0 else 0.0
+
+
+def create_scene_frame(vision_frame : VisionFrame) -> VisionFrame:
+	scene_vision_frame = cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY)
+	return cv2.resize(scene_vision_frame, (64, 64), interpolation = cv2.INTER_AREA)
+
+
+def detect_scene_change(previous_scene_vision_frame : VisionFrame, scene_vision_frame : VisionFrame) -> bool:
+	return bool(numpy.mean(cv2.absdiff(previous_scene_vision_frame, scene_vision_frame)) > 30)
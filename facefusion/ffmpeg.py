@@ -10,7 +10,7 @@ import facefusion.choices
 from facefusion import ffmpeg_builder, logger, process_manager, state_manager, wording
 from facefusion.filesystem import get_file_format, remove_file
 from facefusion.temp_helper import get_temp_file_path, get_temp_frames_pattern
-from facefusion.types import AudioBuffer, AudioEncoder, Commands, EncoderSet, Fps, UpdateProgress, VideoEncoder, VideoFormat
+from facefusion.types import AudioBuffer, AudioEncoder, Commands, Duration, EncoderSet, Fps, UpdateProgress, VideoEncoder, VideoFormat
 from facefusion.vision import detect_video_duration, detect_video_fps, predict_video_frame_total
 
 
@@ -123,6 +123,33 @@ def extract_frames(target_path : str, temp_video_resolution : str, temp_video_fp
 		return process.returncode == 0
 
 
+def detect_keyframe_numbers(target_path : str) -> List[int]:
+	target_video_fps = detect_video_fps(target_path)
+	keyframe_numbers = []
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.skip_non_key_frames(),
+		ffmpeg_builder.set_input(target_path),
+		ffmpeg_builder.ignore_audio_stream(),
+		ffmpeg_builder.prevent_frame_drop(),
+		ffmpeg_builder.capture_frame_checksums(),
+		ffmpeg_builder.cast_stream()
+	)
+	process = open_ffmpeg(commands)
+	frame_checksums, _ = process.communicate()
+
+	if process.returncode == 0 and target_video_fps:
+		time_base = 1.0
+
+		for line in frame_checksums.decode().splitlines():
+			if line.startswith('#tb 0:'):
+				time_base_numerator, time_base_denominator = line.split(':')[1].strip().split('/')
+				time_base = int(time_base_numerator) / int(time_base_denominator)
+			if line and not line.startswith('#'):
+				frame_pts = int(line.split(',')[2])
+				keyframe_numbers.append(round(frame_pts * time_base * target_video_fps))
+	return keyframe_numbers
+
+
 def copy_image(target_path : str, temp_image_resolution : str) -> bool:
 	temp_image_path = get_temp_file_path(target_path)
 	commands = ffmpeg_builder.chain(
@@ -239,6 +266,52 @@ def merge_video(target_path : str, temp_video_fps : Fps, output_video_resolution
 		return process.returncode == 0
 
 
+def open_frame_reader(target_path : str, temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> subprocess.Popen[bytes]:
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.set_input(target_path),
+		ffmpeg_builder.set_media_resolution(temp_video_resolution),
+		ffmpeg_builder.select_frame_range(trim_frame_start, trim_frame_end, temp_video_fps),
+		ffmpeg_builder.prevent_frame_drop(),
+		ffmpeg_builder.pipe_video(),
+		ffmpeg_builder.cast_stream()
+	)
+	return open_ffmpeg(commands)
+
+
+def open_frame_writer(target_path : str, temp_video_fps : Fps, output_video_resolution : str, output_video_fps : Fps) -> subprocess.Popen[bytes]:
+	output_video_encoder = state_manager.get_item('output_video_encoder')
+	output_video_quality = state_manager.get_item('output_video_quality')
+	output_video_preset = state_manager.get_item('output_video_preset')
+	temp_video_path = get_temp_file_path(target_path)
+	temp_video_format = cast(VideoFormat, get_file_format(temp_video_path))
+
+	output_video_encoder = fix_video_encoder(temp_video_format, output_video_encoder)
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.pipe_video(),
+		ffmpeg_builder.set_media_resolution(output_video_resolution),
+		ffmpeg_builder.set_input_fps(temp_video_fps),
+		ffmpeg_builder.set_input('-'),
+		ffmpeg_builder.set_video_encoder(output_video_encoder),
+		ffmpeg_builder.set_video_quality(output_video_encoder, output_video_quality),
+		ffmpeg_builder.set_video_preset(output_video_encoder, output_video_preset),
+		ffmpeg_builder.set_video_fps(output_video_fps),
+		ffmpeg_builder.set_pixel_format(output_video_encoder),
+		ffmpeg_builder.set_video_colorspace('bt709'),
+		ffmpeg_builder.force_output(temp_video_path)
+	)
+	return open_ffmpeg(commands)
+
+
+def create_synthetic_video(output_path : str, output_video_resolution : str, output_video_fps : Fps, output_video_duration : Duration) -> bool:
+	commands = ffmpeg_builder.chain(
+		ffmpeg_builder.set_synthetic_input(output_video_resolution, output_video_fps),
+		ffmpeg_builder.set_video_duration(output_video_duration),
+		ffmpeg_builder.set_pixel_format('libx264'),
+		ffmpeg_builder.force_output(output_path)
+	)
+	return run_ffmpeg(commands).returncode == 0
+
+
 def concat_video(output_path : str, temp_output_paths : List[str]) -> bool:
 	concat_video_path = tempfile.mktemp()
 
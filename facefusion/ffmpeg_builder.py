@@ -32,6 +32,10 @@ def set_input(input_path : str) -> Commands:
 	return [ '-i', input_path ]
 
 
+def set_synthetic_input(video_resolution : str, video_fps : Fps) -> Commands:
+	return [ '-f', 'lavfi', '-i', 'testsrc2=size=' + video_resolution + ':rate=' + str(video_fps) ]
+
+
 def set_input_fps(input_fps : Fps) -> Commands:
 	return [ '-r', str(input_fps)]
 
@@ -88,6 +92,14 @@ def prevent_frame_drop() -> Commands:
 	return [ '-vsync', '0' ]
 
 
+def skip_non_key_frames() -> Commands:
+	return [ '-skip_frame', 'nokey' ]
+
+
+def capture_frame_checksums() -> Commands:
+	return [ '-f', 'framecrc' ]
+
+
 def select_media_range(frame_start : int, frame_end : int, media_fps : Fps) -> Commands:
 	commands = []
 
@@ -216,10 +228,18 @@ def capture_video() -> Commands:
 	return [ '-f', 'rawvideo', '-pix_fmt', 'rgb24' ]
 
 
+def pipe_video() -> Commands:
+	return [ '-f', 'rawvideo', '-pix_fmt', 'bgr24' ]
+
+
 def ignore_video_stream() -> Commands:
 	return [ '-vn' ]
 
 
+def ignore_audio_stream() -> Commands:
+	return [ '-an' ]
+
+
 def map_nvenc_preset(video_preset : VideoPreset) -> Optional[str]:
 	if video_preset in [ 'ultrafast', 'superfast', 'veryfast', 'faster', 'fast' ]:
 		return 'fast'
@@ -0,0 +1,115 @@
+import json
+import os
+import struct
+from typing import Iterable, Iterator
+
+import cv2
+
+from facefusion import process_manager, state_manager
+from facefusion.filesystem import get_file_extension, is_file
+from facefusion.hash_helper import create_hash
+from facefusion.jobs import job_store
+from facefusion.types import FrameJournal, QueuePayload, VisionFrame
+
+FRAME_JOURNAL : FrameJournal =\
+{
+	'journal_path': None,
+	'journal_pass': 0,
+	'journal_records': set()
+}
+FRAME_JOURNAL_FORMAT = '<II'
+
+
+def get_frame_journal() -> FrameJournal:
+	return FRAME_JOURNAL
+
+
+def init_frame_journal(frame_journal : FrameJournal) -> None:
+	FRAME_JOURNAL['journal_path'] = frame_journal.get('journal_path')
+	FRAME_JOURNAL['journal_pass'] = frame_journal.get('journal_pass')
+	FRAME_JOURNAL['journal_records'] = frame_journal.get('journal_records')
+
+
+def create_frame_journal_key() -> str:
+	step_args = { step_key: state_manager.get_item(step_key) for step_key in job_store.get_step_keys() } #type:ignore[arg-type]
+	return create_hash(json.dumps(step_args, sort_keys = True, default = str).encode())
+
+
+def create_frame_journal(journal_path : str) -> bool:
+	with open(journal_path, 'wb'):
+		pass
+	return is_file(journal_path)
+
+
+def open_frame_journal(journal_path : str) -> bool:
+	if is_file(journal_path):
+		with open(journal_path, 'rb') as journal_file:
+			journal_content = journal_file.read()
+
+		record_size = struct.calcsize(FRAME_JOURNAL_FORMAT)
+		journal_content = journal_content[:len(journal_content) - len(journal_content) % record_size]
+		FRAME_JOURNAL['journal_path'] = journal_path
+		FRAME_JOURNAL['journal_pass'] = 0
+		FRAME_JOURNAL['journal_records'] = set(struct.iter_unpack(FRAME_JOURNAL_FORMAT, journal_content))
+		return True
+	return False
+
+
+def close_frame_journal() -> None:
+	FRAME_JOURNAL['journal_path'] = None
+	FRAME_JOURNAL['journal_pass'] = 0
+	FRAME_JOURNAL['journal_records'] = set()
+
+
+def select_frame_journal_pass(journal_pass : int) -> None:
+	FRAME_JOURNAL['journal_pass'] = journal_pass
+
+
+def count_frame_journal(journal_pass : int) -> int:
+	return sum(journal_record[0] == journal_pass for journal_record in FRAME_JOURNAL.get('journal_records'))
+
+
+def is_frame_journaled(frame_number : int) -> bool:
+	return (FRAME_JOURNAL.get('journal_pass'), frame_number) in FRAME_JOURNAL.get('journal_records')
+
+
+def append_frame_journal(frame_number : int) -> None:
+	journal_path = FRAME_JOURNAL.get('journal_path')
+
+	if journal_path:
+		with open(journal_path, 'ab') as journal_file:
+			journal_file.write(struct.pack(FRAME_JOURNAL_FORMAT, FRAME_JOURNAL.get('journal_pass'), frame_number))
+
+
+def get_journal_frame_path(frame_path : str) -> str:
+	return frame_path + '.' + str(FRAME_JOURNAL.get('journal_pass')) + '.tmp'
+
+
+def write_journal_frame(queue_payload : QueuePayload, vision_frame : VisionFrame) -> bool:
+	frame_path = queue_payload.get('frame_path')
+	journal_frame_path = get_journal_frame_path(frame_path)
+	is_encoded, frame_buffer = cv2.imencode(get_file_extension(frame_path), vision_frame)
+
+	if is_encoded:
+		with open(journal_frame_path, 'wb') as journal_frame_file:
+			journal_frame_file.write(frame_buffer.tobytes())
+		append_frame_journal(queue_payload.get('frame_number'))
+		os.replace(journal_frame_path, frame_path)
+		return True
+	return False
+
+
+def restore_journal_frame(queue_payload : QueuePayload) -> bool:
+	frame_path = queue_payload.get('frame_path')
+	journal_frame_path = get_journal_frame_path(frame_path)
+
+	if is_file(journal_frame_path):
+		os.replace(journal_frame_path, frame_path)
+		return True
+	return False
+
+
+def iterate_frame_journal(queue_payloads : Iterable[QueuePayload]) -> Iterator[QueuePayload]:
+	for queue_payload in queue_payloads:
+		if process_manager.is_processing():
+			yield queue_payload
@@ -0,0 +1,68 @@
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Deque, List
+
+from facefusion.types import FrameScheduler, FrameWorkerStats, QueuePayload, ScheduleMode
+
+
+def create_frame_scheduler(queue_payloads : List[QueuePayload], worker_total : int, schedule_mode : ScheduleMode) -> FrameScheduler:
+	worker_queues = [ deque(queue_payloads) ]
+
+	if schedule_mode == 'locality':
+		range_size = -(-len(queue_payloads) // worker_total)
+		worker_queues = [ deque(queue_payloads[index * range_size:(index + 1) * range_size]) for index in range(worker_total) ]
+
+	return\
+	{
+		'lock': threading.Lock(),
+		'worker_queues': worker_queues,
+		'worker_stats': {},
+		'start_time': perf_counter()
+	}
+
+
+def claim_queue_payloads(frame_scheduler : FrameScheduler, worker_index : int, claim_size : int) -> List[QueuePayload]:
+	worker_queues = frame_scheduler.get('worker_queues')
+	worker_queue = worker_queues[worker_index % len(worker_queues)]
+	queue_payloads : List[QueuePayload] = []
+
+	with frame_scheduler.get('lock'):
+		if not worker_queue:
+			steal_queue_payloads(worker_queues, worker_queue)
+
+		while worker_queue and len(queue_payloads) < claim_size:
+			queue_payloads.append(worker_queue.popleft())
+
+	return queue_payloads
+
+
+def steal_queue_payloads(worker_queues : List[Deque[QueuePayload]], worker_queue : Deque[QueuePayload]) -> None:
+	victim_queue = max(worker_queues, key = len)
+	steal_total = -(-len(victim_queue) // 2)
+
+	for _ in range(steal_total):
+		worker_queue.appendleft(victim_queue.pop())
+
+
+def record_worker_stats(frame_scheduler : FrameScheduler, worker_id : int, frame_total : int, busy_time : float) -> None:
+	with frame_scheduler.get('lock'):
+		worker_stats = frame_scheduler.get('worker_stats').setdefault(worker_id,
+		{
+			'frame_total': 0,
+			'busy_time': 0.0,
+			'utilization': 0.0
+		})
+		worker_stats['frame_total'] += frame_total
+		worker_stats['busy_time'] += busy_time
+
+
+def finalize_worker_stats(frame_scheduler : FrameScheduler) -> List[FrameWorkerStats]:
+	elapsed_time = max(perf_counter() - frame_scheduler.get('start_time'), 1e-6)
+	worker_stats_list = []
+
+	for worker_id in sorted(frame_scheduler.get('worker_stats')):
+		worker_stats = frame_scheduler.get('worker_stats').get(worker_id)
+		worker_stats['utilization'] = round(min(worker_stats.get('busy_time') / elapsed_time, 1.0) * 100, 2)
+		worker_stats_list.append(worker_stats)
+	return worker_stats_list
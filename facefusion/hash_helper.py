@@ -1,5 +1,7 @@
+import hashlib
 import os
 import zlib
+from functools import partial
 from typing import Optional
 
 from facefusion.filesystem import get_file_name, is_file
@@ -9,6 +11,37 @@ def create_hash(content : bytes) -> str:
 	return format(zlib.crc32(content), '08x')
 
 
+def create_file_hash(file_path : str) -> Optional[str]:
+	if is_file(file_path):
+		file_crc = 0
+
+		with open(file_path, 'rb') as file:
+			for file_chunk in iter(partial(file.read, 1024 * 1024), b''):
+				file_crc = zlib.crc32(file_chunk, file_crc)
+		return format(file_crc, '08x')
+	return None
+
+
+def create_file_digest(file_path : str) -> Optional[str]:
+	if is_file(file_path):
+		file_digest = hashlib.sha256()
+
+		with open(file_path, 'rb') as file:
+			for file_chunk in iter(partial(file.read, 1024 * 1024), b''):
+				file_digest.update(file_chunk)
+		return file_digest.hexdigest()
+	return None
+
+
+def read_file_hash(file_path : str) -> Optional[str]:
+	hash_path = get_hash_path(file_path)
+
+	if is_file(hash_path):
+		with open(hash_path) as hash_file:
+			return hash_file.read()
+	return create_file_hash(file_path)
+
+
 def validate_hash(validate_path : str) -> bool:
 	hash_path = get_hash_path(validate_path)
 
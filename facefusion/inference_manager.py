@@ -1,20 +1,44 @@
 import importlib
-from time import sleep
-from typing import List
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Queue
+from time import sleep, time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from onnxruntime import InferenceSession
+import numpy
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
 
-from facefusion import process_manager, state_manager
+from facefusion import config, instrumentation, process_manager, state_manager
 from facefusion.app_context import detect_app_context
-from facefusion.execution import create_inference_session_providers
-from facefusion.filesystem import is_file
-from facefusion.types import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet
+from facefusion.execution import create_inference_session_options, create_inference_session_providers
+from facefusion.filesystem import create_directory, get_file_name, get_file_size, is_file, remove_file
+from facefusion.hash_helper import create_hash, read_file_hash
+from facefusion.thread_helper import conditional_thread_semaphore, thread_lock
+from facefusion.types import DownloadSet, ExecutionProvider, InferenceBatch, InferenceBatchSet, InferenceInputs, InferenceLockSet, InferenceMemorySet, InferenceOutputs, InferencePool, InferencePoolSet, InferenceRequest, InferenceSessionConfig, InferenceSessionPool, InferenceSessionPoolSet, InferenceSessionProvider, InferenceUsageSet
 
 INFERENCE_POOL_SET : InferencePoolSet =\
 {
 	'cli': {},
 	'ui': {}
 }
+INFERENCE_BATCH_SET : InferenceBatchSet = {}
+INFERENCE_SESSION_POOL_SET : InferenceSessionPoolSet = {}
+INFERENCE_MEMORY_SET : InferenceMemorySet = {}
+INFERENCE_USAGE_SET : InferenceUsageSet = {}
+INFERENCE_LOCK_SET : InferenceLockSet = {}
+INFERENCE_LOCK = threading.Lock()
+INFERENCE_BATCH_TIMEOUT = 120
+WARM_UP_INPUT_TYPES : Dict[str, Any] =\
+{
+	'tensor(bool)': numpy.bool_,
+	'tensor(double)': numpy.float64,
+	'tensor(float)': numpy.float32,
+	'tensor(float16)': numpy.float16,
+	'tensor(int32)': numpy.int32,
+	'tensor(int64)': numpy.int64
+}
 
 
 def get_inference_pool(module_name : str, model_names : List[str], model_source_set : DownloadSet) -> InferencePool:
@@ -25,23 +49,34 @@ def get_inference_pool(module_name : str, model_names : List[str], model_source_
 	app_context = detect_app_context()
 	inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
 
-	if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
-		INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
-	if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
-		INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
 	if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
-		INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, execution_device_id, execution_providers)
+		with get_inference_lock(inference_context):
+			if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
+				INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
+			if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
+				INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
+			if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
+				inference_session_config = resolve_inference_session_config(module_name)
+				pooled_model_names = resolve_pooled_model_names(module_name)
+				INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(inference_context, model_source_set, execution_device_id, execution_providers, inference_session_config, pooled_model_names)
 
+	INFERENCE_USAGE_SET[inference_context] = time()
 	return INFERENCE_POOL_SET.get(app_context).get(inference_context)
 
 
-def create_inference_pool(model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferencePool:
+def get_inference_lock(inference_context : str) -> threading.Lock:
+	with INFERENCE_LOCK:
+		return INFERENCE_LOCK_SET.setdefault(inference_context, threading.Lock())
+
+
+def create_inference_pool(inference_context : str, model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider], inference_session_config : InferenceSessionConfig, pooled_model_names : List[str]) -> InferencePool:
 	inference_pool : InferencePool = {}
 
 	for model_name in model_source_set.keys():
 		model_path = model_source_set.get(model_name).get('path')
 		if is_file(model_path):
-			inference_pool[model_name] = create_inference_session(model_path, execution_device_id, execution_providers)
+			inference_session_count = reserve_inference_session_count(inference_context, model_path, execution_providers, model_name in pooled_model_names)
+			inference_pool[model_name] = create_inference_session_pool(model_path, execution_device_id, execution_providers, inference_session_config, inference_session_count)
 
 	return inference_pool
 
@@ -53,12 +88,175 @@ def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 	inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
 
 	if INFERENCE_POOL_SET.get(app_context).get(inference_context):
-		del INFERENCE_POOL_SET[app_context][inference_context]
+		inference_pool = INFERENCE_POOL_SET.get(app_context).pop(inference_context)
+		release_inference_pool(inference_context, inference_pool)
+		INFERENCE_USAGE_SET.pop(inference_context, None)
+
+
+def find_inference_contexts(used_before : float) -> List[str]:
+	inference_contexts = [ inference_context for inference_context, used_time in INFERENCE_USAGE_SET.items() if used_time < used_before ]
+	return sorted(inference_contexts, key = INFERENCE_USAGE_SET.get)
+
+
+def evict_inference_context(inference_context : str) -> None:
+	for inference_pool_set in INFERENCE_POOL_SET.values():
+		if inference_pool_set.get(inference_context):
+			release_inference_pool(inference_context, inference_pool_set.pop(inference_context))
+	INFERENCE_USAGE_SET.pop(inference_context, None)
+
+
+def release_inference_pool(inference_context : str, inference_pool : InferencePool) -> None:
+	if not any(inference_pool_set.get(inference_context) for inference_pool_set in INFERENCE_POOL_SET.values()):
+		for inference_session in inference_pool.values():
+			INFERENCE_BATCH_SET.pop(id(inference_session), None)
+			INFERENCE_SESSION_POOL_SET.pop(id(inference_session), None)
+		INFERENCE_MEMORY_SET.pop(inference_context, None)
+
+
+def create_inference_session_pool(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider], inference_session_config : InferenceSessionConfig, inference_session_count : int) -> InferenceSession:
+	if inference_session_count > 1:
+		with ThreadPoolExecutor(max_workers = inference_session_count) as executor:
+			inference_sessions = list(executor.map(lambda _ : create_inference_session(model_path, execution_device_id, execution_providers, inference_session_config), range(inference_session_count)))
+
+		inference_session_pool : InferenceSessionPool =\
+		{
+			'sessions': inference_sessions,
+			'queue': Queue()
+		}
+
+		for inference_session in inference_sessions:
+			inference_session_pool.get('queue').put(inference_session)
+		INFERENCE_SESSION_POOL_SET[id(inference_sessions[0])] = inference_session_pool
+		return inference_sessions[0]
+	return create_inference_session(model_path, execution_device_id, execution_providers, inference_session_config)
+
+
+@contextmanager
+def checkout_inference_session(inference_session : InferenceSession) -> Iterator[InferenceSession]:
+	inference_session_pool = INFERENCE_SESSION_POOL_SET.get(id(inference_session))
+
+	if inference_session_pool:
+		pooled_inference_session = inference_session_pool.get('queue').get()
+
+		try:
+			yield pooled_inference_session
+		finally:
+			inference_session_pool.get('queue').put(pooled_inference_session)
+	else:
+		yield inference_session
+
+
+def get_pooled_inference_sessions(inference_session : InferenceSession) -> List[InferenceSession]:
+	inference_session_pool = INFERENCE_SESSION_POOL_SET.get(id(inference_session))
+
+	if inference_session_pool:
+		return inference_session_pool.get('sessions')
+	return [ inference_session ]
 
 
-def create_inference_session(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferenceSession:
+def reserve_inference_session_count(inference_context : str, model_path : str, execution_providers : List[ExecutionProvider], is_pooled : bool) -> int:
+	with INFERENCE_LOCK:
+		inference_session_count = resolve_inference_session_count(model_path, execution_providers) if is_pooled else 1
+		INFERENCE_MEMORY_SET[inference_context] = INFERENCE_MEMORY_SET.get(inference_context, 0) + get_file_size(model_path) * inference_session_count
+	return inference_session_count
+
+
+def resolve_inference_session_count(model_path : str, execution_providers : List[ExecutionProvider]) -> int:
+	inference_session_count = state_manager.get_item('execution_session_count') or 1
+	session_memory_limit = state_manager.get_item('session_memory_limit')
+
+	if 'coreml' in execution_providers:
+		return 1
+	if state_manager.get_item('execution_session_count') == 0 and state_manager.get_item('execution_worker_mode') == 'thread':
+		inference_session_count = state_manager.get_item('execution_thread_count')
+	if session_memory_limit:
+		session_memory_budget = session_memory_limit * 1024 ** 3 - sum(INFERENCE_MEMORY_SET.values())
+		inference_session_count = min(inference_session_count, session_memory_budget // max(get_file_size(model_path), 1))
+	return max(inference_session_count, 1)
+
+
+def create_inference_session(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider], inference_session_config : InferenceSessionConfig) -> InferenceSession:
 	inference_session_providers = create_inference_session_providers(execution_device_id, execution_providers)
-	return InferenceSession(model_path, providers = inference_session_providers)
+	inference_session_options = create_inference_session_options(inference_session_config)
+	optimized_model_path = resolve_optimized_model_path(model_path, execution_providers, inference_session_config)
+
+	if optimized_model_path:
+		inference_session = create_optimized_inference_session(model_path, optimized_model_path, inference_session_options, inference_session_providers)
+	else:
+		inference_session = InferenceSession(model_path, sess_options = inference_session_options, providers = inference_session_providers)
+	return instrumentation.instrument_inference_session(inference_session, model_path)
+
+
+def create_optimized_inference_session(model_path : str, optimized_model_path : str, inference_session_options : SessionOptions, inference_session_providers : List[InferenceSessionProvider]) -> InferenceSession:
+	temp_model_path = optimized_model_path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.tmp'
+
+	if is_file(optimized_model_path):
+		graph_optimization_level = inference_session_options.graph_optimization_level
+		inference_session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+
+		try:
+			return InferenceSession(optimized_model_path, sess_options = inference_session_options, providers = inference_session_providers)
+		except Exception:
+			remove_file(optimized_model_path)
+		inference_session_options.graph_optimization_level = graph_optimization_level
+
+	if create_directory(os.path.dirname(optimized_model_path)):
+		inference_session_options.optimized_model_filepath = temp_model_path
+	inference_session = InferenceSession(model_path, sess_options = inference_session_options, providers = inference_session_providers)
+
+	if is_file(temp_model_path):
+		os.replace(temp_model_path, optimized_model_path)
+	return inference_session
+
+
+def resolve_inference_session_config(module_name : str) -> InferenceSessionConfig:
+	inference_session_config : InferenceSessionConfig =\
+	{
+		'intra_op_thread_count': state_manager.get_item('execution_intra_op_thread_count') or 0,
+		'inter_op_thread_count': state_manager.get_item('execution_inter_op_thread_count') or 0,
+		'session_mode': state_manager.get_item('execution_session_mode') or 'sequential',
+		'graph_optimization': state_manager.get_item('execution_graph_optimization') or 'all',
+		'memory_arena': state_manager.get_item('execution_memory_arena') or 'enabled'
+	}
+
+	if state_manager.get_item('config_path'):
+		config_section = 'execution.' + module_name.split('.')[-1]
+		inference_session_config['intra_op_thread_count'] = config.get_int_value(config_section, 'execution_intra_op_thread_count', str(inference_session_config.get('intra_op_thread_count')))
+		inference_session_config['inter_op_thread_count'] = config.get_int_value(config_section, 'execution_inter_op_thread_count', str(inference_session_config.get('inter_op_thread_count')))
+		inference_session_config['session_mode'] = config.get_str_value(config_section, 'execution_session_mode', inference_session_config.get('session_mode')) #type:ignore[typeddict-item]
+		inference_session_config['graph_optimization'] = config.get_str_value(config_section, 'execution_graph_optimization', inference_session_config.get('graph_optimization')) #type:ignore[typeddict-item]
+		inference_session_config['memory_arena'] = config.get_str_value(config_section, 'execution_memory_arena', inference_session_config.get('memory_arena')) #type:ignore[typeddict-item]
+	return inference_session_config
+
+
+def resolve_optimized_model_path(model_path : str, execution_providers : List[ExecutionProvider], inference_session_config : InferenceSessionConfig) -> Optional[str]:
+	execution_graph_cache_path = state_manager.get_item('execution_graph_cache_path')
+
+	if execution_graph_cache_path and inference_session_config.get('graph_optimization') != 'disabled' and not set(execution_providers) & { 'coreml', 'openvino', 'tensorrt' }:
+		model_hash = read_file_hash(model_path)
+
+		if model_hash:
+			cache_key = create_hash('.'.join([ model_hash, inference_session_config.get('graph_optimization') ] + list(execution_providers)).encode())
+			return os.path.join(execution_graph_cache_path, get_file_name(model_path) + '.' + cache_key + '.onnx')
+	return None
+
+
+def warm_up_inference_pool(inference_pool : InferencePool) -> bool:
+	return all(warm_up_inference_session(pooled_inference_session) for inference_session in inference_pool.values() for pooled_inference_session in get_pooled_inference_sessions(inference_session))
+
+
+def warm_up_inference_session(inference_session : InferenceSession) -> bool:
+	inference_inputs = {}
+
+	for inference_input in inference_session.get_inputs():
+		input_shape = [ dimension if isinstance(dimension, int) and dimension > 0 else 1 for dimension in inference_input.shape ]
+		inference_inputs[inference_input.name] = numpy.zeros(input_shape, dtype = WARM_UP_INPUT_TYPES.get(inference_input.type, numpy.float32))
+
+	try:
+		inference_session.run(None, inference_inputs)
+		return True
+	except Exception:
+		return False
 
 
 def get_inference_context(module_name : str, model_names : List[str], execution_device_id : str, execution_providers : List[ExecutionProvider]) -> str:
@@ -72,3 +270,153 @@ def resolve_execution_providers(module_name : str) -> List[ExecutionProvider]:
 	if hasattr(module, 'resolve_execution_providers'):
 		return getattr(module, 'resolve_execution_providers')()
 	return state_manager.get_item('execution_providers')
+
+
+def resolve_pooled_model_names(module_name : str) -> List[str]:
+	module = importlib.import_module(module_name)
+
+	if hasattr(module, 'resolve_pooled_model_names'):
+		return getattr(module, 'resolve_pooled_model_names')()
+	return []
+
+
+def run_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceOutputs:
+	execution_batch_size = state_manager.get_item('execution_batch_size')
+
+	if execution_batch_size and execution_batch_size > 1:
+		return run_batch_inference(inference_session, inference_inputs, execution_batch_size)
+
+	with conditional_thread_semaphore(), checkout_inference_session(inference_session) as pooled_inference_session:
+		return pooled_inference_session.run(None, inference_inputs)
+
+
+def run_batch_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs, execution_batch_size : int) -> InferenceOutputs:
+	inference_batch = get_inference_batch(inference_session)
+	inference_condition = inference_batch.get('condition')
+	inference_request : InferenceRequest =\
+	{
+		'inputs': { input_name: numpy.asarray(input_value) for input_name, input_value in inference_inputs.items() },
+		'outputs': None,
+		'error': None,
+		'event': threading.Event()
+	}
+
+	with inference_condition:
+		inference_batch['requests'].append(inference_request)
+		inference_batch['request_total'] += 1
+		is_leader = len(inference_batch.get('requests')) == 1
+		inference_condition.notify_all()
+
+	try:
+		if is_leader:
+			forward_inference_batch(inference_session, inference_batch, inference_request, execution_batch_size)
+		elif not inference_request.get('event').wait(INFERENCE_BATCH_TIMEOUT):
+			with inference_condition:
+				is_queued = inference_request in inference_batch.get('requests')
+				if is_queued:
+					inference_batch['requests'].remove(inference_request)
+			if is_queued:
+				with conditional_thread_semaphore(), checkout_inference_session(inference_session) as pooled_inference_session:
+					return pooled_inference_session.run(None, inference_inputs)
+			raise TimeoutError
+	finally:
+		with inference_condition:
+			inference_batch['request_total'] -= 1
+
+	if inference_request.get('error'):
+		raise inference_request.get('error')
+	return inference_request.get('outputs')
+
+
+def forward_inference_batch(inference_session : InferenceSession, inference_batch : InferenceBatch, inference_request : InferenceRequest, execution_batch_size : int) -> None:
+	inference_requests = [ inference_request ]
+
+	try:
+		inference_requests = collect_inference_requests(inference_batch, execution_batch_size)
+		process_inference_requests(inference_session, inference_requests, inference_batch.get('dynamic_batch'), execution_batch_size)
+	except BaseException as exception:
+		reject_inference_requests(inference_requests, exception)
+	finally:
+		for batch_request in inference_requests:
+			batch_request.get('event').set()
+
+
+def collect_inference_requests(inference_batch : InferenceBatch, execution_batch_size : int) -> List[InferenceRequest]:
+	inference_condition = inference_batch.get('condition')
+	batch_deadline = time() + (state_manager.get_item('execution_batch_wait') or 0) / 1000
+
+	with inference_condition:
+		try:
+			while len(inference_batch.get('requests')) < min(inference_batch.get('request_total'), execution_batch_size) and batch_deadline > time():
+				inference_condition.wait(batch_deadline - time())
+		finally:
+			inference_requests = inference_batch.get('requests')
+			inference_batch['requests'] = []
+	return inference_requests
+
+
+def get_inference_batch(inference_session : InferenceSession) -> InferenceBatch:
+	with thread_lock():
+		if id(inference_session) not in INFERENCE_BATCH_SET:
+			INFERENCE_BATCH_SET[id(inference_session)] =\
+			{
+				'condition': threading.Condition(),
+				'requests': [],
+				'request_total': 0,
+				'dynamic_batch': has_dynamic_batch(inference_session)
+			}
+		return INFERENCE_BATCH_SET.get(id(inference_session))
+
+
+def has_dynamic_batch(inference_session : InferenceSession) -> bool:
+	for inference_node in inference_session.get_inputs() + inference_session.get_outputs():
+		if not inference_node.shape or isinstance(inference_node.shape[0], int):
+			return False
+	return True
+
+
+def process_inference_requests(inference_session : InferenceSession, inference_requests : List[InferenceRequest], dynamic_batch : bool, execution_batch_size : int) -> None:
+	try:
+		if dynamic_batch:
+			for batch_requests in group_inference_requests(inference_requests, execution_batch_size):
+				forward_inference_requests(inference_session, batch_requests)
+		else:
+			for inference_request in inference_requests:
+				with conditional_thread_semaphore(), checkout_inference_session(inference_session) as pooled_inference_session:
+					inference_request['outputs'] = pooled_inference_session.run(None, inference_request.get('inputs'))
+	except Exception as exception:
+		reject_inference_requests(inference_requests, exception)
+
+
+def reject_inference_requests(inference_requests : List[InferenceRequest], exception : BaseException) -> None:
+	for inference_request in inference_requests:
+		if inference_request.get('outputs') is None and inference_request.get('error') is None:
+			inference_request['error'] = exception
+
+
+def group_inference_requests(inference_requests : List[InferenceRequest], execution_batch_size : int) -> List[List[InferenceRequest]]:
+	inference_request_groups : Dict[Tuple[Tuple[str, Tuple[int, ...], str], ...], List[InferenceRequest]] = {}
+	batch_requests_list = []
+
+	for inference_request in inference_requests:
+		inference_signature = tuple((input_name, input_value.shape[1:], input_value.dtype.str) for input_name, input_value in inference_request.get('inputs').items())
+		inference_request_groups.setdefault(inference_signature, []).append(inference_request)
+
+	for inference_request_group in inference_request_groups.values():
+		for index in range(0, len(inference_request_group), execution_batch_size):
+			batch_requests_list.append(inference_request_group[index:index + execution_batch_size])
+	return batch_requests_list
+
+
+def forward_inference_requests(inference_session : InferenceSession, inference_requests : List[InferenceRequest]) -> None:
+	input_names = inference_requests[0].get('inputs').keys()
+	inference_inputs = { input_name: numpy.concatenate([ inference_request.get('inputs').get(input_name) for inference_request in inference_requests ]) for input_name in input_names }
+	batch_indices = numpy.cumsum([ next(iter(inference_request.get('inputs').values())).shape[0] for inference_request in inference_requests ])[:-1]
+
+	with conditional_thread_semaphore(), checkout_inference_session(inference_session) as pooled_inference_session:
+		inference_outputs = pooled_inference_session.run(None, inference_inputs)
+
+	batch_outputs = [ numpy.split(inference_output, batch_indices) for inference_output in inference_outputs ]
+
+	for inference_request, request_outputs in zip(inference_requests, zip(*batch_outputs)):
+		inference_request['outputs'] = list(request_outputs)
@@ -0,0 +1,170 @@
+import os
+import threading
+from array import array
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, List, Optional, TypeVar, cast
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion.cli_helper import render_table
+from facefusion.filesystem import get_file_name
+from facefusion.json import write_json
+from facefusion.types import StageMetricsSet, StageTimerSet, TraceEvent
+
+InstrumentMethod = TypeVar('InstrumentMethod', bound = Callable[..., Any])
+
+INSTRUMENTATION_ENABLED : bool = False
+STAGE_TIMING_ENABLED : bool = False
+STAGE_TIMER_SET : StageTimerSet = {}
+TRACE_PATH : Optional[str] = None
+TRACE_EVENTS : List[TraceEvent] = []
+TRACE_CONTEXT = threading.local()
+
+
+def init(instrument_stages : bool, trace_path : Optional[str] = None) -> None:
+	global INSTRUMENTATION_ENABLED, STAGE_TIMING_ENABLED, TRACE_PATH
+
+	STAGE_TIMING_ENABLED = instrument_stages
+	TRACE_PATH = trace_path
+	INSTRUMENTATION_ENABLED = STAGE_TIMING_ENABLED or bool(TRACE_PATH)
+
+
+def is_enabled() -> bool:
+	return STAGE_TIMING_ENABLED
+
+
+def is_tracing() -> bool:
+	return bool(TRACE_PATH)
+
+
+def instrument(stage : str) -> Callable[[InstrumentMethod], InstrumentMethod]:
+	def decorate(method : InstrumentMethod) -> InstrumentMethod:
+		@wraps(method)
+		def measure(*args : Any, **kwargs : Any) -> Any:
+			if not INSTRUMENTATION_ENABLED:
+				return method(*args, **kwargs)
+
+			start_time = perf_counter()
+			try:
+				return method(*args, **kwargs)
+			finally:
+				record_stage(stage, start_time, perf_counter())
+
+		return cast(InstrumentMethod, measure)
+	return decorate
+
+
+def instrument_inference_session(inference_session : InferenceSession, model_path : str) -> InferenceSession:
+	if INSTRUMENTATION_ENABLED:
+		inference_session.run = instrument('inference.' + get_file_name(model_path))(inference_session.run) #type:ignore[method-assign]
+	return inference_session
+
+
+def record_stage(stage : str, start_time : float, end_time : float) -> None:
+	if STAGE_TIMING_ENABLED:
+		record_stage_time(stage, end_time - start_time)
+	if TRACE_PATH:
+		record_trace_event(stage, start_time, end_time)
+
+
+def record_stage_time(stage : str, stage_time : float) -> None:
+	stage_timer = STAGE_TIMER_SET.get(stage)
+
+	if stage_timer is None:
+		stage_timer = STAGE_TIMER_SET.setdefault(stage, array('d'))
+	stage_timer.append(stage_time)
+
+
+def clear_stage_timers() -> None:
+	STAGE_TIMER_SET.clear()
+
+
+def clear_trace_events() -> None:
+	TRACE_EVENTS.clear()
+
+
+def set_trace_frame(frame_number : int) -> None:
+	if TRACE_PATH:
+		TRACE_CONTEXT.frame_number = frame_number
+
+
+def record_trace_event(stage : str, start_time : float, end_time : float) -> None:
+	current_thread = threading.current_thread()
+	trace_event : TraceEvent =\
+	{
+		'name': stage,
+		'cat': stage.split('.')[0],
+		'ph': 'X',
+		'ts': round(start_time * 1000000, 3),
+		'dur': round((end_time - start_time) * 1000000, 3),
+		'pid': os.getpid(),
+		'tid': current_thread.ident or 0,
+		'args':
+		{
+			'thread_name': current_thread.name,
+			'frame_number': getattr(TRACE_CONTEXT, 'frame_number', None)
+		}
+	}
+	TRACE_EVENTS.append(trace_event)
+
+
+def write_trace_events() -> bool:
+	if TRACE_PATH:
+		trace_events = list(TRACE_EVENTS)
+		thread_names = { trace_event.get('tid'): trace_event.get('args').get('thread_name') for trace_event in trace_events }
+
+		for thread_id, thread_name in thread_names.items():
+			trace_events.append(
+			{
+				'name': 'thread_name',
+				'cat': '__metadata',
+				'ph': 'M',
+				'ts': 0,
+				'dur': 0,
+				'pid': os.getpid(),
+				'tid': thread_id,
+				'args':
+				{
+					'name': thread_name
+				}
+			})
+		return write_json(TRACE_PATH, { 'traceEvents': trace_events, 'displayTimeUnit': 'ms' }) #type:ignore[arg-type]
+	return False
+
+
+def collect_stage_metrics() -> StageMetricsSet:
+	stage_metrics_set : StageMetricsSet = {}
+
+	for stage in sorted(STAGE_TIMER_SET):
+		stage_times = numpy.array(STAGE_TIMER_SET.get(stage)) * 1000
+
+		if stage_times.size:
+			p50, p95, p99 = numpy.percentile(stage_times, [ 50, 95, 99 ])
+			stage_metrics_set[stage] =\
+			{
+				'count': int(stage_times.size),
+				'total': round(float(stage_times.sum()), 3),
+				'p50': round(float(p50), 3),
+				'p95': round(float(p95), 3),
+				'p99': round(float(p99), 3)
+			}
+	return stage_metrics_set
+
+
+def render_stage_metrics() -> None:
+	stage_metrics_set = collect_stage_metrics()
+	headers =\
+	[
+		'stage',
+		'count',
+		'total',
+		'p50',
+		'p95',
+		'p99'
+	]
+
+	if stage_metrics_set:
+		contents = [ [ stage ] + list(stage_metrics.values()) for stage, stage_metrics in stage_metrics_set.items() ]
+		render_table(headers, contents)
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import os
+from typing import List, Optional
+
+from facefusion import state_manager
+from facefusion.filesystem import copy_file, create_directory, get_file_extension, get_file_size, is_file, remove_file, resolve_file_paths
+from facefusion.hash_helper import create_file_digest
+from facefusion.jobs import job_manager
+from facefusion.types import Args
+
+
+def get_cache_path() -> Optional[str]:
+	if job_manager.JOBS_PATH:
+		return os.path.join(job_manager.JOBS_PATH, 'cache')
+	return None
+
+
+def get_cache_limit() -> int:
+	return (state_manager.get_item('job_cache_limit') or 0) * 1024 ** 3
+
+
+def create_step_cache_key(step_args : Args) -> Optional[str]:
+	if get_cache_path() and get_cache_limit():
+		cache_args = { key: value for key, value in step_args.items() if key not in [ 'source_paths', 'target_path', 'output_path' ] }
+		cache_args['output_extension'] = get_file_extension(step_args.get('output_path'))
+		input_paths = (step_args.get('source_paths') or []) + [ step_args.get('target_path') ]
+		input_digests = [ create_file_digest(input_path) for input_path in input_paths ]
+
+		if all(input_digests):
+			step_cache_digest = hashlib.sha256(json.dumps(cache_args, sort_keys = True).encode())
+
+			for input_digest in input_digests:
+				step_cache_digest.update(bytes.fromhex(input_digest)) #type:ignore[arg-type]
+			return step_cache_digest.hexdigest()
+	return None
+
+
+def get_step_cache_path(step_cache_key : str, output_path : str) -> str:
+	return os.path.join(get_cache_path(), step_cache_key + get_file_extension(output_path))
+
+
+def read_step_cache(step_cache_key : Optional[str], step_output_path : str) -> bool:
+	if step_cache_key:
+		step_cache_path = get_step_cache_path(step_cache_key, step_output_path)
+
+		if is_file(step_cache_path):
+			os.utime(step_cache_path)
+			return copy_file(step_cache_path, step_output_path)
+	return False
+
+
+def write_step_cache(step_cache_key : Optional[str], step_output_path : str) -> bool:
+	if step_cache_key and create_directory(get_cache_path()):
+		step_cache_path = get_step_cache_path(step_cache_key, step_output_path)
+		return copy_file(step_output_path, step_cache_path) and evict_step_cache(get_cache_limit())
+	return False
+
+
+def evict_step_cache(cache_limit : int) -> bool:
+	cache_file_paths : List[str] = sorted(resolve_file_paths(get_cache_path()), key = os.path.getmtime, reverse = True)
+	cache_size = 0
+
+	for cache_file_path in cache_file_paths:
+		cache_size += get_file_size(cache_file_path)
+
+		if cache_size > cache_limit and not remove_file(cache_file_path):
+			return False
+	return True
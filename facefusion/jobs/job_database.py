@@ -0,0 +1,208 @@
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import facefusion.choices
+from facefusion.date_helper import get_current_date_time
+from facefusion.filesystem import create_directory, get_file_name, is_file, resolve_file_pattern
+from facefusion.json import read_json, write_json
+from facefusion.types import Job, JobRow, JobSet, JobStatus, JobStep, JobStepCache, JobStepStatus, StageMetricsSet, StepRow
+
+JOB_DATABASE_PATH : Optional[str] = None
+
+
+def init_job_database(database_path : str) -> bool:
+	global JOB_DATABASE_PATH
+
+	JOB_DATABASE_PATH = database_path
+
+	with closing(connect_job_database()) as connection, connection:
+		connection.execute('CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, job_status TEXT NOT NULL, version TEXT NOT NULL, date_created TEXT NOT NULL, date_updated TEXT)')
+		connection.execute('CREATE TABLE IF NOT EXISTS steps (job_id TEXT NOT NULL REFERENCES jobs (job_id) ON DELETE CASCADE, step_index INTEGER NOT NULL, args TEXT NOT NULL, status TEXT NOT NULL, cache TEXT, metrics TEXT, PRIMARY KEY (job_id, step_index))')
+		connection.execute('CREATE INDEX IF NOT EXISTS jobs_status_index ON jobs (job_status, date_created)')
+		connection.execute('CREATE INDEX IF NOT EXISTS jobs_date_index ON jobs (date_created)')
+
+		if 'metrics' not in [ column_row[1] for column_row in connection.execute('PRAGMA table_info(steps)') ]:
+			connection.execute('ALTER TABLE steps ADD COLUMN metrics TEXT')
+	return is_file(database_path)
+
+
+def connect_job_database() -> sqlite3.Connection:
+	connection = sqlite3.connect(JOB_DATABASE_PATH, timeout = 30)
+	connection.execute('PRAGMA foreign_keys = ON')
+	connection.execute('PRAGMA journal_mode = WAL')
+	return connection
+
+
+def create_job(job_id : str, job : Job) -> bool:
+	try:
+		with closing(connect_job_database()) as connection, connection:
+			connection.execute('INSERT INTO jobs (job_id, job_status, version, date_created, date_updated) VALUES (?, ?, ?, ?, ?)', (job_id, 'drafted', job.get('version'), job.get('date_created'), job.get('date_updated')))
+			insert_steps(connection, job_id, job.get('steps'))
+		return True
+	except sqlite3.IntegrityError:
+		return False
+
+
+def read_job(job_id : str) -> Optional[Job]:
+	with closing(connect_job_database()) as connection:
+		job_row = connection.execute('SELECT version, date_created, date_updated FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+
+		if job_row:
+			step_rows = connection.execute('SELECT args, status, cache, metrics FROM steps WHERE job_id = ? ORDER BY step_index', (job_id,)).fetchall()
+			return create_job_from_rows(job_row, step_rows)
+	return None
+
+
+def read_job_status(job_id : str) -> Optional[JobStatus]:
+	with closing(connect_job_database()) as connection:
+		job_row = connection.execute('SELECT job_status FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+
+		if job_row:
+			return job_row[0]
+	return None
+
+
+def update_job(job_id : str, job : Job) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE jobs SET date_updated = ? WHERE job_id = ?', (job.get('date_updated'), job_id))
+
+		if cursor.rowcount == 1:
+			connection.execute('DELETE FROM steps WHERE job_id = ?', (job_id,))
+			insert_steps(connection, job_id, job.get('steps'))
+			return True
+	return False
+
+
+def update_job_status(job_id : str, job_status : JobStatus) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE jobs SET job_status = ? WHERE job_id = ?', (job_status, job_id))
+		return cursor.rowcount == 1
+
+
+def transition_job_status(job_id : str, job_status : JobStatus, transition_status : JobStatus) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE jobs SET job_status = ?, date_updated = ? WHERE job_id = ? AND job_status = ?', (transition_status, get_current_date_time().isoformat(), job_id, job_status))
+		return cursor.rowcount == 1
+
+
+def touch_job(job_id : str) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE jobs SET date_updated = ? WHERE job_id = ?', (get_current_date_time().isoformat(), job_id))
+		return cursor.rowcount == 1
+
+
+def find_stale_job_ids(job_status : JobStatus, stale_date_time : datetime) -> List[str]:
+	with closing(connect_job_database()) as connection:
+		job_rows = connection.execute('SELECT job_id, date_created, date_updated FROM jobs WHERE job_status = ?', (job_status,)).fetchall()
+		return [ job_id for job_id, date_created, date_updated in job_rows if datetime.fromisoformat(date_updated or date_created) < stale_date_time ]
+
+
+def delete_job(job_id : str) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('DELETE FROM jobs WHERE job_id = ?', (job_id,))
+		return cursor.rowcount == 1
+
+
+def find_job_ids(job_status : JobStatus) -> List[str]:
+	with closing(connect_job_database()) as connection:
+		job_rows = connection.execute('SELECT job_id FROM jobs WHERE job_status = ? ORDER BY date_created', (job_status,)).fetchall()
+		return [ job_id for job_id, in job_rows ]
+
+
+def find_jobs(job_status : JobStatus) -> JobSet:
+	job_set : JobSet = {}
+	step_row_set : Dict[str, List[StepRow]] = {}
+
+	with closing(connect_job_database()) as connection:
+		job_rows = connection.execute('SELECT job_id, version, date_created, date_updated FROM jobs WHERE job_status = ? ORDER BY date_created', (job_status,)).fetchall()
+		step_rows = connection.execute('SELECT steps.job_id, args, status, cache, metrics FROM steps JOIN jobs ON jobs.job_id = steps.job_id WHERE job_status = ? ORDER BY steps.job_id, step_index', (job_status,)).fetchall()
+
+		for job_id, args, status, cache, metrics in step_rows:
+			step_row_set.setdefault(job_id, []).append((args, status, cache, metrics))
+
+		for job_id, version, date_created, date_updated in job_rows:
+			job_set[job_id] = create_job_from_rows((version, date_created, date_updated), step_row_set.get(job_id, []))
+	return job_set
+
+
+def update_step_status(job_id : str, step_index : int, step_status : JobStepStatus) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE steps SET status = ? WHERE job_id = ? AND step_index = ?', (step_status, job_id, step_index))
+		connection.execute('UPDATE jobs SET date_updated = ? WHERE job_id = ?', (get_current_date_time().isoformat(), job_id))
+		return cursor.rowcount == 1
+
+
+def update_step_cache(job_id : str, step_index : int, step_cache : JobStepCache) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE steps SET cache = ? WHERE job_id = ? AND step_index = ?', (step_cache, job_id, step_index))
+		connection.execute('UPDATE jobs SET date_updated = ? WHERE job_id = ?', (get_current_date_time().isoformat(), job_id))
+		return cursor.rowcount == 1
+
+
+def update_step_metrics(job_id : str, step_index : int, step_metrics : StageMetricsSet) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE steps SET metrics = ? WHERE job_id = ? AND step_index = ?', (json.dumps(step_metrics), job_id, step_index))
+		connection.execute('UPDATE jobs SET date_updated = ? WHERE job_id = ?', (get_current_date_time().isoformat(), job_id))
+		return cursor.rowcount == 1
+
+
+def update_steps_status(job_id : str, step_status : JobStepStatus) -> bool:
+	with closing(connect_job_database()) as connection, connection:
+		cursor = connection.execute('UPDATE jobs SET date_updated = ? WHERE job_id = ?', (get_current_date_time().isoformat(), job_id))
+		connection.execute('UPDATE steps SET status = ? WHERE job_id = ?', (step_status, job_id))
+		return cursor.rowcount == 1
+
+
+def insert_steps(connection : sqlite3.Connection, job_id : str, steps : List[JobStep]) -> None:
+	for step_index, step in enumerate(steps):
+		step_metrics = json.dumps(step.get('metrics')) if step.get('metrics') else None
+		connection.execute('INSERT INTO steps (job_id, step_index, args, status, cache, metrics) VALUES (?, ?, ?, ?, ?, ?)', (job_id, step_index, json.dumps(step.get('args')), step.get('status'), step.get('cache'), step_metrics))
+
+
+def create_job_from_rows(job_row : JobRow, step_rows : List[StepRow]) -> Job:
+	version, date_created, date_updated = job_row
+	job : Job =\
+	{
+		'version': version,
+		'date_created': date_created,
+		'date_updated': date_updated,
+		'steps': []
+	}
+
+	for args, status, cache, metrics in step_rows:
+		job.get('steps').append(
+		{
+			'args': json.loads(args),
+			'status': status,
+			'cache': cache,
+			'metrics': json.loads(metrics) if metrics else None
+		})
+	return job
+
+
+def import_jobs(jobs_path : str) -> bool:
+	for job_status in facefusion.choices.job_statuses:
+		for job_path in resolve_file_pattern(os.path.join(jobs_path, job_status, '*.json')):
+			job_id = get_file_name(job_path)
+			job = read_json(job_path)
+
+			if job and create_job(job_id, job) and not update_job_status(job_id, job_status): #type:ignore[arg-type]
+				return False
+	return True
+
+
+def export_jobs(jobs_path : str) -> bool:
+	for job_status in facefusion.choices.job_statuses:
+		job_status_path = os.path.join(jobs_path, job_status)
+
+		if not create_directory(job_status_path):
+			return False
+
+		for job_id, job in find_jobs(job_status).items():
+			if not write_json(os.path.join(job_status_path, job_id + '.json'), job): #type:ignore[arg-type]
+				return False
+	return True
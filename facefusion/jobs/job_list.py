@@ -14,7 +14,7 @@ def compose_job_list(job_status : JobStatus) -> Tuple[TableHeaders, TableContent
 	for index, job_id in enumerate(jobs):
 		if job_manager.validate_job(job_id):
 			job = jobs[job_id]
-			step_total = job_manager.count_step_total(job_id)
+			step_total = len(job.get('steps'))
 			date_created = prepare_describe_datetime(job.get('date_created'))
 			date_updated = prepare_describe_datetime(job.get('date_updated'))
 			job_contents.append(
@@ -1,28 +1,50 @@
 import os
 from copy import copy
+from datetime import timedelta
 from typing import List, Optional
 
 import facefusion.choices
 from facefusion.date_helper import get_current_date_time
 from facefusion.filesystem import create_directory, get_file_name, is_directory, is_file, move_file, remove_directory, remove_file, resolve_file_pattern
+from facefusion.jobs import job_database
 from facefusion.jobs.job_helper import get_step_output_path
 from facefusion.json import read_json, write_json
-from facefusion.types import Args, Job, JobSet, JobStatus, JobStep, JobStepStatus
+from facefusion.types import Args, Job, JobSet, JobStatus, JobStep, JobStepCache, JobStepStatus, JobStorage, StageMetricsSet
 
 JOBS_PATH : Optional[str] = None
+JOB_STORAGE : JobStorage = 'json'
 
 
-def init_jobs(jobs_path : str) -> bool:
+def init_jobs(jobs_path : str, job_storage : JobStorage = 'json') -> bool:
 	global JOBS_PATH
+	global JOB_STORAGE
 
 	JOBS_PATH = jobs_path
+	JOB_STORAGE = job_storage
 	job_status_paths = [ os.path.join(JOBS_PATH, job_status) for job_status in facefusion.choices.job_statuses ]
 
 	for job_status_path in job_status_paths:
 		create_directory(job_status_path)
+
+	if JOB_STORAGE == 'sqlite':
+		return init_job_storage()
 	return all(is_directory(status_path) for status_path in job_status_paths)
 
 
+def init_job_storage() -> bool:
+	database_path = os.path.join(JOBS_PATH, 'jobs.db')
+
+	if is_file(database_path):
+		return job_database.init_job_database(database_path)
+	return job_database.init_job_database(database_path) and job_database.import_jobs(JOBS_PATH)
+
+
+def export_jobs() -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.export_jobs(JOBS_PATH)
+	return False
+
+
 def clear_jobs(jobs_path : str) -> bool:
 	return remove_directory(jobs_path)
 
@@ -62,6 +84,29 @@ def submit_jobs(halt_on_error : bool) -> bool:
 	return False
 
 
+def claim_job(job_id : str) -> bool:
+	return transition_job_file(job_id, 'queued', 'started')
+
+
+def release_job(job_id : str) -> bool:
+	return transition_job_file(job_id, 'started', 'queued') and set_steps_status(job_id, 'queued')
+
+
+def find_stale_job_ids(stale_timeout : float) -> List[str]:
+	stale_date_time = get_current_date_time() - timedelta(seconds = stale_timeout)
+
+	if JOB_STORAGE == 'sqlite':
+		return job_database.find_stale_job_ids('started', stale_date_time)
+	stale_job_ids = []
+
+	for job_id in find_job_ids('started'):
+		job_path = find_job_path(job_id)
+
+		if is_file(job_path) and os.path.getmtime(job_path) < stale_date_time.timestamp():
+			stale_job_ids.append(job_id)
+	return stale_job_ids
+
+
 def delete_job(job_id : str) -> bool:
 	return delete_job_file(job_id)
 
@@ -81,6 +126,9 @@ def delete_jobs(halt_on_error : bool) -> bool:
 
 
 def find_jobs(job_status : JobStatus) -> JobSet:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.find_jobs(job_status)
+
 	job_ids = find_job_ids(job_status)
 	job_set : JobSet = {}
 
@@ -89,7 +137,20 @@ def find_jobs(job_status : JobStatus) -> JobSet:
 	return job_set
 
 
+def get_job_status(job_id : str) -> Optional[JobStatus]:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.read_job_status(job_id)
+
+	for job_status in facefusion.choices.job_statuses:
+		if is_file(suggest_job_path(job_id, job_status)):
+			return job_status
+	return None
+
+
 def find_job_ids(job_status : JobStatus) -> List[str]:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.find_job_ids(job_status)
+
 	job_pattern = os.path.join(JOBS_PATH, job_status, '*.json')
 	job_paths = resolve_file_pattern(job_pattern)
 	job_paths.sort(key = os.path.getmtime)
@@ -118,7 +179,9 @@ def add_step(job_id : str, step_args : Args) -> bool:
 		job.get('steps').append(
 		{
 			'args': step_args,
-			'status': 'drafted'
+			'status': 'drafted',
+			'cache': None,
+			'metrics': None
 		})
 		return update_job_file(job_id, job)
 	return False
@@ -149,7 +212,9 @@ def insert_step(job_id : str, step_index : int, step_args : Args) -> bool:
 		job.get('steps').insert(step_index,
 		{
 			'args': step_args,
-			'status': 'drafted'
+			'status': 'drafted',
+			'cache': None,
+			'metrics': None
 		})
 		return update_job_file(job_id, job)
 	return False
@@ -184,6 +249,9 @@ def count_step_total(job_id : str) -> int:
 
 
 def set_step_status(job_id : str, step_index : int, step_status : JobStepStatus) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.update_step_status(job_id, step_index, step_status)
+
 	job = read_job_file(job_id)
 
 	if job:
@@ -194,7 +262,38 @@ def set_step_status(job_id : str, step_index : int, step_status : JobStepStatus)
 	return False
 
 
+def set_step_cache(job_id : str, step_index : int, step_cache : JobStepCache) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.update_step_cache(job_id, step_index, step_cache)
+
+	job = read_job_file(job_id)
+
+	if job:
+		steps = job.get('steps')
+		if has_step(job_id, step_index):
+			steps[step_index]['cache'] = step_cache
+			return update_job_file(job_id, job)
+	return False
+
+
+def set_step_metrics(job_id : str, step_index : int, step_metrics : StageMetricsSet) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.update_step_metrics(job_id, step_index, step_metrics)
+
+	job = read_job_file(job_id)
+
+	if job:
+		steps = job.get('steps')
+		if has_step(job_id, step_index):
+			steps[step_index]['metrics'] = step_metrics
+			return update_job_file(job_id, job)
+	return False
+
+
 def set_steps_status(job_id : str, step_status : JobStepStatus) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.update_steps_status(job_id, step_status)
+
 	job = read_job_file(job_id)
 
 	if job:
@@ -205,11 +304,17 @@ def set_steps_status(job_id : str, step_status : JobStepStatus) -> bool:
 
 
 def read_job_file(job_id : str) -> Optional[Job]:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.read_job(job_id)
+
 	job_path = find_job_path(job_id)
 	return read_json(job_path) #type:ignore[return-value]
 
 
 def create_job_file(job_id : str, job : Job) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.create_job(job_id, job)
+
 	job_path = find_job_path(job_id)
 
 	if not is_file(job_path):
@@ -219,21 +324,57 @@ def create_job_file(job_id : str, job : Job) -> bool:
 
 
 def update_job_file(job_id : str, job : Job) -> bool:
+	job['date_updated'] = get_current_date_time().isoformat()
+
+	if JOB_STORAGE == 'sqlite':
+		return job_database.update_job(job_id, job)
+
 	job_path = find_job_path(job_id)
 
 	if is_file(job_path):
-		job['date_updated'] = get_current_date_time().isoformat()
 		return write_json(job_path, job) #type:ignore[arg-type]
 	return False
 
 
 def move_job_file(job_id : str, job_status : JobStatus) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.update_job_status(job_id, job_status)
+
 	job_path = find_job_path(job_id)
 	job_move_path = suggest_job_path(job_id, job_status)
 	return move_file(job_path, job_move_path)
 
 
+def transition_job_file(job_id : str, job_status : JobStatus, transition_status : JobStatus) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.transition_job_status(job_id, job_status, transition_status)
+
+	job_path = suggest_job_path(job_id, job_status)
+	job_transition_path = suggest_job_path(job_id, transition_status)
+
+	try:
+		os.rename(job_path, job_transition_path)
+	except OSError:
+		return False
+	return touch_job_file(job_id)
+
+
+def touch_job_file(job_id : str) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.touch_job(job_id)
+
+	job_path = find_job_path(job_id)
+
+	if is_file(job_path):
+		os.utime(job_path)
+		return True
+	return False
+
+
 def delete_job_file(job_id : str) -> bool:
+	if JOB_STORAGE == 'sqlite':
+		return job_database.delete_job(job_id)
+
 	job_path = find_job_path(job_id)
 	return remove_file(job_path)
 
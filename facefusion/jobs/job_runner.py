@@ -1,28 +1,54 @@
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from facefusion import instrumentation, logger, state_manager, wording
 from facefusion.ffmpeg import concat_video
-from facefusion.filesystem import are_images, are_videos, move_file, remove_file
+from facefusion.filesystem import are_images, are_videos, move_file, remove_directory, remove_file
 from facefusion.jobs import job_helper, job_manager
-from facefusion.types import JobOutputSet, JobStep, ProcessStep
+from facefusion.jobs.job_cache import create_step_cache_key, read_step_cache, write_step_cache
+from facefusion.processors.types import ProcessorState
+from facefusion.types import JobOutputSet, JobStep, ProcessStep, StageMetricsSet, State
 
+JOB_HEARTBEAT_INTERVAL = 10
+JOB_STALE_TIMEOUT = 60
 
-def run_job(job_id : str, process_step : ProcessStep) -> bool:
-	queued_job_ids = job_manager.find_job_ids('queued')
 
-	if job_id in queued_job_ids:
-		if run_steps(job_id, process_step) and finalize_steps(job_id):
-			clean_steps(job_id)
-			return job_manager.move_job_file(job_id, 'completed')
+def run_job(job_id : str, process_step : ProcessStep, step_worker_total : int = 1) -> bool:
+	if job_manager.claim_job(job_id):
+		temp_path = state_manager.get_item('temp_path')
+		job_temp_path = os.path.join(temp_path, job_id)
+		heartbeat_event = start_job_heartbeat(job_id)
+		state_manager.set_item('temp_path', job_temp_path)
+
+		try:
+			is_completed = run_steps(job_id, process_step, step_worker_total) and finalize_steps(job_id)
+		finally:
+			heartbeat_event.set()
+			state_manager.set_item('temp_path', temp_path)
+
 		clean_steps(job_id)
+		if is_completed:
+			remove_directory(job_temp_path)
+			return job_manager.move_job_file(job_id, 'completed')
 		job_manager.move_job_file(job_id, 'failed')
 	return False
 
 
-def run_jobs(process_step : ProcessStep, halt_on_error : bool) -> bool:
+def run_jobs(process_step : ProcessStep, halt_on_error : bool, job_runner_workers : int = 1) -> bool:
+	recover_stale_jobs()
 	queued_job_ids = job_manager.find_job_ids('queued')
 	has_error = False
 
 	if queued_job_ids:
+		if job_runner_workers > 1:
+			return run_jobs_in_parallel(queued_job_ids, process_step, halt_on_error, job_runner_workers)
+
 		for job_id in queued_job_ids:
-			if not run_job(job_id, process_step):
+			if not run_job(job_id, process_step) and job_id in job_manager.find_job_ids('failed'):
 				has_error = True
 				if halt_on_error:
 					return False
@@ -38,11 +64,17 @@ def retry_job(job_id : str, process_step : ProcessStep) -> bool:
 	return False
 
 
-def retry_jobs(process_step : ProcessStep, halt_on_error : bool) -> bool:
+def retry_jobs(process_step : ProcessStep, halt_on_error : bool, job_runner_workers : int = 1) -> bool:
 	failed_job_ids = job_manager.find_job_ids('failed')
 	has_error = False
 
 	if failed_job_ids:
+		if job_runner_workers > 1:
+			for job_id in failed_job_ids:
+				if not job_manager.set_steps_status(job_id, 'queued') or not job_manager.move_job_file(job_id, 'queued'):
+					return False
+			return run_jobs_in_parallel(failed_job_ids, process_step, halt_on_error, job_runner_workers)
+
 		for job_id in failed_job_ids:
 			if not retry_job(job_id, process_step):
 				has_error = True
@@ -52,21 +84,71 @@ def retry_jobs(process_step : ProcessStep, halt_on_error : bool) -> bool:
 	return False
 
 
+def run_jobs_in_parallel(job_ids : List[str], process_step : ProcessStep, halt_on_error : bool, job_runner_workers : int) -> bool:
+	with ProcessPoolExecutor(max_workers = min(job_runner_workers, len(job_ids)), mp_context = multiprocessing.get_context('spawn'), initializer = init_runner_worker, initargs = (state_manager.get_state(),)) as executor:
+		futures = []
+
+		for _ in range(min(job_runner_workers, len(job_ids))):
+			future = executor.submit(run_job_worker, job_ids, process_step, halt_on_error)
+			futures.append(future)
+
+		return all(future.exception() is None and future.result() for future in futures)
+
+
+def run_job_worker(job_ids : List[str], process_step : ProcessStep, halt_on_error : bool) -> bool:
+	has_error = False
+
+	for job_id in job_ids:
+		if not run_job(job_id, process_step) and job_id in job_manager.find_job_ids('failed'):
+			has_error = True
+			if halt_on_error:
+				break
+	return not has_error
+
+
+def start_job_heartbeat(job_id : str) -> threading.Event:
+	heartbeat_event = threading.Event()
+	heartbeat_thread = threading.Thread(target = run_job_heartbeat, args = (job_id, heartbeat_event), daemon = True)
+	heartbeat_thread.start()
+	return heartbeat_event
+
+
+def run_job_heartbeat(job_id : str, heartbeat_event : threading.Event) -> None:
+	while not heartbeat_event.wait(JOB_HEARTBEAT_INTERVAL):
+		job_manager.touch_job_file(job_id)
+
+
+def recover_stale_jobs() -> None:
+	for job_id in job_manager.find_stale_job_ids(JOB_STALE_TIMEOUT):
+		if job_manager.release_job(job_id):
+			logger.warn(wording.get('job_recovered').format(job_id = job_id), __name__)
+
+
 def run_step(job_id : str, step_index : int, step : JobStep, process_step : ProcessStep) -> bool:
 	step_args = step.get('args')
+	output_path = step_args.get('output_path')
+	step_output_path = job_helper.get_step_output_path(job_id, step_index, output_path)
+	step_cache_key = create_step_cache_key(step_args)
 
-	if job_manager.set_step_status(job_id, step_index, 'started') and process_step(job_id, step_index, step_args):
-		output_path = step_args.get('output_path')
-		step_output_path = job_helper.get_step_output_path(job_id, step_index, output_path)
+	if restore_step_cache(job_id, step_index, step_cache_key, step_output_path):
+		return True
+	if job_manager.set_step_status(job_id, step_index, 'started'):
+		instrumentation.clear_stage_timers()
+		is_processed = process_step(job_id, step_index, step_args)
+		save_step_metrics(job_id, step_index, collect_step_metrics())
 
-		return move_file(output_path, step_output_path) and job_manager.set_step_status(job_id, step_index, 'completed')
+		if is_processed and move_file(output_path, step_output_path):
+			write_step_cache(step_cache_key, step_output_path)
+			return job_manager.set_step_status(job_id, step_index, 'completed')
 	job_manager.set_step_status(job_id, step_index, 'failed')
 	return False
 
 
-def run_steps(job_id : str, process_step : ProcessStep) -> bool:
+def run_steps(job_id : str, process_step : ProcessStep, step_worker_total : int = 1) -> bool:
 	steps = job_manager.get_steps(job_id)
 
+	if step_worker_total > 1:
+		return run_steps_in_parallel(job_id, process_step, step_worker_total)
 	if steps:
 		for index, step in enumerate(steps):
 			if not run_step(job_id, index, step, process_step):
@@ -75,6 +157,88 @@ def run_steps(job_id : str, process_step : ProcessStep) -> bool:
 	return False
 
 
+def run_steps_in_parallel(job_id : str, process_step : ProcessStep, step_worker_total : int) -> bool:
+	steps = job_manager.get_steps(job_id)
+	step_futures : Dict[Any, int] = {}
+	step_cache_keys : Dict[int, Optional[str]] = {}
+	has_error = False
+
+	if steps:
+		with ProcessPoolExecutor(max_workers = min(step_worker_total, len(steps)), mp_context = multiprocessing.get_context('spawn'), initializer = init_runner_worker, initargs = (state_manager.get_state(),)) as executor:
+			for index, step in enumerate(steps):
+				step_output_path = job_helper.get_step_output_path(job_id, index, step.get('args').get('output_path'))
+				step_cache_keys[index] = create_step_cache_key(step.get('args'))
+
+				if restore_step_cache(job_id, index, step_cache_keys.get(index), step_output_path):
+					continue
+				if job_manager.set_step_status(job_id, index, 'started'):
+					step_futures[executor.submit(run_step_worker, job_id, index, step, process_step)] = index
+				else:
+					has_error = True
+
+			for step_future in as_completed(step_futures):
+				step_index = step_futures.get(step_future)
+				step_output_path = job_helper.get_step_output_path(job_id, step_index, steps[step_index].get('args').get('output_path'))
+
+				is_processed, step_metrics = step_future.result() if step_future.exception() is None else (False, None)
+				save_step_metrics(job_id, step_index, step_metrics)
+
+				if is_processed:
+					write_step_cache(step_cache_keys.get(step_index), step_output_path)
+					job_manager.set_step_status(job_id, step_index, 'completed')
+				else:
+					job_manager.set_step_status(job_id, step_index, 'failed')
+					has_error = True
+		return not has_error
+	return False
+
+
+def restore_step_cache(job_id : str, step_index : int, step_cache_key : Optional[str], step_output_path : str) -> bool:
+	if read_step_cache(step_cache_key, step_output_path):
+		return job_manager.set_step_cache(job_id, step_index, 'hit') and job_manager.set_step_status(job_id, step_index, 'completed')
+	if step_cache_key:
+		job_manager.set_step_cache(job_id, step_index, 'miss')
+	return False
+
+
+def init_runner_worker(state : Union[State, ProcessorState]) -> None:
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	logger.init(state_manager.get_item('log_level'))
+	instrumentation.init(state_manager.get_item('instrument_stages'))
+	job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage'))
+
+
+def run_step_worker(job_id : str, step_index : int, step : JobStep, process_step : ProcessStep) -> Tuple[bool, Optional[StageMetricsSet]]:
+	step_args = step.get('args').copy()
+	temp_path = state_manager.get_item('temp_path')
+	step_temp_path = os.path.join(temp_path, job_id + '-' + str(step_index))
+	step_args['output_path'] = job_helper.get_step_output_path(job_id, step_index, step_args.get('output_path'))
+
+	state_manager.set_item('temp_path', step_temp_path)
+	instrumentation.clear_stage_timers()
+	is_processed = process_step(job_id, step_index, step_args)
+	state_manager.set_item('temp_path', temp_path)
+
+	if is_processed:
+		remove_directory(step_temp_path)
+	return is_processed, collect_step_metrics()
+
+
+def collect_step_metrics() -> Optional[StageMetricsSet]:
+	if instrumentation.is_enabled():
+		return instrumentation.collect_stage_metrics()
+	return None
+
+
+def save_step_metrics(job_id : str, step_index : int, step_metrics : Optional[StageMetricsSet]) -> bool:
+	if step_metrics is not None:
+		return job_manager.set_step_metrics(job_id, step_index, step_metrics)
+	return False
+
+
 def finalize_steps(job_id : str) -> bool:
 	output_set = collect_output_set(job_id)
 
@@ -0,0 +1,88 @@
+import signal
+import threading
+from time import sleep, time
+from typing import Any, Dict, Optional
+
+import psutil
+
+from facefusion import inference_manager, logger, state_manager, wording
+from facefusion.jobs import job_manager, job_runner
+from facefusion.types import ProcessStep
+
+INFERENCE_SIGNATURE : Optional[Dict[str, Any]] = None
+
+
+def run_worker(process_step : ProcessStep) -> None:
+	state_manager.set_item('video_memory_strategy', 'tolerant')
+	logger.info(wording.get('watching_jobs').format(job_worker_interval = state_manager.get_item('job_worker_interval')), __name__)
+
+	while True:
+		if not poll_jobs(process_step):
+			sleep(state_manager.get_item('job_worker_interval'))
+
+
+def poll_jobs(process_step : ProcessStep) -> bool:
+	job_runner.recover_stale_jobs()
+	queued_job_ids = job_manager.find_job_ids('queued')
+
+	for job_id in queued_job_ids:
+		run_worker_job(job_id, process_step)
+	return len(queued_job_ids) > 0
+
+
+def run_worker_job(job_id : str, process_step : ProcessStep) -> bool:
+	start_time = time()
+	signal_handler = signal.getsignal(signal.SIGINT)
+
+	try:
+		is_completed = job_runner.run_job(job_id, process_step)
+	except (Exception, SystemExit) as exception:
+		if isinstance(exception, SystemExit) and not exception.code:
+			raise
+		logger.error(wording.get('processing_job_crashed').format(job_id = job_id, exception = repr(exception)), __name__)
+		fail_worker_job(job_id)
+		is_completed = False
+	finally:
+		if threading.current_thread() is threading.main_thread():
+			signal.signal(signal.SIGINT, signal_handler)
+
+	if is_completed:
+		logger.info(wording.get('processing_job_succeed').format(job_id = job_id), __name__)
+	elif job_id in job_manager.find_job_ids('failed'):
+		logger.info(wording.get('processing_job_failed').format(job_id = job_id), __name__)
+
+	evict_inference_pools(start_time)
+	return is_completed
+
+
+def fail_worker_job(job_id : str) -> bool:
+	if job_id in job_manager.find_job_ids('started'):
+		return job_manager.set_steps_status(job_id, 'failed') and job_manager.move_job_file(job_id, 'failed')
+	return False
+
+
+def evict_inference_pools(start_time : float) -> None:
+	global INFERENCE_SIGNATURE
+
+	inference_signature = create_inference_signature()
+	job_worker_memory_limit = state_manager.get_item('job_worker_memory_limit') * 1024 ** 3
+
+	if INFERENCE_SIGNATURE and INFERENCE_SIGNATURE != inference_signature:
+		for inference_context in inference_manager.find_inference_contexts(start_time):
+			evict_inference_context(inference_context)
+	INFERENCE_SIGNATURE = inference_signature
+
+	if job_worker_memory_limit > 0:
+		for inference_context in inference_manager.find_inference_contexts(time()):
+			if psutil.Process().memory_info().rss < job_worker_memory_limit:
+				break
+			evict_inference_context(inference_context)
+
+
+def evict_inference_context(inference_context : str) -> None:
+	logger.debug(wording.get('evicting_inference_context').format(inference_context = inference_context), __name__)
+	inference_manager.evict_inference_context(inference_context)
+
+
+def create_inference_signature() -> Dict[str, Any]:
+	return { key: value for key, value in state_manager.get_state().items() if key in [ 'execution_device_id', 'execution_providers', 'execution_intra_op_thread_count', 'execution_inter_op_thread_count', 'execution_session_mode', 'execution_graph_optimization', 'execution_memory_arena', 'execution_session_count', 'session_memory_limit' ] or key.endswith('_model') }
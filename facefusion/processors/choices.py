@@ -221,4 +221,5 @@ face_enhancer_blend_range : Sequence[int] = create_int_range(0, 100, 1)
 face_enhancer_weight_range : Sequence[float] = create_float_range(0.0, 1.0, 0.05)
 frame_colorizer_blend_range : Sequence[int] = create_int_range(0, 100, 1)
 frame_enhancer_blend_range : Sequence[int] = create_int_range(0, 100, 1)
+frame_enhancer_batch_size_range : Sequence[int] = create_int_range(1, 16, 1)
 lip_syncer_weight_range : Sequence[float] = create_float_range(0.0, 1.0, 0.05)
@@ -1,16 +1,43 @@
 import importlib
+import multiprocessing
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue
+import signal
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from queue import Empty, Full, Queue
+from time import perf_counter
 from types import ModuleType
-from typing import Any, List
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import cv2
+import numpy
 from tqdm import tqdm
 
-from facefusion import logger, state_manager, wording
+import facefusion.choices
+from facefusion import instrumentation, logger, process_manager, state_manager, wording
+from facefusion.audio import create_empty_audio_frame, get_voice_frame
+from facefusion.common_helper import get_first
 from facefusion.exit_helper import hard_exit
-from facefusion.types import ProcessFrames, QueuePayload
+from facefusion.face_analyser import get_average_face, get_frame_faces, get_many_faces
+from facefusion.face_selector import sort_faces_by_order
+from facefusion.face_store import append_reference_face, get_face_store, get_reference_faces, set_index_faces
+from facefusion.filesystem import filter_audio_paths, filter_image_paths
+from facefusion.frame_journal import get_frame_journal, init_frame_journal, is_frame_journaled, iterate_frame_journal, restore_journal_frame, write_journal_frame
+from facefusion.frame_scheduler import claim_queue_payloads, create_frame_scheduler, finalize_worker_stats, record_worker_stats
+from facefusion.processors.types import FaceContextInputs, PipelineStageItem, ProcessorInputs, ProcessorState
+from facefusion.thread_helper import thread_lock
+from facefusion.types import Face, FaceIndexSet, FaceSet, Fps, FrameJournal, FrameScheduler, FrameWorkerStats, PipelineStage, PipelineStageSet, ProcessFrames, ProcessStreamFrame, QueuePayload, Resolution, SpawnWorker, State, UpdateProgress, VisionFrame
+from facefusion.vision import read_image, read_static_images, restrict_video_fps
 
+SPAWN_WORKER : SpawnWorker =\
+{
+	'payload_queue': None,
+	'progress_queue': None,
+	'stop_event': None
+}
 PROCESSORS_METHODS =\
 [
 	'get_inference_pool',
@@ -20,6 +47,9 @@ PROCESSORS_METHODS =\
 	'pre_check',
 	'pre_process',
 	'post_process',
+	'invalidates_face_geometry',
+	'get_demanded_face_attributes',
+	'requires_target_faces',
 	'get_reference_frame',
 	'process_frame',
 	'process_frames',
@@ -53,36 +83,453 @@ def get_processors_modules(processors : List[str]) -> List[ModuleType]:
 	return processor_modules
 
 
+def get_source_faces(source_paths : List[str]) -> List[Face]:
+	source_frames = read_static_images(filter_image_paths(source_paths))
+	source_faces = []
+
+	for source_frame in source_frames:
+		temp_faces = sort_faces_by_order(get_many_faces([ source_frame ], [ 'embedding' ]), 'large-small')
+		if temp_faces:
+			source_faces.append(get_first(temp_faces))
+	return source_faces
+
+
+def process_vision_frame(processor_modules : List[ModuleType], reference_faces : FaceSet, source_face : Face, source_audio_path : str, temp_video_fps : Fps, frame_number : int, target_vision_frame : VisionFrame) -> VisionFrame:
+	instrumentation.set_trace_frame(frame_number)
+	processor_inputs = create_processor_inputs(reference_faces, source_face, source_audio_path, temp_video_fps, frame_number, target_vision_frame)
+	return run_processor_chain(processor_modules, processor_inputs)
+
+
+def create_processor_inputs(reference_faces : FaceSet, source_face : Face, source_audio_path : str, temp_video_fps : Fps, frame_number : int, target_vision_frame : VisionFrame) -> ProcessorInputs:
+	source_audio_frame = get_voice_frame(source_audio_path, temp_video_fps, frame_number)
+
+	if not numpy.any(source_audio_frame):
+		source_audio_frame = create_empty_audio_frame()
+	return\
+	{
+		'reference_faces': reference_faces,
+		'source_face': source_face,
+		'source_audio_frame': source_audio_frame,
+		'source_vision_frame': target_vision_frame.copy(),
+		'target_frame_number': frame_number,
+		'target_faces': None,
+		'target_vision_frame': target_vision_frame
+	}
+
+
+def run_processor_chain(processor_modules : List[ModuleType], processor_inputs : ProcessorInputs) -> VisionFrame:
+	for processor_module in processor_modules:
+		processor_inputs['target_vision_frame'] = processor_module.process_frame(processor_inputs)
+		if processor_module.invalidates_face_geometry():
+			processor_inputs['target_frame_number'] = None
+			processor_inputs['target_faces'] = None
+	return processor_inputs.get('target_vision_frame')
+
+
+def get_target_faces(inputs : FaceContextInputs) -> List[Face]:
+	if inputs.get('target_faces') is None:
+		inputs['target_faces'] = get_frame_faces(inputs.get('target_vision_frame'), inputs.get('target_frame_number'))
+	return inputs.get('target_faces')
+
+
+def process_fused_frames(processors : List[str], source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
+	processor_modules = get_processors_modules(processors)
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = get_average_face(get_source_faces(source_paths))
+	source_audio_path = get_first(filter_audio_paths(source_paths))
+	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+
+	for queue_payload in process_manager.manage(queue_payloads):
+		target_vision_path = queue_payload.get('frame_path')
+		target_vision_frame = read_image(target_vision_path)
+		output_vision_frame = process_vision_frame(processor_modules, reference_faces, source_face, source_audio_path, temp_video_fps, queue_payload.get('frame_number'), target_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
+		update_progress(1)
+
+
+def multi_stage_frames(processors : List[str], source_paths : List[str], temp_frame_paths : List[str]) -> None:
+	processor_modules = get_processors_modules(processors)
+	queue_payloads = create_queue_payloads(temp_frame_paths)
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = get_average_face(get_source_faces(source_paths))
+	source_audio_path = get_first(filter_audio_paths(source_paths))
+	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+	pipeline_stage_set = create_pipeline_stage_set(queue_payloads, state_manager.get_item('pipeline_stage_workers'))
+	abort_event = threading.Event()
+
+	with tqdm(total = len(queue_payloads), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+		stage_handlers : Dict[PipelineStage, Callable[[PipelineStageItem], None]] =\
+		{
+			'read': read_stage_item,
+			'analyse': partial(analyse_stage_item, processor_modules, reference_faces, source_face, source_audio_path, temp_video_fps),
+			'process': partial(process_stage_item, processor_modules),
+			'write': partial(write_stage_item, pipeline_stage_set, progress)
+		}
+
+		with ThreadPoolExecutor(max_workers = sum(state_manager.get_item('pipeline_stage_workers'))) as executor:
+			futures = []
+
+			for pipeline_stage in facefusion.choices.pipeline_stages:
+				for _ in range(pipeline_stage_set.get(pipeline_stage).get('worker_total')):
+					future = executor.submit(run_stage_worker, pipeline_stage_set, pipeline_stage, stage_handlers.get(pipeline_stage), abort_event)
+					futures.append(future)
+
+			for future_done in as_completed(futures):
+				future_done.result()
+
+	log_pipeline_stage_set(pipeline_stage_set)
+
+
+def create_pipeline_stage_set(queue_payloads : List[QueuePayload], pipeline_stage_workers : List[int]) -> PipelineStageSet:
+	pipeline_stage_set : PipelineStageSet = {}
+
+	for pipeline_stage, worker_total in zip(facefusion.choices.pipeline_stages, pipeline_stage_workers):
+		queue_size = 0 if pipeline_stage == 'read' else worker_total * 2
+		pipeline_stage_set[pipeline_stage] =\
+		{
+			'queue': Queue(maxsize = queue_size),
+			'queue_size': queue_size,
+			'queue_peak': 0,
+			'worker_total': worker_total,
+			'worker_active': worker_total
+		}
+
+	for queue_payload in queue_payloads:
+		pipeline_stage_set['read']['queue'].put(
+		{
+			'queue_payload': queue_payload,
+			'vision_frame': None,
+			'processor_inputs': None
+		})
+	for _ in range(pipeline_stage_set.get('read').get('worker_total')):
+		pipeline_stage_set['read']['queue'].put(None)
+	return pipeline_stage_set
+
+
+def run_stage_worker(pipeline_stage_set : PipelineStageSet, pipeline_stage : PipelineStage, stage_handler : Callable[[PipelineStageItem], None], abort_event : threading.Event) -> None:
+	next_pipeline_stage = get_next_pipeline_stage(pipeline_stage)
+
+	try:
+		stage_item = get_stage_item(pipeline_stage_set, pipeline_stage, abort_event)
+
+		while stage_item:
+			stage_handler(stage_item)
+			if next_pipeline_stage and not put_stage_item(pipeline_stage_set, next_pipeline_stage, stage_item, abort_event):
+				break
+			stage_item = get_stage_item(pipeline_stage_set, pipeline_stage, abort_event)
+	except Exception:
+		abort_event.set()
+		raise
+	finally:
+		finish_stage_worker(pipeline_stage_set, pipeline_stage, abort_event)
+
+
+def get_next_pipeline_stage(pipeline_stage : PipelineStage) -> Optional[PipelineStage]:
+	pipeline_stage_index = facefusion.choices.pipeline_stages.index(pipeline_stage) + 1
+
+	if pipeline_stage_index < len(facefusion.choices.pipeline_stages):
+		return facefusion.choices.pipeline_stages[pipeline_stage_index]
+	return None
+
+
+def get_stage_item(pipeline_stage_set : PipelineStageSet, pipeline_stage : PipelineStage, abort_event : threading.Event) -> Optional[PipelineStageItem]:
+	while not abort_event.is_set() and not process_manager.is_stopping():
+		try:
+			return pipeline_stage_set.get(pipeline_stage).get('queue').get(timeout = 0.1)
+		except Empty:
+			pass
+	return None
+
+
+def put_stage_item(pipeline_stage_set : PipelineStageSet, pipeline_stage : PipelineStage, stage_item : Optional[PipelineStageItem], abort_event : threading.Event) -> bool:
+	pipeline_stage_state = pipeline_stage_set.get(pipeline_stage)
+
+	while not abort_event.is_set() and not process_manager.is_stopping():
+		try:
+			pipeline_stage_state.get('queue').put(stage_item, timeout = 0.1)
+			pipeline_stage_state['queue_peak'] = max(pipeline_stage_state.get('queue_peak'), pipeline_stage_state.get('queue').qsize())
+			return True
+		except Full:
+			pass
+	return False
+
+
+def finish_stage_worker(pipeline_stage_set : PipelineStageSet, pipeline_stage : PipelineStage, abort_event : threading.Event) -> None:
+	next_pipeline_stage = get_next_pipeline_stage(pipeline_stage)
+
+	with thread_lock():
+		pipeline_stage_set[pipeline_stage]['worker_active'] -= 1
+		is_last_worker = pipeline_stage_set.get(pipeline_stage).get('worker_active') == 0
+
+	if is_last_worker and next_pipeline_stage:
+		for _ in range(pipeline_stage_set.get(next_pipeline_stage).get('worker_total')):
+			put_stage_item(pipeline_stage_set, next_pipeline_stage, None, abort_event)
+
+
+def read_stage_item(stage_item : PipelineStageItem) -> None:
+	instrumentation.set_trace_frame(stage_item.get('queue_payload').get('frame_number'))
+	stage_item['vision_frame'] = read_image(stage_item.get('queue_payload').get('frame_path'))
+
+
+def analyse_stage_item(processor_modules : List[ModuleType], reference_faces : FaceSet, source_face : Face, source_audio_path : str, temp_video_fps : Fps, stage_item : PipelineStageItem) -> None:
+	instrumentation.set_trace_frame(stage_item.get('queue_payload').get('frame_number'))
+	processor_inputs = create_processor_inputs(reference_faces, source_face, source_audio_path, temp_video_fps, stage_item.get('queue_payload').get('frame_number'), stage_item.get('vision_frame'))
+
+	if get_first(processor_modules).requires_target_faces():
+		get_target_faces(processor_inputs)
+	stage_item['processor_inputs'] = processor_inputs
+
+
+def process_stage_item(processor_modules : List[ModuleType], stage_item : PipelineStageItem) -> None:
+	instrumentation.set_trace_frame(stage_item.get('queue_payload').get('frame_number'))
+	stage_item['vision_frame'] = run_processor_chain(processor_modules, stage_item.get('processor_inputs'))
+	stage_item['processor_inputs'] = None
+
+
+def write_stage_item(pipeline_stage_set : PipelineStageSet, progress : tqdm, stage_item : PipelineStageItem) -> None:
+	instrumentation.set_trace_frame(stage_item.get('queue_payload').get('frame_number'))
+	write_journal_frame(stage_item.get('queue_payload'), stage_item.get('vision_frame'))
+	progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'), queue_depths = get_stage_queue_depths(pipeline_stage_set), refresh = False)
+	progress.update()
+
+
+def get_stage_queue_depths(pipeline_stage_set : PipelineStageSet) -> str:
+	return ' '.join(pipeline_stage + '=' + str(pipeline_stage_set.get(pipeline_stage).get('queue').qsize()) for pipeline_stage in facefusion.choices.pipeline_stages)
+
+
+def log_pipeline_stage_set(pipeline_stage_set : PipelineStageSet) -> None:
+	for pipeline_stage in facefusion.choices.pipeline_stages[1:]:
+		pipeline_stage_state = pipeline_stage_set.get(pipeline_stage)
+		logger.info(wording.get('stage_queue_depth').format(stage = pipeline_stage, queue_peak = pipeline_stage_state.get('queue_peak'), queue_size = pipeline_stage_state.get('queue_size')), __name__)
+
+
 def multi_process_frames(source_paths : List[str], temp_frame_paths : List[str], process_frames : ProcessFrames) -> None:
+	if state_manager.get_item('execution_worker_mode') == 'process':
+		multi_spawn_frames(source_paths, temp_frame_paths, process_frames)
+	else:
+		multi_thread_frames(source_paths, temp_frame_paths, process_frames)
+
+
+def multi_thread_frames(source_paths : List[str], temp_frame_paths : List[str], process_frames : ProcessFrames) -> None:
 	queue_payloads = create_queue_payloads(temp_frame_paths)
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+	frame_scheduler = create_frame_scheduler(queue_payloads, execution_thread_count, state_manager.get_item('execution_schedule_mode'))
+
 	with tqdm(total = len(queue_payloads), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
-		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+		with ThreadPoolExecutor(max_workers = execution_thread_count) as executor:
 			futures = []
-			queue : Queue[QueuePayload] = create_queue(queue_payloads)
-			queue_per_future = max(len(queue_payloads) // state_manager.get_item('execution_thread_count') * state_manager.get_item('execution_queue_count'), 1)
 
-			while not queue.empty():
-				future = executor.submit(process_frames, source_paths, pick_queue(queue, queue_per_future), progress.update)
+			for worker_index in range(execution_thread_count):
+				future = executor.submit(run_thread_worker, frame_scheduler, worker_index, process_frames, source_paths, progress.update)
 				futures.append(future)
 
 			for future_done in as_completed(futures):
 				future_done.result()
 
+	log_worker_stats(finalize_worker_stats(frame_scheduler))
+
+
+def run_thread_worker(frame_scheduler : FrameScheduler, worker_index : int, process_frames : ProcessFrames, source_paths : List[str], update_progress : UpdateProgress) -> None:
+	record_worker_stats(frame_scheduler, worker_index, 0, 0.0)
+	process_frames(source_paths, iterate_frame_journal(iterate_frame_scheduler(frame_scheduler, worker_index)), update_progress)
+
+
+def iterate_frame_scheduler(frame_scheduler : FrameScheduler, worker_index : int) -> Iterator[QueuePayload]:
+	queue_payloads = claim_queue_payloads(frame_scheduler, worker_index, state_manager.get_item('execution_queue_count'))
+
+	while queue_payloads:
+		busy_time = 0.0
+
+		for queue_payload in queue_payloads:
+			instrumentation.set_trace_frame(queue_payload.get('frame_number'))
+			start_time = perf_counter()
+			yield queue_payload
+			busy_time += perf_counter() - start_time
+		record_worker_stats(frame_scheduler, worker_index, len(queue_payloads), busy_time)
+		queue_payloads = claim_queue_payloads(frame_scheduler, worker_index, state_manager.get_item('execution_queue_count'))
+
+
+def multi_spawn_frames(source_paths : List[str], temp_frame_paths : List[str], process_frames : ProcessFrames) -> None:
+	queue_payloads = create_queue_payloads(temp_frame_paths)
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+	frame_scheduler = create_frame_scheduler([], execution_thread_count, 'fifo')
+	spawn_context = multiprocessing.get_context('spawn')
+	payload_queue = spawn_context.Queue()
+	progress_queue = spawn_context.Queue()
+	stop_event = spawn_context.Event()
+	face_store = get_face_store()
 
-def create_queue(queue_payloads : List[QueuePayload]) -> Queue[QueuePayload]:
-	queue : Queue[QueuePayload] = Queue()
 	for queue_payload in queue_payloads:
-		queue.put(queue_payload)
-	return queue
+		payload_queue.put(queue_payload)
+
+	with tqdm(total = len(queue_payloads), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'), execution_worker_mode = 'process')
+		with ProcessPoolExecutor(max_workers = execution_thread_count, mp_context = spawn_context, initializer = init_spawn_worker, initargs = (state_manager.get_state(), face_store.get('reference_faces'), face_store.get('index_faces'), get_frame_journal(), payload_queue, progress_queue, stop_event)) as executor:
+			futures = []
+
+			for _ in range(execution_thread_count):
+				future = executor.submit(run_spawn_worker, process_frames, source_paths)
+				futures.append(future)
+
+			try:
+				while not all(future.done() for future in futures):
+					if process_manager.is_stopping():
+						stop_event.set()
+					drain_progress_queue(progress_queue, progress.update, 0.1)
+			finally:
+				stop_event.set()
+
+			drain_progress_queue(progress_queue, progress.update, 0)
+
+			for future_done in as_completed(futures):
+				worker_id, frame_total, busy_time = future_done.result()
+				record_worker_stats(frame_scheduler, worker_id, frame_total, busy_time)
+
+	log_worker_stats(finalize_worker_stats(frame_scheduler))
+
+
+def init_spawn_worker(state : Union[State, ProcessorState], reference_faces : FaceSet, index_faces : FaceIndexSet, frame_journal : FrameJournal, payload_queue : Any, progress_queue : Any, stop_event : Any) -> None:
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	logger.init(state_manager.get_item('log_level'))
+	instrumentation.init(state_manager.get_item('instrument_stages'))
+
+	for name, faces in reference_faces.items():
+		for face in faces:
+			append_reference_face(name, face)
+	set_index_faces(index_faces)
+	init_frame_journal(frame_journal)
+	SPAWN_WORKER['payload_queue'] = payload_queue
+	SPAWN_WORKER['progress_queue'] = progress_queue
+	SPAWN_WORKER['stop_event'] = stop_event
 
 
-def pick_queue(queue : Queue[QueuePayload], queue_per_future : int) -> List[QueuePayload]:
-	queues = []
-	for _ in range(queue_per_future):
-		if not queue.empty():
-			queues.append(queue.get())
-	return queues
+def run_spawn_worker(process_frames : ProcessFrames, source_paths : List[str]) -> Tuple[int, int, float]:
+	worker_stats : FrameWorkerStats =\
+	{
+		'frame_total': 0,
+		'busy_time': 0.0,
+		'utilization': 0.0
+	}
+
+	if SPAWN_WORKER.get('stop_event').is_set():
+		process_manager.stop()
+	else:
+		process_manager.start()
+		process_frames(source_paths, iterate_frame_journal(iterate_spawn_queue(worker_stats)), update_spawn_progress)
+	return os.getpid(), worker_stats.get('frame_total'), worker_stats.get('busy_time')
+
+
+def iterate_spawn_queue(worker_stats : FrameWorkerStats) -> Iterator[QueuePayload]:
+	try:
+		while True:
+			queue_payload = SPAWN_WORKER.get('payload_queue').get(timeout = 0.5)
+			worker_stats['frame_total'] += 1
+			start_time = perf_counter()
+			yield queue_payload
+			worker_stats['busy_time'] += perf_counter() - start_time
+	except Empty:
+		pass
+
+
+def update_spawn_progress(progress_total : int) -> None:
+	SPAWN_WORKER.get('progress_queue').put(progress_total)
+
+	if SPAWN_WORKER.get('stop_event').is_set():
+		process_manager.stop()
+
+
+def log_worker_stats(worker_stats_list : List[FrameWorkerStats]) -> None:
+	for worker_index, worker_stats in enumerate(worker_stats_list):
+		logger.info(wording.get('worker_utilization').format(worker = worker_index, frame_total = worker_stats.get('frame_total'), utilization = worker_stats.get('utilization')), __name__)
+
+
+def drain_progress_queue(progress_queue : Any, update_progress : UpdateProgress, timeout : float) -> None:
+	try:
+		update_progress(progress_queue.get(timeout = timeout) if timeout else progress_queue.get_nowait())
+
+		while True:
+			update_progress(progress_queue.get_nowait())
+	except Empty:
+		pass
+
+
+def multi_stream_frames(frame_reader : subprocess.Popen[bytes], frame_writer : subprocess.Popen[bytes], temp_video_resolution : Resolution, output_video_resolution : Resolution, frame_total : int, process_stream_frame : ProcessStreamFrame) -> bool:
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+	stream_buffer_limit = execution_thread_count * (state_manager.get_item('execution_queue_count') + 1)
+	stream_futures : Deque[Future[VisionFrame]] = deque()
+	frame_number = 0
+	is_stream_done = False
+
+	try:
+		with tqdm(total = frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+			with ThreadPoolExecutor(max_workers = execution_thread_count) as executor:
+				try:
+					while process_manager.is_processing():
+						temp_vision_frame = read_stream_frame(frame_reader, temp_video_resolution)
+						if temp_vision_frame is None:
+							break
+						stream_futures.append(executor.submit(process_stream_frame, frame_number, temp_vision_frame))
+						frame_number += 1
+
+						while len(stream_futures) >= stream_buffer_limit or (stream_futures and stream_futures[0].done()):
+							write_stream_frame(frame_writer, stream_futures.popleft().result(), output_video_resolution)
+							progress.update()
+
+					while stream_futures and process_manager.is_processing():
+						write_stream_frame(frame_writer, stream_futures.popleft().result(), output_video_resolution)
+						progress.update()
+				except BrokenPipeError:
+					logger.debug('Frame writer closed the stream', __name__)
+				finally:
+					for stream_future in stream_futures:
+						stream_future.cancel()
+		is_stream_done = True
+	finally:
+		if not is_stream_done:
+			frame_reader.kill()
+			frame_writer.kill()
+		is_stream_closed = close_stream(frame_reader, frame_writer)
+
+	return is_stream_closed
+
+
+def read_stream_frame(frame_reader : subprocess.Popen[bytes], resolution : Resolution) -> Optional[VisionFrame]:
+	frame_width, frame_height = resolution
+	frame_size = frame_width * frame_height * 3
+	frame_buffer = frame_reader.stdout.read(frame_size)
+
+	if len(frame_buffer) == frame_size:
+		return numpy.frombuffer(frame_buffer, dtype = numpy.uint8).reshape(frame_height, frame_width, 3).copy()
+	return None
+
+
+def write_stream_frame(frame_writer : subprocess.Popen[bytes], vision_frame : VisionFrame, resolution : Resolution) -> None:
+	frame_width, frame_height = resolution
+
+	if vision_frame.shape[:2] != (frame_height, frame_width):
+		vision_frame = cv2.resize(vision_frame, resolution)
+	frame_writer.stdin.write(numpy.ascontiguousarray(vision_frame, dtype = numpy.uint8).tobytes())
+
+
+def close_stream(frame_reader : subprocess.Popen[bytes], frame_writer : subprocess.Popen[bytes]) -> bool:
+	if process_manager.is_stopping():
+		frame_reader.terminate()
+		frame_writer.terminate()
+	frame_reader.stdout.close()
+
+	try:
+		frame_writer.stdin.close()
+	except BrokenPipeError:
+		pass
+
+	frame_reader.wait()
+	return frame_writer.wait() == 0 and process_manager.is_processing()
 
 
 def create_queue_payloads(temp_frame_paths : List[str]) -> List[QueuePayload]:
@@ -95,5 +542,8 @@ def create_queue_payloads(temp_frame_paths : List[str]) -> List[QueuePayload]:
 			'frame_number': frame_number,
 			'frame_path': frame_path
 		}
-		queue_payloads.append(frame_payload)
+		if is_frame_journaled(frame_number):
+			restore_journal_frame(frame_payload)
+		else:
+			queue_payloads.append(frame_payload)
 	return queue_payloads
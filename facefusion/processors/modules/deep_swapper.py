@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import cv2
 import numpy
@@ -12,17 +12,19 @@ import facefusion.processors.core as processors
 from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, process_manager, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url_by_provider
-from facefusion.face_analyser import get_many_faces, get_one_face
+from facefusion.face_analyser import get_one_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
 from facefusion.face_selector import find_similar_faces, sort_and_filter_faces
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import get_file_name, in_directory, is_image, is_video, resolve_file_paths, resolve_relative_path, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import DeepSwapperInputs, DeepSwapperMorph
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceAttribute, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import conditional_match_frame_color, read_image, read_static_image, write_image
 
 
@@ -359,6 +361,7 @@ def swap_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFram
 	return paste_vision_frame
 
 
+@instrument('deep_swapper.forward')
 def forward(crop_vision_frame : VisionFrame, deep_swapper_morph : DeepSwapperMorph) -> Tuple[VisionFrame, Mask, Mask]:
 	deep_swapper = get_inference_pool().get('deep_swapper')
 	deep_swapper_inputs = {}
@@ -409,14 +412,27 @@ def prepare_crop_mask(crop_source_mask : Mask, crop_target_mask : Mask) -> Mask:
 	return crop_mask
 
 
+def invalidates_face_geometry() -> bool:
+	return True
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
+def requires_target_faces() -> bool:
+	return True
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	return swap_face(target_face, temp_vision_frame)
 
 
+@instrument('deep_swapper.process_frame')
 def process_frame(inputs : DeepSwapperInputs) -> VisionFrame:
 	reference_faces = inputs.get('reference_faces')
 	target_vision_frame = inputs.get('target_vision_frame')
-	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	many_faces = sort_and_filter_faces(processors.get_target_faces(inputs))
 
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
@@ -434,7 +450,7 @@ def process_frame(inputs : DeepSwapperInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_path : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
@@ -443,9 +459,11 @@ def process_frames(source_path : List[str], queue_payloads : List[QueuePayload],
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
+			'target_frame_number': queue_payload.get('frame_number'),
+			'target_faces': None,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
@@ -455,6 +473,8 @@ def process_image(source_path : str, target_path : str, output_path : str) -> No
 	output_vision_frame = process_frame(
 	{
 		'reference_faces': reference_faces,
+		'target_frame_number': None,
+		'target_faces': None,
 		'target_vision_frame': target_vision_frame
 	})
 	write_image(output_path, output_vision_frame)
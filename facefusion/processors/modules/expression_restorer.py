@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import cv2
 import numpy
@@ -11,18 +11,20 @@ import facefusion.processors.core as processors
 from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, process_manager, state_manager, video_manager, wording
 from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
-from facefusion.face_analyser import get_many_faces, get_one_face
+from facefusion.face_analyser import get_one_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_box_mask, create_occlusion_mask
 from facefusion.face_selector import find_similar_faces, sort_and_filter_faces
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.live_portrait import create_rotation, limit_expression
 from facefusion.processors.types import ExpressionRestorerInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, read_video_frame, write_image
 
 
@@ -86,6 +88,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return [ 'feature_extractor', 'motion_extractor' ]
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('expression_restorer_model')
 	return create_static_model_set('full').get(model_name)
@@ -181,11 +187,12 @@ def apply_restore(source_crop_vision_frame : VisionFrame, target_crop_vision_fra
 	return crop_vision_frame
 
 
+@instrument('expression_restorer.forward_extract_feature')
 def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
 	feature_extractor = get_inference_pool().get('feature_extractor')
 
-	with conditional_thread_semaphore():
-		feature_volume = feature_extractor.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(feature_extractor) as inference_session:
+		feature_volume = inference_session.run(None,
 		{
 			'input': crop_vision_frame
 		})[0]
@@ -193,11 +200,12 @@ def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeat
 	return feature_volume
 
 
+@instrument('expression_restorer.forward_extract_motion')
 def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
 	motion_extractor = get_inference_pool().get('motion_extractor')
 
-	with conditional_thread_semaphore():
-		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(motion_extractor) as inference_session:
+		pitch, yaw, roll, scale, translation, expression, motion_points = inference_session.run(None,
 		{
 			'input': crop_vision_frame
 		})
@@ -205,6 +213,7 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 	return pitch, yaw, roll, scale, translation, expression, motion_points
 
 
+@instrument('expression_restorer.forward_generate_frame')
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
@@ -235,15 +244,28 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
+def invalidates_face_geometry() -> bool:
+	return True
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
+def requires_target_faces() -> bool:
+	return True
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	pass
 
 
+@instrument('expression_restorer.process_frame')
 def process_frame(inputs : ExpressionRestorerInputs) -> VisionFrame:
 	reference_faces = inputs.get('reference_faces')
 	source_vision_frame = inputs.get('source_vision_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
-	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	many_faces = sort_and_filter_faces(processors.get_target_faces(inputs))
 
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
@@ -261,7 +283,7 @@ def process_frame(inputs : ExpressionRestorerInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_path : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
@@ -275,9 +297,11 @@ def process_frames(source_path : List[str], queue_payloads : List[QueuePayload],
 		{
 			'reference_faces': reference_faces,
 			'source_vision_frame': source_vision_frame,
+			'target_frame_number': queue_payload.get('frame_number'),
+			'target_faces': None,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
@@ -289,6 +313,8 @@ def process_image(source_path : str, target_path : str, output_path : str) -> No
 	{
 		'reference_faces': reference_faces,
 		'source_vision_frame': source_vision_frame,
+		'target_frame_number': None,
+		'target_faces': None,
 		'target_vision_frame': target_vision_frame
 	})
 	write_image(output_path, output_vision_frame)
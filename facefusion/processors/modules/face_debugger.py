@@ -1,5 +1,5 @@
 from argparse import ArgumentParser
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -8,16 +8,18 @@ import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
 import facefusion.processors.core as processors
 from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, logger, process_manager, state_manager, video_manager, wording
-from facefusion.face_analyser import get_many_faces, get_one_face
+from facefusion.face_analyser import get_one_face
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
 from facefusion.face_selector import find_similar_faces, sort_and_filter_faces
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import in_directory, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import FaceDebuggerInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.types import ApplyStateItem, Args, Face, InferencePool, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, Face, FaceAttribute, InferencePool, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, write_image
 
 
@@ -173,14 +175,28 @@ def debug_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFra
 	return temp_vision_frame
 
 
+def invalidates_face_geometry() -> bool:
+	return False
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	face_attributes : List[FaceAttribute] = [ 'gender', 'age', 'race' ]
+	return [ face_attribute for face_attribute in face_attributes if face_attribute in state_manager.get_item('face_debugger_items') ]
+
+
+def requires_target_faces() -> bool:
+	return True
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	pass
 
 
+@instrument('face_debugger.process_frame')
 def process_frame(inputs : FaceDebuggerInputs) -> VisionFrame:
 	reference_faces = inputs.get('reference_faces')
 	target_vision_frame = inputs.get('target_vision_frame')
-	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	many_faces = sort_and_filter_faces(processors.get_target_faces(inputs))
 
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
@@ -198,7 +214,7 @@ def process_frame(inputs : FaceDebuggerInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
@@ -207,9 +223,11 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
+			'target_frame_number': queue_payload.get('frame_number'),
+			'target_faces': None,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
@@ -219,6 +237,8 @@ def process_image(source_paths : List[str], target_path : str, output_path : str
 	output_vision_frame = process_frame(
 	{
 		'reference_faces': reference_faces,
+		'target_frame_number': None,
+		'target_faces': None,
 		'target_vision_frame': target_vision_frame
 	})
 	write_image(output_path, output_vision_frame)
@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import cv2
 import numpy
@@ -11,18 +11,20 @@ import facefusion.processors.core as processors
 from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, process_manager, state_manager, video_manager, wording
 from facefusion.common_helper import create_float_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
-from facefusion.face_analyser import get_many_faces, get_one_face
+from facefusion.face_analyser import get_one_face
 from facefusion.face_helper import paste_back, scale_face_landmark_5, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_box_mask
 from facefusion.face_selector import find_similar_faces, sort_and_filter_faces
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.live_portrait import create_rotation, limit_euler_angles, limit_expression
 from facefusion.processors.types import FaceEditorInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceLandmark68, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceAttribute, FaceLandmark68, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, write_image
 
 
@@ -116,6 +118,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return [ 'feature_extractor', 'motion_extractor', 'eye_retargeter', 'lip_retargeter' ]
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('face_editor_model')
 	return create_static_model_set('full').get(model_name)
@@ -232,11 +238,12 @@ def apply_edit(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLandmark6
 	return crop_vision_frame
 
 
+@instrument('face_editor.forward_extract_feature')
 def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
 	feature_extractor = get_inference_pool().get('feature_extractor')
 
-	with conditional_thread_semaphore():
-		feature_volume = feature_extractor.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(feature_extractor) as inference_session:
+		feature_volume = inference_session.run(None,
 		{
 			'input': crop_vision_frame
 		})[0]
@@ -244,11 +251,12 @@ def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeat
 	return feature_volume
 
 
+@instrument('face_editor.forward_extract_motion')
 def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
 	motion_extractor = get_inference_pool().get('motion_extractor')
 
-	with conditional_thread_semaphore():
-		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(motion_extractor) as inference_session:
+		pitch, yaw, roll, scale, translation, expression, motion_points = inference_session.run(None,
 		{
 			'input': crop_vision_frame
 		})
@@ -256,11 +264,12 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 	return pitch, yaw, roll, scale, translation, expression, motion_points
 
 
+@instrument('face_editor.forward_retarget_eye')
 def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	eye_retargeter = get_inference_pool().get('eye_retargeter')
 
-	with conditional_thread_semaphore():
-		eye_motion_points = eye_retargeter.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(eye_retargeter) as inference_session:
+		eye_motion_points = inference_session.run(None,
 		{
 			'input': eye_motion_points
 		})[0]
@@ -268,11 +277,12 @@ def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePo
 	return eye_motion_points
 
 
+@instrument('face_editor.forward_retarget_lip')
 def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	lip_retargeter = get_inference_pool().get('lip_retargeter')
 
-	with conditional_thread_semaphore():
-		lip_motion_points = lip_retargeter.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(lip_retargeter) as inference_session:
+		lip_motion_points = inference_session.run(None,
 		{
 			'input': lip_motion_points
 		})[0]
@@ -280,6 +290,7 @@ def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePo
 	return lip_motion_points
 
 
+@instrument('face_editor.forward_stitch_motion_points')
 def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	stitcher = get_inference_pool().get('stitcher')
 
@@ -293,6 +304,7 @@ def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints
 	return motion_points
 
 
+@instrument('face_editor.forward_generate_frame')
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
@@ -478,14 +490,27 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
+def invalidates_face_geometry() -> bool:
+	return True
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
+def requires_target_faces() -> bool:
+	return True
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	pass
 
 
+@instrument('face_editor.process_frame')
 def process_frame(inputs : FaceEditorInputs) -> VisionFrame:
 	reference_faces = inputs.get('reference_faces')
 	target_vision_frame = inputs.get('target_vision_frame')
-	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	many_faces = sort_and_filter_faces(processors.get_target_faces(inputs))
 
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
@@ -503,7 +528,7 @@ def process_frame(inputs : FaceEditorInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_path : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
@@ -512,9 +537,11 @@ def process_frames(source_path : List[str], queue_payloads : List[QueuePayload],
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
+			'target_frame_number': queue_payload.get('frame_number'),
+			'target_faces': None,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
@@ -524,6 +551,8 @@ def process_image(source_path : str, target_path : str, output_path : str) -> No
 	output_vision_frame = process_frame(
 	{
 		'reference_faces': reference_faces,
+		'target_frame_number': None,
+		'target_faces': None,
 		'target_vision_frame': target_vision_frame
 	})
 	write_image(output_path, output_vision_frame)
@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import cv2
 import numpy
@@ -19,13 +19,15 @@ from facefusion.face_masker import create_area_mask, create_box_mask, create_occ
 from facefusion.face_selector import find_similar_faces, sort_and_filter_faces, sort_faces_by_order
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import filter_image_paths, has_image, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.model_helper import get_static_model_initializer
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel_boost
 from facefusion.processors.types import FaceSwapperInputs
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, read_static_images, unpack_resolution, write_image
 
 
@@ -420,6 +422,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return list(get_model_options().get('sources').keys())
+
+
 def get_model_options() -> ModelOptions:
 	model_name = get_model_name()
 	return create_static_model_set('full').get(model_name)
@@ -537,6 +543,7 @@ def swap_face(source_face : Face, target_face : Face, temp_vision_frame : Vision
 	return temp_vision_frame
 
 
+@instrument('face_swapper.forward_swap_face')
 def forward_swap_face(source_face : Face, crop_vision_frame : VisionFrame) -> VisionFrame:
 	face_swapper = get_inference_pool().get('face_swapper')
 	model_type = get_model_options().get('type')
@@ -554,17 +561,17 @@ def forward_swap_face(source_face : Face, crop_vision_frame : VisionFrame) -> Vi
 		if face_swapper_input.name == 'target':
 			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
-	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
+	crop_vision_frame = inference_manager.run_inference(face_swapper, face_swapper_inputs)[0][0]
 
 	return crop_vision_frame
 
 
+@instrument('face_swapper.forward_convert_embedding')
 def forward_convert_embedding(embedding : Embedding) -> Embedding:
 	embedding_converter = get_inference_pool().get('embedding_converter')
 
-	with conditional_thread_semaphore():
-		embedding = embedding_converter.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(embedding_converter) as inference_session:
+		embedding = inference_session.run(None,
 		{
 			'input': embedding
 		})[0]
@@ -642,15 +649,28 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
+def invalidates_face_geometry() -> bool:
+	return False
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
+def requires_target_faces() -> bool:
+	return True
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	return swap_face(source_face, target_face, temp_vision_frame)
 
 
+@instrument('face_swapper.process_frame')
 def process_frame(inputs : FaceSwapperInputs) -> VisionFrame:
 	reference_faces = inputs.get('reference_faces')
 	source_face = inputs.get('source_face')
 	target_vision_frame = inputs.get('target_vision_frame')
-	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	many_faces = sort_and_filter_faces(processors.get_target_faces(inputs))
 
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
@@ -668,13 +688,13 @@ def process_frame(inputs : FaceSwapperInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 	source_frames = read_static_images(source_paths)
 	source_faces = []
 
 	for source_frame in source_frames:
-		temp_faces = get_many_faces([ source_frame ])
+		temp_faces = get_many_faces([ source_frame ], [ 'embedding' ])
 		temp_faces = sort_faces_by_order(temp_faces, 'large-small')
 		if temp_faces:
 			source_faces.append(get_first(temp_faces))
@@ -687,9 +707,11 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 		{
 			'reference_faces': reference_faces,
 			'source_face': source_face,
+			'target_frame_number': queue_payload.get('frame_number'),
+			'target_faces': None,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
@@ -699,7 +721,7 @@ def process_image(source_paths : List[str], target_path : str, output_path : str
 	source_faces = []
 
 	for source_frame in source_frames:
-		temp_faces = get_many_faces([ source_frame ])
+		temp_faces = get_many_faces([ source_frame ], [ 'embedding' ])
 		temp_faces = sort_faces_by_order(temp_faces, 'large-small')
 		if temp_faces:
 			source_faces.append(get_first(temp_faces))
@@ -709,6 +731,8 @@ def process_image(source_paths : List[str], target_path : str, output_path : str
 	{
 		'reference_faces': reference_faces,
 		'source_face': source_face,
+		'target_frame_number': None,
+		'target_faces': None,
 		'target_vision_frame': target_vision_frame
 	})
 	write_image(output_path, output_vision_frame)
@@ -1,6 +1,7 @@
+import threading
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List
+from typing import Dict, Iterable, List
 
 import cv2
 import numpy
@@ -13,13 +14,16 @@ from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import FrameEnhancerInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import create_tile_frames, merge_tile_frames, read_image, read_static_image, write_image
 
+MERGE_VISION_FRAME_SET : Dict[int, VisionFrame] = {}
+
 
 @lru_cache(maxsize = None)
 def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
@@ -418,6 +422,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return list(get_model_options().get('sources').keys())
+
+
 def get_model_options() -> ModelOptions:
 	model_name = get_frame_enhancer_model()
 	return create_static_model_set('full').get(model_name)
@@ -441,12 +449,14 @@ def register_args(program : ArgumentParser) -> None:
 	if group_processors:
 		group_processors.add_argument('--frame-enhancer-model', help = wording.get('help.frame_enhancer_model'), default = config.get_str_value('processors', 'frame_enhancer_model', 'span_kendata_x4'), choices = processors_choices.frame_enhancer_models)
 		group_processors.add_argument('--frame-enhancer-blend', help = wording.get('help.frame_enhancer_blend'), type = int, default = config.get_int_value('processors', 'frame_enhancer_blend', '80'), choices = processors_choices.frame_enhancer_blend_range, metavar = create_int_metavar(processors_choices.frame_enhancer_blend_range))
-		facefusion.jobs.job_store.register_step_keys([ 'frame_enhancer_model', 'frame_enhancer_blend' ])
+		group_processors.add_argument('--frame-enhancer-batch-size', help = wording.get('help.frame_enhancer_batch_size'), type = int, default = config.get_int_value('processors', 'frame_enhancer_batch_size', '4'), choices = processors_choices.frame_enhancer_batch_size_range, metavar = create_int_metavar(processors_choices.frame_enhancer_batch_size_range))
+		facefusion.jobs.job_store.register_step_keys([ 'frame_enhancer_model', 'frame_enhancer_blend', 'frame_enhancer_batch_size' ])
 
 
 def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('frame_enhancer_model', args.get('frame_enhancer_model'))
 	apply_state_item('frame_enhancer_blend', args.get('frame_enhancer_blend'))
+	apply_state_item('frame_enhancer_batch_size', args.get('frame_enhancer_batch_size'))
 
 
 def pre_check() -> bool:
@@ -472,6 +482,7 @@ def pre_process(mode : ProcessMode) -> bool:
 def post_process() -> None:
 	read_static_image.cache_clear()
 	video_manager.clear_video_pool()
+	MERGE_VISION_FRAME_SET.clear()
 	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
 		clear_inference_pool()
 	if state_manager.get_item('video_memory_strategy') == 'strict':
@@ -483,40 +494,59 @@ def enhance_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 	model_scale = get_model_options().get('scale')
 	temp_height, temp_width = temp_vision_frame.shape[:2]
 	tile_vision_frames, pad_width, pad_height = create_tile_frames(temp_vision_frame, model_size)
+	tile_batch_size = resolve_tile_batch_size()
 
-	for index, tile_vision_frame in enumerate(tile_vision_frames):
-		tile_vision_frame = prepare_tile_frame(tile_vision_frame)
-		tile_vision_frame = forward(tile_vision_frame)
-		tile_vision_frames[index] = normalize_tile_frame(tile_vision_frame)
+	for index in range(0, len(tile_vision_frames), tile_batch_size):
+		tile_batch_frames = prepare_tile_frames(tile_vision_frames[index:index + tile_batch_size])
+		tile_batch_frames = forward(tile_batch_frames)
+		tile_vision_frames[index:index + tile_batch_size] = normalize_tile_frames(tile_batch_frames)
 
-	merge_vision_frame = merge_tile_frames(tile_vision_frames, temp_width * model_scale, temp_height * model_scale, pad_width * model_scale, pad_height * model_scale, (model_size[0] * model_scale, model_size[1] * model_scale, model_size[2] * model_scale))
+	merge_vision_frame = get_merge_vision_frame(pad_width * model_scale, pad_height * model_scale)
+	merge_vision_frame = merge_tile_frames(tile_vision_frames, temp_width * model_scale, temp_height * model_scale, pad_width * model_scale, pad_height * model_scale, (model_size[0] * model_scale, model_size[1] * model_scale, model_size[2] * model_scale), merge_vision_frame)
 	temp_vision_frame = blend_frame(temp_vision_frame, merge_vision_frame)
 	return temp_vision_frame
 
 
-def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
+def resolve_tile_batch_size() -> int:
 	frame_enhancer = get_inference_pool().get('frame_enhancer')
 
-	with conditional_thread_semaphore():
-		tile_vision_frame = frame_enhancer.run(None,
-		{
-			'input': tile_vision_frame
-		})[0]
+	if inference_manager.has_dynamic_batch(frame_enhancer):
+		return state_manager.get_item('frame_enhancer_batch_size')
+	return 1
+
 
-	return tile_vision_frame
+def get_merge_vision_frame(pad_width : int, pad_height : int) -> VisionFrame:
+	merge_vision_frame = MERGE_VISION_FRAME_SET.get(threading.get_ident())
 
+	if merge_vision_frame is None or merge_vision_frame.shape[:2] != (pad_height, pad_width):
+		merge_vision_frame = numpy.zeros((pad_height, pad_width, 3), dtype = numpy.uint8)
+		MERGE_VISION_FRAME_SET[threading.get_ident()] = merge_vision_frame
+	return merge_vision_frame
+
+
+@instrument('frame_enhancer.forward')
+def forward(tile_batch_frames : VisionFrame) -> VisionFrame:
+	frame_enhancer = get_inference_pool().get('frame_enhancer')
+
+	tile_batch_frames = inference_manager.run_inference(frame_enhancer,
+	{
+		'input': tile_batch_frames
+	})[0]
 
-def prepare_tile_frame(vision_tile_frame : VisionFrame) -> VisionFrame:
-	vision_tile_frame = numpy.expand_dims(vision_tile_frame[:, :, ::-1], axis = 0)
-	vision_tile_frame = vision_tile_frame.transpose(0, 3, 1, 2)
-	vision_tile_frame = vision_tile_frame.astype(numpy.float32) / 255.0
-	return vision_tile_frame
+	return tile_batch_frames
 
 
-def normalize_tile_frame(vision_tile_frame : VisionFrame) -> VisionFrame:
-	vision_tile_frame = vision_tile_frame.transpose(0, 2, 3, 1).squeeze(0) * 255
-	vision_tile_frame = vision_tile_frame.clip(0, 255).astype(numpy.uint8)[:, :, ::-1]
-	return vision_tile_frame
+def prepare_tile_frames(tile_vision_frames : List[VisionFrame]) -> VisionFrame:
+	tile_batch_frames = numpy.stack(tile_vision_frames)[:, :, :, ::-1]
+	tile_batch_frames = tile_batch_frames.transpose(0, 3, 1, 2)
+	tile_batch_frames = tile_batch_frames.astype(numpy.float32) / 255.0
+	return tile_batch_frames
+
+
+def normalize_tile_frames(tile_batch_frames : VisionFrame) -> List[VisionFrame]:
+	tile_batch_frames = tile_batch_frames.transpose(0, 2, 3, 1) * 255
+	tile_batch_frames = tile_batch_frames.clip(0, 255).astype(numpy.uint8)[:, :, :, ::-1]
+	return list(tile_batch_frames)
 
 
 def blend_frame(temp_vision_frame : VisionFrame, merge_vision_frame : VisionFrame) -> VisionFrame:
@@ -526,16 +556,29 @@ def blend_frame(temp_vision_frame : VisionFrame, merge_vision_frame : VisionFram
 	return temp_vision_frame
 
 
+def invalidates_face_geometry() -> bool:
+	return True
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
+def requires_target_faces() -> bool:
+	return False
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	pass
 
 
+@instrument('frame_enhancer.process_frame')
 def process_frame(inputs : FrameEnhancerInputs) -> VisionFrame:
 	target_vision_frame = inputs.get('target_vision_frame')
 	return enhance_frame(target_vision_frame)
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
 		target_vision_frame = read_image(target_vision_path)
@@ -543,7 +586,7 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 		{
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
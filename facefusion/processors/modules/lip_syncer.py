@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -13,17 +13,19 @@ from facefusion.audio import create_empty_audio_frame, get_voice_frame, read_sta
 from facefusion.common_helper import create_float_metavar
 from facefusion.common_helper import get_first
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
-from facefusion.face_analyser import get_many_faces, get_one_face
+from facefusion.face_analyser import get_one_face
 from facefusion.face_helper import create_bounding_box, paste_back, warp_face_by_bounding_box, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask
 from facefusion.face_selector import find_similar_faces, sort_and_filter_faces
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import filter_audio_paths, has_audio, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.frame_journal import write_journal_frame
+from facefusion.instrumentation import instrument
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import LipSyncerInputs, LipSyncerWeight
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.types import ApplyStateItem, Args, AudioFrame, BoundingBox, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.types import ApplyStateItem, Args, AudioFrame, BoundingBox, DownloadScope, Face, FaceAttribute, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
 from facefusion.vision import read_image, read_static_image, restrict_video_fps, write_image
 
 
@@ -109,6 +111,10 @@ def clear_inference_pool() -> None:
 	inference_manager.clear_inference_pool(__name__, model_names)
 
 
+def resolve_pooled_model_names() -> List[str]:
+	return list(get_model_options().get('sources').keys())
+
+
 def get_model_options() -> ModelOptions:
 	model_name = state_manager.get_item('lip_syncer_model')
 	return create_static_model_set('full').get(model_name)
@@ -201,11 +207,12 @@ def sync_lip(target_face : Face, temp_audio_frame : AudioFrame, temp_vision_fram
 	return paste_vision_frame
 
 
+@instrument('lip_syncer.forward_edtalk')
 def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFrame, lip_syncer_weight : LipSyncerWeight) -> VisionFrame:
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
-	with conditional_thread_semaphore():
-		crop_vision_frame = lip_syncer.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(lip_syncer) as inference_session:
+		crop_vision_frame = inference_session.run(None,
 		{
 			'source': temp_audio_frame,
 			'target': crop_vision_frame,
@@ -215,11 +222,12 @@ def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFram
 	return crop_vision_frame
 
 
+@instrument('lip_syncer.forward_wav2lip')
 def forward_wav2lip(temp_audio_frame : AudioFrame, area_vision_frame : VisionFrame) -> VisionFrame:
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
-	with conditional_thread_semaphore():
-		area_vision_frame = lip_syncer.run(None,
+	with conditional_thread_semaphore(), inference_manager.checkout_inference_session(lip_syncer) as inference_session:
+		area_vision_frame = inference_session.run(None,
 		{
 			'source': temp_audio_frame,
 			'target': area_vision_frame
@@ -279,15 +287,28 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
+def invalidates_face_geometry() -> bool:
+	return True
+
+
+def get_demanded_face_attributes() -> List[FaceAttribute]:
+	return []
+
+
+def requires_target_faces() -> bool:
+	return True
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	pass
 
 
+@instrument('lip_syncer.process_frame')
 def process_frame(inputs : LipSyncerInputs) -> VisionFrame:
 	reference_faces = inputs.get('reference_faces')
 	source_audio_frame = inputs.get('source_audio_frame')
 	target_vision_frame = inputs.get('target_vision_frame')
-	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	many_faces = sort_and_filter_faces(processors.get_target_faces(inputs))
 
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
@@ -305,7 +326,7 @@ def process_frame(inputs : LipSyncerInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 	source_audio_path = get_first(filter_audio_paths(source_paths))
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
@@ -321,9 +342,11 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 		{
 			'reference_faces': reference_faces,
 			'source_audio_frame': source_audio_frame,
+			'target_frame_number': queue_payload.get('frame_number'),
+			'target_faces': None,
 			'target_vision_frame': target_vision_frame
 		})
-		write_image(target_vision_path, output_vision_frame)
+		write_journal_frame(queue_payload, output_vision_frame)
 		update_progress(1)
 
 
@@ -335,6 +358,8 @@ def process_image(source_paths : List[str], target_path : str, output_path : str
 	{
 		'reference_faces': reference_faces,
 		'source_audio_frame': source_audio_frame,
+		'target_frame_number': None,
+		'target_faces': None,
 		'target_vision_frame': target_vision_frame
 	})
 	write_image(output_path, output_vision_frame)
@@ -1,8 +1,8 @@
-from typing import Any, Dict, List, Literal, TypeAlias, TypedDict
+from typing import Any, Dict, List, Literal, Optional, TypeAlias, TypedDict
 
 from numpy.typing import NDArray
 
-from facefusion.types import AppContext, AudioFrame, Face, FaceSet, VisionFrame
+from facefusion.types import AppContext, AudioFrame, Face, FaceSet, QueuePayload, VisionFrame
 
 AgeModifierModel = Literal['styleganex_age']
 DeepSwapperModel : TypeAlias = str
@@ -20,38 +20,52 @@ FaceSwapperSet : TypeAlias = Dict[FaceSwapperModel, List[str]]
 AgeModifierInputs = TypedDict('AgeModifierInputs',
 {
 	'reference_faces' : FaceSet,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 DeepSwapperInputs = TypedDict('DeepSwapperInputs',
 {
 	'reference_faces' : FaceSet,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 ExpressionRestorerInputs = TypedDict('ExpressionRestorerInputs',
 {
 	'reference_faces' : FaceSet,
 	'source_vision_frame' : VisionFrame,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 FaceDebuggerInputs = TypedDict('FaceDebuggerInputs',
 {
 	'reference_faces' : FaceSet,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 FaceEditorInputs = TypedDict('FaceEditorInputs',
 {
 	'reference_faces' : FaceSet,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 FaceEnhancerInputs = TypedDict('FaceEnhancerInputs',
 {
 	'reference_faces' : FaceSet,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 FaceSwapperInputs = TypedDict('FaceSwapperInputs',
 {
 	'reference_faces' : FaceSet,
 	'source_face' : Face,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
 FrameColorizerInputs = TypedDict('FrameColorizerInputs',
@@ -66,8 +80,32 @@ LipSyncerInputs = TypedDict('LipSyncerInputs',
 {
 	'reference_faces' : FaceSet,
 	'source_audio_frame' : AudioFrame,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
 	'target_vision_frame' : VisionFrame
 })
+FaceContextInputs = TypedDict('FaceContextInputs',
+{
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
+	'target_vision_frame' : VisionFrame
+})
+ProcessorInputs = TypedDict('ProcessorInputs',
+{
+	'reference_faces' : FaceSet,
+	'source_face' : Face,
+	'source_audio_frame' : AudioFrame,
+	'source_vision_frame' : VisionFrame,
+	'target_frame_number' : Optional[int],
+	'target_faces' : List[Face],
+	'target_vision_frame' : VisionFrame
+})
+PipelineStageItem = TypedDict('PipelineStageItem',
+{
+	'queue_payload' : QueuePayload,
+	'vision_frame' : Optional[VisionFrame],
+	'processor_inputs' : Optional[ProcessorInputs]
+})
 
 ProcessorStateKey = Literal\
 [
@@ -103,6 +141,7 @@ ProcessorStateKey = Literal\
 	'frame_colorizer_blend',
 	'frame_enhancer_model',
 	'frame_enhancer_blend',
+	'frame_enhancer_batch_size',
 	'lip_syncer_model',
 	'lip_syncer_weight'
 ]
@@ -140,6 +179,7 @@ ProcessorState = TypedDict('ProcessorState',
 	'frame_colorizer_blend' : int,
 	'frame_enhancer_model' : FrameEnhancerModel,
 	'frame_enhancer_blend' : int,
+	'frame_enhancer_batch_size' : int,
 	'lip_syncer_model' : LipSyncerModel
 })
 ProcessorStateSet : TypeAlias = Dict[AppContext, ProcessorState]
@@ -40,7 +40,9 @@ def create_jobs_path_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_paths = program.add_argument_group('paths')
 	group_paths.add_argument('--jobs-path', help = wording.get('help.jobs_path'), default = config.get_str_value('paths', 'jobs_path', '.jobs'))
-	job_store.register_job_keys([ 'jobs_path' ])
+	group_paths.add_argument('--job-storage', help = wording.get('help.job_storage'), default = config.get_str_value('paths', 'job_storage', 'json'), choices = facefusion.choices.job_storages)
+	group_paths.add_argument('--job-cache-limit', help = wording.get('help.job_cache_limit'), type = int, default = config.get_int_value('paths', 'job_cache_limit', '0'), choices = facefusion.choices.job_cache_limit_range, metavar = create_int_metavar(facefusion.choices.job_cache_limit_range))
+	job_store.register_job_keys([ 'jobs_path', 'job_storage', 'job_cache_limit' ])
 	return program
 
 
@@ -101,7 +103,8 @@ def create_face_detector_program() -> ArgumentParser:
 	group_face_detector.add_argument('--face-detector-size', help = wording.get('help.face_detector_size'), default = config.get_str_value('face_detector', 'face_detector_size', get_last(face_detector_size_choices)), choices = face_detector_size_choices)
 	group_face_detector.add_argument('--face-detector-angles', help = wording.get('help.face_detector_angles'), type = int, default = config.get_int_list('face_detector', 'face_detector_angles', '0'), choices = facefusion.choices.face_detector_angles, nargs = '+', metavar = 'FACE_DETECTOR_ANGLES')
 	group_face_detector.add_argument('--face-detector-score', help = wording.get('help.face_detector_score'), type = float, default = config.get_float_value('face_detector', 'face_detector_score', '0.5'), choices = facefusion.choices.face_detector_score_range, metavar = create_float_metavar(facefusion.choices.face_detector_score_range))
-	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score' ])
+	group_face_detector.add_argument('--face-detector-interval', help = wording.get('help.face_detector_interval'), type = int, default = config.get_int_value('face_detector', 'face_detector_interval', '1'), choices = facefusion.choices.face_detector_interval_range, metavar = create_int_metavar(facefusion.choices.face_detector_interval_range))
+	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score', 'face_detector_interval' ])
 	return program
 
 
@@ -150,8 +153,14 @@ def create_frame_extraction_program() -> ArgumentParser:
 	group_frame_extraction.add_argument('--trim-frame-start', help = wording.get('help.trim_frame_start'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_start'))
 	group_frame_extraction.add_argument('--trim-frame-end', help = wording.get('help.trim_frame_end'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_end'))
 	group_frame_extraction.add_argument('--temp-frame-format', help = wording.get('help.temp_frame_format'), default = config.get_str_value('frame_extraction', 'temp_frame_format', 'png'), choices = facefusion.choices.temp_frame_formats)
+	group_frame_extraction.add_argument('--pipeline-mode', help = wording.get('help.pipeline_mode'), default = config.get_str_value('frame_extraction', 'pipeline_mode', 'sequential'), choices = facefusion.choices.pipeline_modes)
+	group_frame_extraction.add_argument('--pipeline-stage-workers', help = wording.get('help.pipeline_stage_workers'), type = int, default = config.get_int_list('frame_extraction', 'pipeline_stage_workers', '1 2 4 1'), choices = facefusion.choices.pipeline_stage_workers_range, nargs = 4, metavar = create_int_metavar(facefusion.choices.pipeline_stage_workers_range))
+	group_frame_extraction.add_argument('--video-segment-count', help = wording.get('help.video_segment_count'), type = int, default = config.get_int_value('frame_extraction', 'video_segment_count', '1'), choices = facefusion.choices.video_segment_count_range, metavar = create_int_metavar(facefusion.choices.video_segment_count_range))
+	group_frame_extraction.add_argument('--video-segment-workers', help = wording.get('help.video_segment_workers'), type = int, default = config.get_int_value('frame_extraction', 'video_segment_workers', '1'), choices = facefusion.choices.video_segment_workers_range, metavar = create_int_metavar(facefusion.choices.video_segment_workers_range))
+	group_frame_extraction.add_argument('--face-index-only', help = wording.get('help.face_index_only'), action = 'store_true', default = config.get_bool_value('frame_extraction', 'face_index_only'))
 	group_frame_extraction.add_argument('--keep-temp', help = wording.get('help.keep_temp'), action = 'store_true', default = config.get_bool_value('frame_extraction', 'keep_temp'))
-	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'keep_temp' ])
+	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'pipeline_mode', 'pipeline_stage_workers', 'face_index_only', 'keep_temp' ])
+	job_store.register_job_keys([ 'video_segment_count', 'video_segment_workers' ])
 	return program
 
 
@@ -177,7 +186,7 @@ def create_processors_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	available_processors = [ get_file_name(file_path) for file_path in resolve_file_paths('facefusion/processors/modules') ]
 	group_processors = program.add_argument_group('processors')
-	group_processors.add_argument('--processors', help = wording.get('help.processors').format(choices = ', '.join(available_processors)), default = config.get_str_list('processors', 'processors', 'face_swapper'), nargs = '+')
+	group_processors.add_argument('--processors', help = wording.get('help.processors').format(choices = ', '.join(available_processors)), default = config.get_str_list('processors', 'processors', 'face_swapper'), choices = available_processors, nargs = '+', metavar = 'PROCESSORS')
 	job_store.register_step_keys([ 'processors' ])
 	for processor_module in get_processors_modules(available_processors):
 		processor_module.register_args(program)
@@ -194,6 +203,16 @@ def create_uis_program() -> ArgumentParser:
 	return program
 
 
+def create_api_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_api = program.add_argument_group('api')
+	group_api.add_argument('--api-host', help = wording.get('help.api_host'), default = config.get_str_value('api', 'api_host', '127.0.0.1'))
+	group_api.add_argument('--api-port', help = wording.get('help.api_port'), type = int, default = config.get_int_value('api', 'api_port', '7870'))
+	group_api.add_argument('--api-queue-limit', help = wording.get('help.api_queue_limit'), type = int, default = config.get_int_value('api', 'api_queue_limit', '16'), choices = facefusion.choices.api_queue_limit_range, metavar = create_int_metavar(facefusion.choices.api_queue_limit_range))
+	group_api.add_argument('--api-output-path', help = wording.get('help.api_output_path'), default = config.get_str_value('api', 'api_output_path', '.outputs'))
+	return program
+
+
 def create_download_providers_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_download = program.add_argument_group('download')
@@ -215,6 +234,10 @@ def create_benchmark_program() -> ArgumentParser:
 	group_benchmark = program.add_argument_group('benchmark')
 	group_benchmark.add_argument('--benchmark-resolutions', help = wording.get('help.benchmark_resolutions'), default = config.get_str_list('benchmark', 'benchmark_resolutions', get_first(facefusion.choices.benchmark_resolutions)), choices = facefusion.choices.benchmark_resolutions, nargs = '+')
 	group_benchmark.add_argument('--benchmark-cycle-count', help = wording.get('help.benchmark_cycle_count'), type = int, default = config.get_int_value('benchmark', 'benchmark_cycle_count', '5'), choices = facefusion.choices.benchmark_cycle_count_range)
+	group_benchmark.add_argument('--benchmark-suite', help = wording.get('help.benchmark_suite'), default = config.get_str_value('benchmark', 'benchmark_suite', 'resolutions'), choices = facefusion.choices.benchmark_suites)
+	group_benchmark.add_argument('--benchmark-report-path', help = wording.get('help.benchmark_report_path'), default = config.get_str_value('benchmark', 'benchmark_report_path'))
+	group_benchmark.add_argument('--benchmark-compare-path', help = wording.get('help.benchmark_compare_path'), default = config.get_str_value('benchmark', 'benchmark_compare_path'))
+	group_benchmark.add_argument('--benchmark-regression-tolerance', help = wording.get('help.benchmark_regression_tolerance'), type = int, default = config.get_int_value('benchmark', 'benchmark_regression_tolerance', '10'), choices = facefusion.choices.benchmark_regression_tolerance_range, metavar = create_int_metavar(facefusion.choices.benchmark_regression_tolerance_range))
 	return program
 
 
@@ -226,7 +249,18 @@ def create_execution_program() -> ArgumentParser:
 	group_execution.add_argument('--execution-providers', help = wording.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution', 'execution_providers', get_first(available_execution_providers)), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = wording.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution', 'execution_thread_count', '4'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
 	group_execution.add_argument('--execution-queue-count', help = wording.get('help.execution_queue_count'), type = int, default = config.get_int_value('execution', 'execution_queue_count', '1'), choices = facefusion.choices.execution_queue_count_range, metavar = create_int_metavar(facefusion.choices.execution_queue_count_range))
-	job_store.register_job_keys([ 'execution_device_id', 'execution_providers', 'execution_thread_count', 'execution_queue_count' ])
+	group_execution.add_argument('--execution-worker-mode', help = wording.get('help.execution_worker_mode'), default = config.get_str_value('execution', 'execution_worker_mode', 'thread'), choices = facefusion.choices.execution_worker_modes)
+	group_execution.add_argument('--execution-schedule-mode', help = wording.get('help.execution_schedule_mode'), default = config.get_str_value('execution', 'execution_schedule_mode', 'locality'), choices = facefusion.choices.execution_schedule_modes)
+	group_execution.add_argument('--execution-batch-size', help = wording.get('help.execution_batch_size'), type = int, default = config.get_int_value('execution', 'execution_batch_size', '1'), choices = facefusion.choices.execution_batch_size_range, metavar = create_int_metavar(facefusion.choices.execution_batch_size_range))
+	group_execution.add_argument('--execution-batch-wait', help = wording.get('help.execution_batch_wait'), type = int, default = config.get_int_value('execution', 'execution_batch_wait', '5'), choices = facefusion.choices.execution_batch_wait_range, metavar = create_int_metavar(facefusion.choices.execution_batch_wait_range))
+	group_execution.add_argument('--execution-intra-op-thread-count', help = wording.get('help.execution_intra_op_thread_count'), type = int, default = config.get_int_value('execution', 'execution_intra_op_thread_count', '0'), choices = facefusion.choices.execution_op_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_op_thread_count_range))
+	group_execution.add_argument('--execution-inter-op-thread-count', help = wording.get('help.execution_inter_op_thread_count'), type = int, default = config.get_int_value('execution', 'execution_inter_op_thread_count', '0'), choices = facefusion.choices.execution_op_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_op_thread_count_range))
+	group_execution.add_argument('--execution-session-mode', help = wording.get('help.execution_session_mode'), default = config.get_str_value('execution', 'execution_session_mode', 'sequential'), choices = facefusion.choices.execution_session_modes)
+	group_execution.add_argument('--execution-graph-optimization', help = wording.get('help.execution_graph_optimization'), default = config.get_str_value('execution', 'execution_graph_optimization', 'all'), choices = facefusion.choices.execution_graph_optimizations)
+	group_execution.add_argument('--execution-memory-arena', help = wording.get('help.execution_memory_arena'), default = config.get_str_value('execution', 'execution_memory_arena', 'enabled'), choices = facefusion.choices.execution_memory_arenas)
+	group_execution.add_argument('--execution-graph-cache-path', help = wording.get('help.execution_graph_cache_path'), default = config.get_str_value('execution', 'execution_graph_cache_path'))
+	group_execution.add_argument('--execution-session-count', help = wording.get('help.execution_session_count'), type = int, default = config.get_int_value('execution', 'execution_session_count', '1'), choices = facefusion.choices.execution_session_count_range, metavar = create_int_metavar(facefusion.choices.execution_session_count_range))
+	job_store.register_job_keys([ 'execution_device_id', 'execution_providers', 'execution_thread_count', 'execution_queue_count', 'execution_worker_mode', 'execution_schedule_mode', 'execution_batch_size', 'execution_batch_wait', 'execution_intra_op_thread_count', 'execution_inter_op_thread_count', 'execution_session_mode', 'execution_graph_optimization', 'execution_memory_arena', 'execution_graph_cache_path', 'execution_session_count' ])
 	return program
 
 
@@ -235,7 +269,9 @@ def create_memory_program() -> ArgumentParser:
 	group_memory = program.add_argument_group('memory')
 	group_memory.add_argument('--video-memory-strategy', help = wording.get('help.video_memory_strategy'), default = config.get_str_value('memory', 'video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
 	group_memory.add_argument('--system-memory-limit', help = wording.get('help.system_memory_limit'), type = int, default = config.get_int_value('memory', 'system_memory_limit', '0'), choices = facefusion.choices.system_memory_limit_range, metavar = create_int_metavar(facefusion.choices.system_memory_limit_range))
-	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit' ])
+	group_memory.add_argument('--session-memory-limit', help = wording.get('help.session_memory_limit'), type = int, default = config.get_int_value('memory', 'session_memory_limit', '0'), choices = facefusion.choices.session_memory_limit_range, metavar = create_int_metavar(facefusion.choices.session_memory_limit_range))
+	group_memory.add_argument('--face-store-limit', help = wording.get('help.face_store_limit'), type = int, default = config.get_int_value('memory', 'face_store_limit', '1024'), choices = facefusion.choices.face_store_limit_range, metavar = create_int_metavar(facefusion.choices.face_store_limit_range))
+	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit', 'session_memory_limit', 'face_store_limit' ])
 	return program
 
 
@@ -247,6 +283,15 @@ def create_log_level_program() -> ArgumentParser:
 	return program
 
 
+def create_instrumentation_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_misc = program.add_argument_group('misc')
+	group_misc.add_argument('--instrument-stages', help = wording.get('help.instrument_stages'), action = 'store_true', default = config.get_bool_value('misc', 'instrument_stages'))
+	group_misc.add_argument('--trace-path', help = wording.get('help.trace_path'), default = config.get_str_value('misc', 'trace_path'))
+	job_store.register_job_keys([ 'instrument_stages', 'trace_path' ])
+	return program
+
+
 def create_halt_on_error_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_misc = program.add_argument_group('misc')
@@ -255,6 +300,23 @@ def create_halt_on_error_program() -> ArgumentParser:
 	return program
 
 
+def create_job_runner_workers_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_misc = program.add_argument_group('misc')
+	group_misc.add_argument('--job-runner-workers', help = wording.get('help.job_runner_workers'), type = int, default = config.get_int_value('misc', 'job_runner_workers', '1'), choices = facefusion.choices.job_runner_workers_range, metavar = create_int_metavar(facefusion.choices.job_runner_workers_range))
+	job_store.register_job_keys([ 'job_runner_workers' ])
+	return program
+
+
+def create_job_worker_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_misc = program.add_argument_group('misc')
+	group_misc.add_argument('--job-worker-interval', help = wording.get('help.job_worker_interval'), type = int, default = config.get_int_value('misc', 'job_worker_interval', '5'), choices = facefusion.choices.job_worker_interval_range, metavar = create_int_metavar(facefusion.choices.job_worker_interval_range))
+	group_misc.add_argument('--job-worker-memory-limit', help = wording.get('help.job_worker_memory_limit'), type = int, default = config.get_int_value('misc', 'job_worker_memory_limit', '0'), choices = facefusion.choices.job_worker_memory_limit_range, metavar = create_int_metavar(facefusion.choices.job_worker_memory_limit_range))
+	job_store.register_job_keys([ 'job_worker_interval', 'job_worker_memory_limit' ])
+	return program
+
+
 def create_job_id_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	program.add_argument('job_id', help = wording.get('help.job_id'))
@@ -279,7 +341,7 @@ def collect_step_program() -> ArgumentParser:
 
 
 def collect_job_program() -> ArgumentParser:
-	return ArgumentParser(parents = [ create_execution_program(), create_download_providers_program(), create_memory_program(), create_log_level_program() ], add_help = False)
+	return ArgumentParser(parents = [ create_execution_program(), create_download_providers_program(), create_memory_program(), create_log_level_program(), create_instrumentation_program() ], add_help = False)
 
 
 def create_program() -> ArgumentParser:
@@ -291,6 +353,7 @@ def create_program() -> ArgumentParser:
 	sub_program.add_parser('run', help = wording.get('help.run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_uis_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('headless-run', help = wording.get('help.headless_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('batch-run', help = wording.get('help.batch_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('api-run', help = wording.get('help.api_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_step_program(), create_api_program(), collect_job_program(), create_job_worker_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('force-download', help = wording.get('help.force_download'), parents = [ create_download_providers_program(), create_download_scope_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('benchmark', help = wording.get('help.benchmark'), parents = [ create_temp_path_program(), collect_step_program(), create_benchmark_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	# job manager
@@ -304,11 +367,13 @@ def create_program() -> ArgumentParser:
 	sub_program.add_parser('job-remix-step', help = wording.get('help.job_remix_step'), parents = [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-insert-step', help = wording.get('help.job_insert_step'), parents = [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-remove-step', help = wording.get('help.job_remove_step'), parents = [ create_job_id_program(), create_step_index_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-export', help = wording.get('help.job_export'), parents = [ create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
 	# job runner
 	sub_program.add_parser('job-run', help = wording.get('help.job_run'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program(), create_job_runner_workers_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-worker', help = wording.get('help.job_worker'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_job_worker_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-retry', help = wording.get('help.job_retry'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program(), create_job_runner_workers_program() ], formatter_class = create_help_formatter_large)
 	return ArgumentParser(parents = [ program ], formatter_class = create_help_formatter_small)
 
 
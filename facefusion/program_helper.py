@@ -1,5 +1,7 @@
-from argparse import ArgumentParser, _ArgumentGroup, _SubParsersAction
-from typing import Optional
+from argparse import Action, ArgumentParser, _ArgumentGroup, _SubParsersAction
+from typing import Any, Optional
+
+from facefusion.types import Args
 
 
 def find_argument_group(program : ArgumentParser, group_name : str) -> Optional[_ArgumentGroup]:
@@ -29,3 +31,32 @@ def validate_actions(program : ArgumentParser) -> bool:
 			elif action.default not in action.choices:
 				return False
 	return True
+
+
+def validate_step_args(program : ArgumentParser, step_args : Args) -> bool:
+	step_actions = { action.dest: action for action in program._actions }
+
+	for step_key, step_value in step_args.items():
+		if step_key not in step_actions or not validate_action_value(step_actions.get(step_key), step_value):
+			return False
+	return True
+
+
+def validate_action_value(action : Action, value : Any) -> bool:
+	if action.nargs == 0:
+		return isinstance(value, bool)
+	if action.nargs == '+' or isinstance(action.nargs, int):
+		if isinstance(value, list) and value and (action.nargs == '+' or len(value) == action.nargs):
+			return all(validate_action_item(action, item) for item in value)
+		return False
+	return validate_action_item(action, value)
+
+
+def validate_action_item(action : Action, value : Any) -> bool:
+	value_type = action.type or str
+
+	if value_type is float and isinstance(value, int) and not isinstance(value, bool):
+		value = float(value)
+	if isinstance(value_type, type) and isinstance(value, value_type) and not isinstance(value, bool):
+		return action.choices is None or value in action.choices
+	return False
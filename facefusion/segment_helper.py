@@ -0,0 +1,21 @@
+from typing import List
+
+from facefusion.types import VideoSegment
+
+
+def create_video_segments(trim_frame_start : int, trim_frame_end : int, keyframe_numbers : List[int], segment_count : int) -> List[VideoSegment]:
+	frame_total = trim_frame_end - trim_frame_start
+	segment_count = max(min(segment_count, frame_total), 1)
+	segment_frame_numbers = [ trim_frame_start ]
+
+	for index in range(1, segment_count):
+		split_frame_number = trim_frame_start + round(frame_total * index / segment_count)
+		split_keyframe_numbers = [ keyframe_number for keyframe_number in keyframe_numbers if trim_frame_start < keyframe_number < trim_frame_end ]
+
+		if split_keyframe_numbers:
+			split_frame_number = min(split_keyframe_numbers, key = lambda keyframe_number: abs(keyframe_number - split_frame_number))
+		if split_frame_number > segment_frame_numbers[-1]:
+			segment_frame_numbers.append(split_frame_number)
+
+	segment_frame_numbers.append(trim_frame_end)
+	return list(zip(segment_frame_numbers[:-1], segment_frame_numbers[1:]))
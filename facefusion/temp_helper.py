@@ -21,6 +21,11 @@ def resolve_temp_frame_paths(target_path : str) -> List[str]:
 	return resolve_file_pattern(temp_frames_pattern)
 
 
+def get_temp_journal_path(target_path : str, journal_key : str) -> str:
+	temp_directory_path = get_temp_directory_path(target_path)
+	return os.path.join(temp_directory_path, 'journal-' + journal_key + '.bin')
+
+
 def get_temp_frames_pattern(target_path : str, temp_frame_prefix : str) -> str:
 	temp_directory_path = get_temp_directory_path(target_path)
 	return os.path.join(temp_directory_path, temp_frame_prefix + '.' + state_manager.get_item('temp_frame_format'))
@@ -1,5 +1,8 @@
+import threading
+from array import array
 from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeAlias, TypedDict
+from queue import Queue
+from typing import Any, Callable, Deque, Dict, Iterable, List, Literal, Optional, OrderedDict, Set, Tuple, TypeAlias, TypedDict
 
 import cv2
 import numpy
@@ -32,6 +35,7 @@ Embedding : TypeAlias = NDArray[numpy.float64]
 Gender = Literal['female', 'male']
 Age : TypeAlias = range
 Race = Literal['white', 'black', 'latino', 'asian', 'indian', 'arabic']
+FaceAttribute = Literal['embedding', 'gender', 'age', 'race']
 Face = namedtuple('Face',
 [
 	'bounding_box',
@@ -42,12 +46,24 @@ Face = namedtuple('Face',
 	'normed_embedding',
 	'gender',
 	'age',
-	'race'
+	'race',
+	'track_id'
 ])
 FaceSet : TypeAlias = Dict[str, List[Face]]
+FaceIndex : TypeAlias = Dict[str, NDArray[Any]]
+FaceIndexSet : TypeAlias = Dict[int, List[Face]]
+FaceStoreStats = TypedDict('FaceStoreStats',
+{
+	'hits' : int,
+	'misses' : int,
+	'evictions' : int
+})
 FaceStore = TypedDict('FaceStore',
 {
-	'static_faces' : FaceSet,
+	'static_faces' : OrderedDict[str, List[Face]],
+	'static_face_scope' : Optional[str],
+	'static_face_stats' : FaceStoreStats,
+	'index_faces' : FaceIndexSet,
 	'reference_faces' : FaceSet
 })
 VideoPoolSet : TypeAlias = Dict[str, cv2.VideoCapture]
@@ -60,6 +76,15 @@ Matrix : TypeAlias = NDArray[Any]
 Anchors : TypeAlias = NDArray[Any]
 Translation : TypeAlias = NDArray[Any]
 
+FaceTracker = TypedDict('FaceTracker',
+{
+	'scene_vision_frame' : VisionFrame,
+	'faces' : List[Face],
+	'frame_count' : int
+})
+FaceTrackerKey : TypeAlias = Tuple[str, int]
+FaceTrackerSet : TypeAlias = Dict[FaceTrackerKey, FaceTracker]
+
 AudioBuffer : TypeAlias = bytes
 Audio : TypeAlias = NDArray[Any]
 AudioChunk : TypeAlias = NDArray[Any]
@@ -73,6 +98,7 @@ Duration : TypeAlias = float
 Padding : TypeAlias = Tuple[int, int, int, int]
 Orientation = Literal['landscape', 'portrait']
 Resolution : TypeAlias = Tuple[int, int]
+VideoSegment : TypeAlias = Tuple[int, int]
 
 ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 QueuePayload = TypedDict('QueuePayload',
@@ -81,9 +107,40 @@ QueuePayload = TypedDict('QueuePayload',
 	'frame_path' : str
 })
 Args : TypeAlias = Dict[str, Any]
+ApiResponse : TypeAlias = Tuple[int, Dict[str, Any]]
+ApiEnvironment : TypeAlias = Dict[str, Any]
+ApiStartResponse : TypeAlias = Callable[[str, List[Tuple[str, str]]], Any]
 UpdateProgress : TypeAlias = Callable[[int], None]
-ProcessFrames : TypeAlias = Callable[[List[str], List[QueuePayload], UpdateProgress], None]
+ProcessFrames : TypeAlias = Callable[[List[str], Iterable[QueuePayload], UpdateProgress], None]
+ProcessStreamFrame : TypeAlias = Callable[[int, VisionFrame], VisionFrame]
 ProcessStep : TypeAlias = Callable[[str, int, Args], bool]
+ScheduleMode = Literal['locality', 'fifo']
+FrameWorkerStats = TypedDict('FrameWorkerStats',
+{
+	'frame_total' : int,
+	'busy_time' : float,
+	'utilization' : float
+})
+FrameScheduler = TypedDict('FrameScheduler',
+{
+	'lock' : threading.Lock,
+	'worker_queues' : List[Deque[QueuePayload]],
+	'worker_stats' : Dict[int, FrameWorkerStats],
+	'start_time' : float
+})
+FrameJournalRecord : TypeAlias = Tuple[int, int]
+FrameJournal = TypedDict('FrameJournal',
+{
+	'journal_path' : Optional[str],
+	'journal_pass' : int,
+	'journal_records' : Set[FrameJournalRecord]
+})
+SpawnWorker = TypedDict('SpawnWorker',
+{
+	'payload_queue' : Any,
+	'progress_queue' : Any,
+	'stop_event' : Any
+})
 
 Content : TypeAlias = Dict[str, Any]
 
@@ -104,7 +161,7 @@ FaceDetectorModel = Literal['many', 'retinaface', 'scrfd', 'yolo_face']
 FaceLandmarkerModel = Literal['many', '2dfan4', 'peppa_wutz']
 FaceDetectorSet : TypeAlias = Dict[FaceDetectorModel, List[str]]
 FaceSelectorMode = Literal['many', 'one', 'reference']
-FaceSelectorOrder = Literal['left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best']
+FaceSelectorOrder = Literal['left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best', 'track']
 FaceOccluderModel = Literal['xseg_1', 'xseg_2', 'xseg_3']
 FaceParserModel = Literal['bisenet_resnet_18', 'bisenet_resnet_34']
 FaceMaskType = Literal['box', 'occlusion', 'area', 'region']
@@ -117,6 +174,17 @@ AudioFormat = Literal['flac', 'm4a', 'mp3', 'ogg', 'opus', 'wav']
 ImageFormat = Literal['bmp', 'jpeg', 'png', 'tiff', 'webp']
 VideoFormat = Literal['avi', 'm4v', 'mkv', 'mov', 'mp4', 'webm']
 TempFrameFormat = Literal['bmp', 'jpeg', 'png', 'tiff']
+PipelineMode = Literal['sequential', 'fused', 'staged', 'streaming']
+PipelineStage = Literal['read', 'analyse', 'process', 'write']
+PipelineStageState = TypedDict('PipelineStageState',
+{
+	'queue' : Queue[Any],
+	'queue_size' : int,
+	'queue_peak' : int,
+	'worker_total' : int,
+	'worker_active' : int
+})
+PipelineStageSet : TypeAlias = Dict[PipelineStage, PipelineStageState]
 AudioTypeSet : TypeAlias = Dict[AudioFormat, str]
 ImageTypeSet : TypeAlias = Dict[ImageFormat, str]
 VideoTypeSet : TypeAlias = Dict[VideoFormat, str]
@@ -141,6 +209,33 @@ BenchmarkCycleSet = TypedDict('BenchmarkCycleSet',
 	'slowest_run' : float,
 	'relative_fps' : float
 })
+BenchmarkSuite = Literal['resolutions', 'stages']
+BenchmarkStage = Literal['frame_extraction', 'frame_read', 'face_detection', 'face_landmarking', 'face_embedding', 'face_warping', 'face_swapping', 'face_masking', 'paste_back', 'frame_write', 'frame_merge']
+BenchmarkStageTimes : TypeAlias = Dict[BenchmarkStage, List[float]]
+BenchmarkStageMetrics = TypedDict('BenchmarkStageMetrics',
+{
+	'count' : int,
+	'mean' : float,
+	'p50' : float,
+	'p90' : float,
+	'p99' : float
+})
+BenchmarkStageReport = TypedDict('BenchmarkStageReport',
+{
+	'suite' : BenchmarkSuite,
+	'execution_providers' : List[str],
+	'cycle_count' : int,
+	'resolutions' : Dict[str, Dict[str, BenchmarkStageMetrics]]
+})
+BenchmarkRegression = TypedDict('BenchmarkRegression',
+{
+	'resolution' : str,
+	'stage' : str,
+	'baseline_p50' : float,
+	'current_p50' : float,
+	'difference' : float,
+	'is_regression' : bool
+})
 
 WebcamMode = Literal['inline', 'udp', 'v4l2']
 StreamMode = Literal['udp', 'v4l2']
@@ -152,7 +247,19 @@ ModelInitializer : TypeAlias = NDArray[Any]
 ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'rocm', 'tensorrt']
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet : TypeAlias = Dict[ExecutionProvider, ExecutionProviderValue]
+ExecutionWorkerMode = Literal['thread', 'process']
+ExecutionSessionMode = Literal['sequential', 'parallel']
+ExecutionGraphOptimization = Literal['disabled', 'basic', 'extended', 'all']
+ExecutionMemoryArena = Literal['enabled', 'disabled']
 InferenceSessionProvider : TypeAlias = Any
+InferenceSessionConfig = TypedDict('InferenceSessionConfig',
+{
+	'intra_op_thread_count' : int,
+	'inter_op_thread_count' : int,
+	'session_mode' : ExecutionSessionMode,
+	'graph_optimization' : ExecutionGraphOptimization,
+	'memory_arena' : ExecutionMemoryArena
+})
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
 	'value' : int,
@@ -213,6 +320,32 @@ AppContext = Literal['cli', 'ui']
 
 InferencePool : TypeAlias = Dict[str, InferenceSession]
 InferencePoolSet : TypeAlias = Dict[AppContext, Dict[str, InferencePool]]
+InferenceInputs : TypeAlias = Dict[str, Any]
+InferenceOutputs : TypeAlias = List[Any]
+InferenceRequest = TypedDict('InferenceRequest',
+{
+	'inputs' : InferenceInputs,
+	'outputs' : Optional[InferenceOutputs],
+	'error' : Optional[BaseException],
+	'event' : threading.Event
+})
+InferenceBatch = TypedDict('InferenceBatch',
+{
+	'condition' : threading.Condition,
+	'requests' : List[InferenceRequest],
+	'request_total' : int,
+	'dynamic_batch' : bool
+})
+InferenceBatchSet : TypeAlias = Dict[int, InferenceBatch]
+InferenceUsageSet : TypeAlias = Dict[str, float]
+InferenceLockSet : TypeAlias = Dict[str, threading.Lock]
+InferenceMemorySet : TypeAlias = Dict[str, int]
+InferenceSessionPool = TypedDict('InferenceSessionPool',
+{
+	'sessions' : List[InferenceSession],
+	'queue' : Queue[InferenceSession]
+})
+InferenceSessionPoolSet : TypeAlias = Dict[int, InferenceSessionPool]
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -222,12 +355,36 @@ JobStore = TypedDict('JobStore',
 	'step_keys' : List[str]
 })
 JobOutputSet : TypeAlias = Dict[str, List[str]]
-JobStatus = Literal['drafted', 'queued', 'completed', 'failed']
+JobStatus = Literal['drafted', 'queued', 'started', 'completed', 'failed']
 JobStepStatus = Literal['drafted', 'queued', 'started', 'completed', 'failed']
+JobStepCache = Literal['hit', 'miss']
+StageMetrics = TypedDict('StageMetrics',
+{
+	'count' : int,
+	'total' : float,
+	'p50' : float,
+	'p95' : float,
+	'p99' : float
+})
+StageMetricsSet : TypeAlias = Dict[str, StageMetrics]
+StageTimerSet : TypeAlias = Dict[str, 'array[float]']
+TraceEvent = TypedDict('TraceEvent',
+{
+	'name' : str,
+	'cat' : str,
+	'ph' : str,
+	'ts' : float,
+	'dur' : float,
+	'pid' : int,
+	'tid' : int,
+	'args' : Dict[str, Any]
+})
 JobStep = TypedDict('JobStep',
 {
 	'args' : Args,
-	'status' : JobStepStatus
+	'status' : JobStepStatus,
+	'cache' : Optional[JobStepCache],
+	'metrics' : Optional[StageMetricsSet]
 })
 Job = TypedDict('Job',
 {
@@ -237,6 +394,9 @@ Job = TypedDict('Job',
 	'steps' : List[JobStep]
 })
 JobSet : TypeAlias = Dict[str, Job]
+JobStorage = Literal['json', 'sqlite']
+JobRow : TypeAlias = Tuple[str, str, Optional[str]]
+StepRow : TypeAlias = Tuple[str, JobStepStatus, Optional[JobStepCache], Optional[str]]
 
 StateKey = Literal\
 [
@@ -244,6 +404,17 @@ StateKey = Literal\
 	'config_path',
 	'temp_path',
 	'jobs_path',
+	'job_cache_limit',
+	'job_runner_workers',
+	'job_worker_interval',
+	'job_worker_memory_limit',
+	'instrument_stages',
+	'trace_path',
+	'api_host',
+	'api_port',
+	'api_queue_limit',
+	'api_output_path',
+	'job_storage',
 	'source_paths',
 	'target_path',
 	'output_path',
@@ -254,10 +425,15 @@ StateKey = Literal\
 	'download_scope',
 	'benchmark_resolutions',
 	'benchmark_cycle_count',
+	'benchmark_suite',
+	'benchmark_report_path',
+	'benchmark_compare_path',
+	'benchmark_regression_tolerance',
 	'face_detector_model',
 	'face_detector_size',
 	'face_detector_angles',
 	'face_detector_score',
+	'face_detector_interval',
 	'face_landmarker_model',
 	'face_landmarker_score',
 	'face_selector_mode',
@@ -279,6 +455,11 @@ StateKey = Literal\
 	'trim_frame_start',
 	'trim_frame_end',
 	'temp_frame_format',
+	'pipeline_mode',
+	'pipeline_stage_workers',
+	'video_segment_count',
+	'video_segment_workers',
+	'face_index_only',
 	'keep_temp',
 	'output_image_quality',
 	'output_image_resolution',
@@ -298,13 +479,27 @@ StateKey = Literal\
 	'execution_providers',
 	'execution_thread_count',
 	'execution_queue_count',
+	'execution_worker_mode',
+	'execution_schedule_mode',
+	'execution_batch_size',
+	'execution_batch_wait',
+	'execution_intra_op_thread_count',
+	'execution_inter_op_thread_count',
+	'execution_session_mode',
+	'execution_graph_optimization',
+	'execution_memory_arena',
+	'execution_graph_cache_path',
+	'execution_session_count',
 	'video_memory_strategy',
 	'system_memory_limit',
+	'session_memory_limit',
+	'face_store_limit',
 	'log_level',
 	'halt_on_error',
 	'job_id',
 	'job_status',
-	'step_index'
+	'step_index',
+	'demanded_face_attributes'
 ]
 State = TypedDict('State',
 {
@@ -312,6 +507,17 @@ State = TypedDict('State',
 	'config_path' : str,
 	'temp_path' : str,
 	'jobs_path' : str,
+	'job_cache_limit' : int,
+	'job_runner_workers' : int,
+	'job_worker_interval' : int,
+	'job_worker_memory_limit' : int,
+	'instrument_stages' : bool,
+	'trace_path' : Optional[str],
+	'api_host' : str,
+	'api_port' : int,
+	'api_queue_limit' : int,
+	'api_output_path' : str,
+	'job_storage' : JobStorage,
 	'source_paths' : List[str],
 	'target_path' : str,
 	'output_path' : str,
@@ -322,10 +528,15 @@ State = TypedDict('State',
 	'download_scope': DownloadScope,
 	'benchmark_resolutions': List[BenchmarkResolution],
 	'benchmark_cycle_count': int,
+	'benchmark_suite': BenchmarkSuite,
+	'benchmark_report_path': Optional[str],
+	'benchmark_compare_path': Optional[str],
+	'benchmark_regression_tolerance': int,
 	'face_detector_model' : FaceDetectorModel,
 	'face_detector_size' : str,
 	'face_detector_angles' : List[Angle],
 	'face_detector_score' : Score,
+	'face_detector_interval' : int,
 	'face_landmarker_model' : FaceLandmarkerModel,
 	'face_landmarker_score' : Score,
 	'face_selector_mode' : FaceSelectorMode,
@@ -347,6 +558,11 @@ State = TypedDict('State',
 	'trim_frame_start' : int,
 	'trim_frame_end' : int,
 	'temp_frame_format' : TempFrameFormat,
+	'pipeline_mode' : PipelineMode,
+	'pipeline_stage_workers' : List[int],
+	'video_segment_count' : int,
+	'video_segment_workers' : int,
+	'face_index_only' : bool,
 	'keep_temp' : bool,
 	'output_image_quality' : int,
 	'output_image_resolution' : str,
@@ -366,13 +582,27 @@ State = TypedDict('State',
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
 	'execution_queue_count' : int,
+	'execution_worker_mode' : ExecutionWorkerMode,
+	'execution_schedule_mode' : ScheduleMode,
+	'execution_batch_size' : int,
+	'execution_batch_wait' : int,
+	'execution_intra_op_thread_count' : int,
+	'execution_inter_op_thread_count' : int,
+	'execution_session_mode' : ExecutionSessionMode,
+	'execution_graph_optimization' : ExecutionGraphOptimization,
+	'execution_memory_arena' : ExecutionMemoryArena,
+	'execution_graph_cache_path' : Optional[str],
+	'execution_session_count' : int,
 	'video_memory_strategy' : VideoMemoryStrategy,
 	'system_memory_limit' : int,
+	'session_memory_limit' : int,
+	'face_store_limit' : int,
 	'log_level' : LogLevel,
 	'halt_on_error' : bool,
 	'job_id' : str,
 	'job_status' : JobStatus,
-	'step_index' : int
+	'step_index' : int,
+	'demanded_face_attributes' : Optional[List[FaceAttribute]]
 })
 ApplyStateItem : TypeAlias = Callable[[Any, Any], None]
 StateSet : TypeAlias = Dict[AppContext, State]
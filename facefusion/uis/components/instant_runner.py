@@ -25,7 +25,7 @@ def render() -> None:
 	global INSTANT_RUNNER_STOP_BUTTON
 	global INSTANT_RUNNER_CLEAR_BUTTON
 
-	if job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 		is_instant_runner = state_manager.get_item('ui_workflow') == 'instant_runner'
 
 		with gradio.Row(visible = is_instant_runner) as INSTANT_RUNNER_WRAPPER:
@@ -78,7 +78,7 @@ def run() -> Tuple[gradio.Button, gradio.Button, gradio.Image, gradio.Video]:
 
 	if is_directory(step_args.get('output_path')):
 		step_args['output_path'] = suggest_output_path(step_args.get('output_path'), state_manager.get_item('target_path'))
-	if job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 		create_and_run_job(step_args)
 		state_manager.set_item('output_path', output_path)
 	if is_image(step_args.get('output_path')):
@@ -17,7 +17,7 @@ def render() -> None:
 	global JOB_LIST_JOBS_DATAFRAME
 	global JOB_LIST_REFRESH_BUTTON
 
-	if job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 		job_status = get_first(facefusion.choices.job_statuses)
 		job_headers, job_contents = job_list.compose_job_list(job_status)
 
@@ -15,7 +15,7 @@ JOB_LIST_JOB_STATUS_CHECKBOX_GROUP : Optional[gradio.CheckboxGroup] = None
 def render() -> None:
 	global JOB_LIST_JOB_STATUS_CHECKBOX_GROUP
 
-	if job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 		job_status = get_first(facefusion.choices.job_statuses)
 
 		JOB_LIST_JOB_STATUS_CHECKBOX_GROUP = gradio.CheckboxGroup(
@@ -29,7 +29,7 @@ def render() -> None:
 	global JOB_MANAGER_STEP_INDEX_DROPDOWN
 	global JOB_MANAGER_APPLY_BUTTON
 
-	if job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 		is_job_manager = state_manager.get_item('ui_workflow') == 'job_manager'
 		drafted_job_ids = job_manager.find_job_ids('drafted') or [ 'none' ]
 
@@ -27,7 +27,7 @@ def render() -> None:
 	global JOB_RUNNER_START_BUTTON
 	global JOB_RUNNER_STOP_BUTTON
 
-	if job_manager.init_jobs(state_manager.get_item('jobs_path')):
+	if job_manager.init_jobs(state_manager.get_item('jobs_path'), state_manager.get_item('job_storage')):
 		is_job_runner = state_manager.get_item('ui_workflow') == 'job_runner'
 		queued_job_ids = job_manager.find_job_ids('queued') or [ 'none' ]
 
@@ -15,6 +15,7 @@ from facefusion.face_selector import sort_faces_by_order
 from facefusion.face_store import clear_reference_faces, clear_static_faces, get_reference_faces
 from facefusion.filesystem import filter_audio_paths, is_image, is_video
 from facefusion.processors.core import get_processors_modules
+from facefusion.processors.types import ProcessorInputs
 from facefusion.types import AudioFrame, Face, FaceSet, VisionFrame
 from facefusion.uis.core import get_ui_component, get_ui_components, register_ui_component
 from facefusion.uis.types import ComponentOptions
@@ -43,7 +44,7 @@ def render() -> None:
 	conditional_append_reference_faces()
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 	source_frames = read_static_images(state_manager.get_item('source_paths'))
-	source_faces = get_many_faces(source_frames)
+	source_faces = get_many_faces(source_frames, [ 'embedding' ])
 	source_face = get_average_face(source_faces)
 	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
 	source_audio_frame = create_empty_audio_frame()
@@ -201,7 +202,7 @@ def update_preview_image(frame_number : int = 0) -> gradio.Image:
 	source_faces = []
 
 	for source_frame in source_frames:
-		temp_faces = get_many_faces([ source_frame ])
+		temp_faces = get_many_faces([ source_frame ], [ 'embedding' ])
 		temp_faces = sort_faces_by_order(temp_faces, 'large-small')
 		if temp_faces:
 			source_faces.append(get_first(temp_faces))
@@ -244,16 +245,22 @@ def process_preview_frame(reference_faces : FaceSet, source_face : Face, source_
 	if analyse_frame(target_vision_frame):
 		return cv2.GaussianBlur(target_vision_frame, (99, 99), 0)
 
+	processor_inputs : ProcessorInputs =\
+	{
+		'reference_faces': reference_faces,
+		'source_face': source_face,
+		'source_audio_frame': source_audio_frame,
+		'source_vision_frame': source_vision_frame,
+		'target_frame_number': None,
+		'target_faces': None,
+		'target_vision_frame': target_vision_frame
+	}
+
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		logger.disable()
 		if processor_module.pre_process('preview'):
-			target_vision_frame = processor_module.process_frame(
-			{
-				'reference_faces': reference_faces,
-				'source_face': source_face,
-				'source_audio_frame': source_audio_frame,
-				'source_vision_frame': source_vision_frame,
-				'target_vision_frame': target_vision_frame
-			})
+			processor_inputs['target_vision_frame'] = processor_module.process_frame(processor_inputs)
+			if processor_module.invalidates_face_geometry():
+				processor_inputs['target_faces'] = None
 		logger.enable()
-	return target_vision_frame
+	return processor_inputs.get('target_vision_frame')
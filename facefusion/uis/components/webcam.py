@@ -16,6 +16,7 @@ from facefusion.face_analyser import get_average_face, get_many_faces
 from facefusion.ffmpeg import open_ffmpeg
 from facefusion.filesystem import filter_image_paths, is_directory
 from facefusion.processors.core import get_processors_modules
+from facefusion.processors.types import ProcessorInputs
 from facefusion.types import Face, Fps, StreamMode, VisionFrame, WebcamMode
 from facefusion.uis.core import get_ui_component
 from facefusion.vision import normalize_frame_color, read_static_images, unpack_resolution
@@ -88,7 +89,7 @@ def start(webcam_device_id : int, webcam_mode : WebcamMode, webcam_resolution :
 	state_manager.set_item('face_selector_mode', 'one')
 	source_image_paths = filter_image_paths(state_manager.get_item('source_paths'))
 	source_frames = read_static_images(source_image_paths)
-	source_faces = get_many_faces(source_frames)
+	source_faces = get_many_faces(source_frames, [ 'embedding' ])
 	source_face = get_average_face(source_faces)
 	stream = None
 	webcam_capture = None
@@ -149,18 +150,25 @@ def stop() -> gradio.Image:
 
 def process_stream_frame(source_face : Face, target_vision_frame : VisionFrame) -> VisionFrame:
 	source_audio_frame = create_empty_audio_frame()
+	processor_inputs : ProcessorInputs =\
+	{
+		'reference_faces': None,
+		'source_face': source_face,
+		'source_audio_frame': source_audio_frame,
+		'source_vision_frame': None,
+		'target_frame_number': None,
+		'target_faces': None,
+		'target_vision_frame': target_vision_frame
+	}
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		logger.disable()
 		if processor_module.pre_process('stream'):
-			target_vision_frame = processor_module.process_frame(
-			{
-				'source_face': source_face,
-				'source_audio_frame': source_audio_frame,
-				'target_vision_frame': target_vision_frame
-			})
+			processor_inputs['target_vision_frame'] = processor_module.process_frame(processor_inputs)
+			if processor_module.invalidates_face_geometry():
+				processor_inputs['target_faces'] = None
 		logger.enable()
-	return target_vision_frame
+	return processor_inputs.get('target_vision_frame')
 
 
 def open_stream(stream_mode : StreamMode, stream_resolution : str, stream_fps : Fps) -> subprocess.Popen[bytes]:
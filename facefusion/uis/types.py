@@ -56,6 +56,7 @@ ComponentName = Literal\
 	'frame_colorizer_blend_slider',
 	'frame_colorizer_model_dropdown',
 	'frame_colorizer_size_dropdown',
+	'frame_enhancer_batch_size_slider',
 	'frame_enhancer_blend_slider',
 	'frame_enhancer_model_dropdown',
 	'job_list_job_status_checkbox_group',
@@ -9,6 +9,7 @@ from cv2.typing import Size
 import facefusion.choices
 from facefusion.common_helper import is_windows
 from facefusion.filesystem import get_file_extension, is_image, is_video
+from facefusion.instrumentation import instrument
 from facefusion.thread_helper import thread_semaphore
 from facefusion.types import Duration, Fps, Orientation, Resolution, VisionFrame
 from facefusion.video_manager import get_video_capture
@@ -28,6 +29,7 @@ def read_static_images(image_paths : List[str]) -> List[VisionFrame]:
 	return frames
 
 
+@instrument('image_read')
 def read_image(image_path : str) -> Optional[VisionFrame]:
 	if is_image(image_path):
 		if is_windows():
@@ -37,6 +39,7 @@ def read_image(image_path : str) -> Optional[VisionFrame]:
 	return None
 
 
+@instrument('image_write')
 def write_image(image_path : str, vision_frame : VisionFrame) -> bool:
 	if image_path:
 		if is_windows():
@@ -326,8 +329,9 @@ def create_tile_frames(vision_frame : VisionFrame, size : Size) -> Tuple[List[Vi
 	return tile_vision_frames, pad_width, pad_height
 
 
-def merge_tile_frames(tile_vision_frames : List[VisionFrame], temp_width : int, temp_height : int, pad_width : int, pad_height : int, size : Size) -> VisionFrame:
-	merge_vision_frame = numpy.zeros((pad_height, pad_width, 3)).astype(numpy.uint8)
+def merge_tile_frames(tile_vision_frames : List[VisionFrame], temp_width : int, temp_height : int, pad_width : int, pad_height : int, size : Size, merge_vision_frame : Optional[VisionFrame] = None) -> VisionFrame:
+	if merge_vision_frame is None:
+		merge_vision_frame = numpy.zeros((pad_height, pad_width, 3), dtype = numpy.uint8)
 	tile_width = tile_vision_frames[0].shape[1] - 2 * size[2]
 	tiles_per_row = min(pad_width // tile_width, len(tile_vision_frames))
 
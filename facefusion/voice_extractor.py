@@ -7,6 +7,7 @@ import scipy
 from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
+from facefusion.instrumentation import instrument
 from facefusion.thread_helper import thread_semaphore
 from facefusion.types import Audio, AudioChunk, DownloadScope, InferencePool, ModelOptions, ModelSet
 
@@ -85,6 +86,7 @@ def extract_voice(temp_audio_chunk : AudioChunk) -> AudioChunk:
 	return temp_audio_chunk
 
 
+@instrument('voice_extractor.forward')
 def forward(temp_audio_chunk : AudioChunk) -> AudioChunk:
 	voice_extractor = get_inference_pool().get('voice_extractor')
 
@@ -10,10 +10,13 @@ WORDING : Dict[str, Any] =\
 	'extracting_frames': 'Extracting frames with a resolution of {resolution} and {fps} frames per second',
 	'extracting_frames_succeed': 'Extracting frames succeed',
 	'extracting_frames_failed': 'Extracting frames failed',
+	'resuming_frames': 'Resuming with {frame_total} frames already processed',
 	'analysing': 'Analysing',
 	'extracting': 'Extracting',
 	'streaming': 'Streaming',
 	'processing': 'Processing',
+	'stage_queue_depth': 'Stage {stage} queue peaked at {queue_peak} of {queue_size}',
+	'worker_utilization': 'Worker {worker} processed {frame_total} frames at {utilization}% utilization',
 	'merging': 'Merging',
 	'downloading': 'Downloading',
 	'temp_frames_not_found': 'Temporary frames not found',
@@ -26,6 +29,11 @@ WORDING : Dict[str, Any] =\
 	'merging_video': 'Merging video with a resolution of {resolution} and {fps} frames per second',
 	'merging_video_succeed': 'Merging video succeed',
 	'merging_video_failed': 'Merging video failed',
+	'streaming_video': 'Streaming video with a resolution of {resolution} and {fps} frames per second',
+	'streaming_video_succeed': 'Streaming video succeed',
+	'streaming_video_failed': 'Streaming video failed',
+	'indexing_faces_succeed': 'Indexing faces succeed in {seconds} seconds',
+	'indexing_faces_failed': 'Indexing faces failed',
 	'skipping_audio': 'Skipping audio',
 	'replacing_audio_succeed': 'Replacing audio succeed',
 	'replacing_audio_skipped': 'Replacing audio skipped',
@@ -60,6 +68,9 @@ WORDING : Dict[str, Any] =\
 	'job_not_deleted': 'Job {job_id} not deleted',
 	'job_all_deleted': 'Jobs deleted',
 	'job_all_not_deleted': 'Jobs not deleted',
+	'job_all_exported': 'Jobs exported',
+	'job_recovered': 'Job {job_id} recovered from a stale claim',
+	'job_all_not_exported': 'Jobs not exported',
 	'job_step_added': 'Step added to job {job_id}',
 	'job_step_not_added': 'Step not added to job {job_id}',
 	'job_remix_step_added': 'Step {step_index} remixed from job {job_id}',
@@ -70,13 +81,25 @@ WORDING : Dict[str, Any] =\
 	'job_step_not_removed': 'Step {step_index} not removed from job {job_id}',
 	'running_job': 'Running queued job {job_id}',
 	'running_jobs': 'Running all queued jobs',
+	'watching_jobs': 'Watching queued jobs every {job_worker_interval} seconds',
+	'evicting_inference_context': 'Evicting inference context {inference_context}',
+	'api_listening': 'Listening for api requests on {api_host}:{api_port}',
+	'api_route_not_found': 'Route not found',
+	'api_invalid_request': 'Invalid request, expected steps with known step keys, valid step values, existing input paths and an output path inside the api output directory',
+	'api_queue_full': 'Queue is full, try again later',
+	'api_job_not_found': 'Job {job_id} not found',
+	'api_job_not_completed': 'Job {job_id} not completed',
+	'api_output_not_found': 'Output of job {job_id} not found',
+	'benchmark_regression': 'Stage {stage} at {resolution} regressed by {difference}%',
 	'retrying_job': 'Retrying failed job {job_id}',
 	'retrying_jobs': 'Retrying all failed jobs',
 	'processing_job_succeed': 'Processing of job {job_id} succeed',
 	'processing_jobs_succeed': 'Processing of all job succeed',
 	'processing_job_failed': 'Processing of job {job_id} failed',
+	'processing_job_crashed': 'Processing of job {job_id} crashed with {exception}',
 	'processing_jobs_failed': 'Processing of all jobs failed',
 	'processing_step': 'Processing step {step_current} of {step_total}',
+	'processing_segments': 'Processing {segment_total} segments with {worker_total} workers',
 	'validating_hash_succeed': 'Validating hash for {hash_file_name} succeed',
 	'validating_hash_failed': 'Validating hash for {hash_file_name} failed',
 	'validating_source_succeed': 'Validating source for {source_file_name} succeed',
@@ -100,6 +123,8 @@ WORDING : Dict[str, Any] =\
 		'config_path': 'choose the config file to override defaults',
 		'temp_path': 'specify the directory for the temporary resources',
 		'jobs_path': 'specify the directory to store jobs',
+		'job_storage': 'store the jobs as json files or inside an indexed sqlite database',
+		'job_cache_limit': 'limit the gigabytes of step outputs cached inside the jobs path (0 = disabled)',
 		'source_paths': 'choose the image or audio paths',
 		'target_path': 'choose the image or video path',
 		'output_path': 'specify the image or video within a directory',
@@ -112,6 +137,7 @@ WORDING : Dict[str, Any] =\
 		'face_detector_size': 'specify the frame size provided to the face detector',
 		'face_detector_angles': 'specify the angles to rotate the frame before detecting faces',
 		'face_detector_score': 'filter the detected faces base on the confidence score',
+		'face_detector_interval': 'run the face detector every given frames and track the faces with the face landmarker in between',
 		# face landmarker
 		'face_landmarker_model': 'choose the model responsible for detecting the face landmarks',
 		'face_landmarker_score': 'filter the detected face landmarks base on the confidence score',
@@ -137,6 +163,11 @@ WORDING : Dict[str, Any] =\
 		'trim_frame_start': 'specify the starting frame of the target video',
 		'trim_frame_end': 'specify the ending frame of the target video',
 		'temp_frame_format': 'specify the temporary resources format',
+		'pipeline_mode': 'process the frames once per processor, once for all processors, through parallel stages or stream them through memory',
+		'pipeline_stage_workers': 'specify the amount of workers for the read, analyse, process (inference and paste back) and write stage of the staged pipeline',
+		'video_segment_count': 'split the video at keyframes into segments that are processed as independent steps',
+		'video_segment_workers': 'specify the amount of segments to process in parallel',
+		'face_index_only': 'only build the face index of the target video to reuse it in later runs',
 		'keep_temp': 'keep the temporary resources after processing',
 		# output creation
 		'output_image_quality': 'specify the image quality which translates to the image compression',
@@ -183,6 +214,7 @@ WORDING : Dict[str, Any] =\
 		'frame_colorizer_blend': 'blend the colorized into the previous frame',
 		'frame_enhancer_model': 'choose the model responsible for enhancing the frame',
 		'frame_enhancer_blend': 'blend the enhanced into the previous frame',
+		'frame_enhancer_batch_size': 'specify the amount of tiles that are enhanced at once',
 		'lip_syncer_model': 'choose the model responsible for syncing the lips',
 		'lip_syncer_weight': 'specify the degree of weight applied to the lips',
 		# uis
@@ -195,21 +227,49 @@ WORDING : Dict[str, Any] =\
 		# benchmark
 		'benchmark_resolutions': 'choose the resolutions for the benchmarks (choices: {choices}, ...)',
 		'benchmark_cycle_count': 'specify the amount of cycles per benchmark',
+		'benchmark_suite': 'choose the benchmark suite to run end to end resolutions or separate stages on synthetic frames',
+		'benchmark_report_path': 'specify the path to write the benchmark report as json',
+		'benchmark_compare_path': 'specify the path of a baseline benchmark report to flag regressions against',
+		'benchmark_regression_tolerance': 'specify the percentage a stage can be slower than the baseline before it counts as regression',
 		# execution
 		'execution_device_id': 'specify the device used for processing',
 		'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 		'execution_thread_count': 'specify the amount of parallel threads while processing',
 		'execution_queue_count': 'specify the amount of frames each thread is processing',
+		'execution_worker_mode': 'run the frame workers as threads or as processes with their own inference pools',
+		'execution_schedule_mode': 'let the workers keep to neighbouring frames and steal from each other or pull from one shared queue',
+		'execution_batch_size': 'specify the maximum amount of concurrent inference requests that are batched per model',
+		'execution_batch_wait': 'specify the maximum milliseconds to wait for a batch to fill',
+		'execution_intra_op_thread_count': 'specify the amount of threads each inference session uses within an operator (0 = onnxruntime default)',
+		'execution_inter_op_thread_count': 'specify the amount of threads each inference session uses across operators (0 = onnxruntime default)',
+		'execution_session_mode': 'run the operators of an inference session sequentially or in parallel',
+		'execution_graph_optimization': 'specify the graph optimization level of the inference sessions',
+		'execution_memory_arena': 'enable or disable the cpu memory arena of the inference sessions',
+		'execution_graph_cache_path': 'specify the path to cache the optimized models',
+		'execution_session_count': 'specify the amount of inference sessions per model that the threads check out (0 = match the thread count)',
 		# memory
 		'video_memory_strategy': 'balance fast processing and low VRAM usage',
 		'system_memory_limit': 'limit the available RAM that can be used while processing',
+		'session_memory_limit': 'limit the gigabytes all models together may spend on their inference sessions (0 = no limit)',
+		'face_store_limit': 'limit the amount of frames to keep the analysed faces for (0 = unlimited)',
+		# api
+		'api_host': 'specify the host the api server binds to',
+		'api_port': 'specify the port the api server listens on',
+		'api_queue_limit': 'limit the amount of submitted jobs waiting to be processed',
+		'api_output_path': 'specify the directory the api jobs are allowed to write their outputs to',
 		# misc
 		'log_level': 'adjust the message severity displayed in the terminal',
 		'halt_on_error': 'halt the program once an error occurred',
+		'instrument_stages': 'measure the time spent in each stage and print a summary after processing',
+		'trace_path': 'specify the path to write a chrome trace of the processing threads as json',
+		'job_runner_workers': 'specify the amount of processes that claim and run queued jobs in parallel',
+		'job_worker_interval': 'specify the seconds the job worker waits before polling the queued jobs again',
+		'job_worker_memory_limit': 'limit the RAM in GB the job worker keeps warm inference sessions for (0 = unlimited)',
 		# run
 		'run': 'run the program',
 		'headless_run': 'run the program in headless mode',
 		'batch_run': 'run the program in batch mode',
+		'api_run': 'run the program in api mode',
 		'force_download': 'force automate downloads and exit',
 		'benchmark': 'benchmark the program',
 		# jobs
@@ -227,9 +287,11 @@ WORDING : Dict[str, Any] =\
 		'job_remix_step': 'remix a previous step from a drafted job',
 		'job_insert_step': 'insert a step to a drafted job',
 		'job_remove_step': 'remove a step from a drafted job',
+		'job_export': 'export all jobs from the sqlite storage to the json layout',
 		# job runner
 		'job_run': 'run a queued job',
 		'job_run_all': 'run all queued jobs',
+		'job_worker': 'watch and run queued jobs with warm inference sessions',
 		'job_retry': 'retry a failed job',
 		'job_retry_all': 'retry all failed jobs'
 	},
@@ -302,6 +364,7 @@ WORDING : Dict[str, Any] =\
 		'frame_colorizer_model_dropdown': 'FRAME COLORIZER MODEL',
 		'frame_colorizer_size_dropdown': 'FRAME COLORIZER SIZE',
 		'frame_enhancer_blend_slider': 'FRAME ENHANCER BLEND',
+		'frame_enhancer_batch_size_slider': 'FRAME ENHANCER BATCH SIZE',
 		'frame_enhancer_model_dropdown': 'FRAME ENHANCER MODEL',
 		'job_list_status_checkbox_group': 'JOB STATUS',
 		'job_manager_job_action_dropdown': 'JOB_ACTION',
@@ -0,0 +1,110 @@
+import json
+import threading
+from time import sleep
+from typing import Any, Dict, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from facefusion import api_server, state_manager
+from facefusion.exit_helper import hard_exit
+from facefusion.filesystem import copy_file
+from facefusion.jobs import job_store
+from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, get_job_status, init_jobs, submit_job
+from facefusion.types import Args
+from .helper import get_test_jobs_directory, get_test_output_file, get_test_outputs_directory, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	clear_jobs(get_test_jobs_directory())
+	init_jobs(get_test_jobs_directory())
+	prepare_test_output_directory()
+	job_store.register_step_keys([ 'target_path', 'output_path' ])
+	state_manager.init_item('temp_path', get_test_outputs_directory())
+	state_manager.init_item('job_worker_memory_limit', 0)
+	state_manager.init_item('api_host', '127.0.0.1')
+	state_manager.init_item('api_port', 0)
+	state_manager.init_item('api_queue_limit', 4)
+	state_manager.init_item('api_output_path', get_test_outputs_directory())
+	state_manager.init_item('config_path', 'facefusion.ini')
+
+	with open(get_test_output_file('target.jpg'), 'wb') as file:
+		file.write(b'target')
+
+
+def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
+	if step_args.get('face_detector_score') == 0.9:
+		hard_exit(1)
+	return copy_file(step_args.get('target_path'), step_args.get('output_path'))
+
+
+def send_request(api_url : str, request_method : str, request_body : Optional[Dict[str, Any]] = None) -> Tuple[int, bytes]:
+	request = Request(api_url, data = json.dumps(request_body).encode() if request_body else None, method = request_method)
+
+	try:
+		with urlopen(request) as response:
+			return response.status, response.read()
+	except HTTPError as exception:
+		return exception.code, exception.read()
+
+
+def test_api_server() -> None:
+	create_job('job-api-queued')
+	add_step('job-api-queued', { 'target_path': get_test_output_file('target.jpg'), 'output_path': get_test_output_file('output-queued.jpg') })
+	submit_job('job-api-queued')
+
+	api_instance = api_server.create_api_server({})
+	api_url = 'http://127.0.0.1:' + str(api_instance.server_port)
+	api_server.start_api_runner(process_step)
+	threading.Thread(target = api_instance.serve_forever, daemon = True).start()
+
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [] })[0] == 400
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'output_path': get_test_output_file('output.jpg'), 'invalid_key': True } ] })[0] == 400
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'target_path': get_test_output_file('target.jpg'), 'output_path': '../output.jpg' } ] })[0] == 400
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'target_path': get_test_output_file('target.jpg'), 'output_path': '/tmp/output.jpg' } ] })[0] == 400
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'target_path': get_test_output_file('invalid.jpg'), 'output_path': 'output.jpg' } ] })[0] == 400
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'target_path': get_test_output_file('target.jpg'), 'output_path': 'output.jpg', 'processors': [ 'invalid' ] } ] })[0] == 400
+	assert send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'target_path': get_test_output_file('target.jpg'), 'output_path': 'output.jpg', 'face_detector_score': 'invalid' } ] })[0] == 400
+
+	status_code, response_content = send_request(api_url + '/jobs', 'POST', { 'steps': [ { 'target_path': get_test_output_file('target.jpg'), 'output_path': 'output-crash.jpg', 'face_detector_score': 0.9 } ] })
+	crash_job_id = json.loads(response_content).get('job_id')
+
+	assert status_code == 202
+	assert send_request(api_url + '/jobs/job-invalid', 'GET')[0] == 404
+
+	status_code, response_content = send_request(api_url + '/jobs', 'POST',
+	{
+		'steps':
+		[
+			{
+				'target_path': get_test_output_file('target.jpg'),
+				'output_path': 'output.jpg'
+			}
+		]
+	})
+	job_id = json.loads(response_content).get('job_id')
+
+	assert status_code == 202
+
+	for _ in range(50):
+		if json.loads(send_request(api_url + '/jobs/' + job_id, 'GET')[1]).get('job_status') == 'completed':
+			break
+		sleep(0.1)
+
+	api_report = json.loads(send_request(api_url + '/jobs/' + job_id, 'GET')[1])
+
+	assert get_job_status('job-api-queued') == 'completed'
+	assert get_job_status(crash_job_id) == 'failed'
+	assert api_report.get('output_paths') == [ get_test_output_file('output.jpg') ]
+	assert api_report.get('step_total') == 1
+	assert api_report.get('step_completed') == 1
+	assert send_request(api_url + '/jobs/' + job_id + '/outputs/0', 'GET') == (200, b'target')
+	assert send_request(api_url + '/jobs/' + job_id + '/outputs/1', 'GET')[0] == 404
+
+	assert api_server.is_api_output(get_test_output_file('output.jpg')) is True
+	assert api_server.is_api_output(get_test_output_file('target.jpg') + '/../../target.jpg') is False
+
+	api_instance.shutdown()
+	api_instance.server_close()
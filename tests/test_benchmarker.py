@@ -0,0 +1,54 @@
+from facefusion.benchmarker import calc_stage_metrics, compare_stage_reports, resolve_benchmark_resolution
+from facefusion.types import BenchmarkStageReport
+
+
+def test_calc_stage_metrics() -> None:
+	stage_metrics = calc_stage_metrics([ float(stage_time) for stage_time in range(1, 101) ])
+
+	assert stage_metrics.get('count') == 100
+	assert stage_metrics.get('mean') == 50.5
+	assert stage_metrics.get('p50') == 50.5
+	assert stage_metrics.get('p90') == 90.1
+	assert stage_metrics.get('p99') == 99.01
+
+
+def test_compare_stage_reports() -> None:
+	baseline_report : BenchmarkStageReport =\
+	{
+		'suite': 'stages',
+		'execution_providers': [ 'cpu' ],
+		'cycle_count': 1,
+		'resolutions':
+		{
+			'240p':
+			{
+				'face_detection': { 'count': 25, 'mean': 10.0, 'p50': 10.0, 'p90': 10.0, 'p99': 10.0 },
+				'paste_back': { 'count': 25, 'mean': 2.0, 'p50': 2.0, 'p90': 2.0, 'p99': 2.0 }
+			}
+		}
+	}
+	benchmark_report : BenchmarkStageReport =\
+	{
+		'suite': 'stages',
+		'execution_providers': [ 'cpu' ],
+		'cycle_count': 1,
+		'resolutions':
+		{
+			'240p':
+			{
+				'face_detection': { 'count': 25, 'mean': 10.5, 'p50': 10.5, 'p90': 10.5, 'p99': 10.5 },
+				'paste_back': { 'count': 25, 'mean': 3.0, 'p50': 3.0, 'p90': 3.0, 'p99': 3.0 },
+				'frame_write': { 'count': 25, 'mean': 1.0, 'p50': 1.0, 'p90': 1.0, 'p99': 1.0 }
+			}
+		}
+	}
+	benchmark_regressions = compare_stage_reports(benchmark_report, baseline_report, 10)
+
+	assert [ benchmark_regression.get('stage') for benchmark_regression in benchmark_regressions ] == [ 'face_detection', 'paste_back' ]
+	assert [ benchmark_regression.get('difference') for benchmark_regression in benchmark_regressions ] == [ 5.0, 50.0 ]
+	assert [ benchmark_regression.get('is_regression') for benchmark_regression in benchmark_regressions ] == [ False, True ]
+
+
+def test_resolve_benchmark_resolution() -> None:
+	assert resolve_benchmark_resolution('240p') == (426, 240)
+	assert resolve_benchmark_resolution('1080p') == (1920, 1080)
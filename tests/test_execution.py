@@ -1,4 +1,6 @@
-from facefusion.execution import create_inference_session_providers, get_available_execution_providers, has_execution_provider
+from onnxruntime import ExecutionMode, GraphOptimizationLevel
+
+from facefusion.execution import create_inference_session_options, create_inference_session_providers, get_available_execution_providers, has_execution_provider
 
 
 def test_has_execution_provider() -> None:
@@ -22,3 +24,20 @@ def test_create_inference_session_providers() -> None:
 	]
 
 	assert create_inference_session_providers('1', [ 'cpu', 'cuda' ]) == inference_session_providers
+
+
+def test_create_inference_session_options() -> None:
+	inference_session_options = create_inference_session_options(
+	{
+		'intra_op_thread_count': 2,
+		'inter_op_thread_count': 1,
+		'session_mode': 'parallel',
+		'graph_optimization': 'basic',
+		'memory_arena': 'disabled'
+	})
+
+	assert inference_session_options.intra_op_num_threads == 2
+	assert inference_session_options.inter_op_num_threads == 1
+	assert inference_session_options.execution_mode == ExecutionMode.ORT_PARALLEL
+	assert inference_session_options.graph_optimization_level == GraphOptimizationLevel.ORT_ENABLE_BASIC
+	assert inference_session_options.enable_cpu_mem_arena is False
@@ -0,0 +1,80 @@
+import os
+import tempfile
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_index import get_face_index_directory_path, load_face_index, save_face_index
+from facefusion.jobs import job_manager
+from facefusion.types import Face, FaceIndexSet
+
+
+def create_test_face(offset : int) -> Face:
+	return Face(
+		bounding_box = numpy.array([ 10, 20, 110, 140 ]) + offset,
+		score_set =
+		{
+			'detector': 0.75,
+			'landmarker': 0.5
+		},
+		landmark_set =
+		{
+			'5': numpy.full((5, 2), offset),
+			'5/68': numpy.full((5, 2), offset + 1),
+			'68': numpy.full((68, 2), offset + 2),
+			'68/5': numpy.full((68, 2), offset + 3)
+		},
+		angle = 90,
+		embedding = numpy.full(512, offset),
+		normed_embedding = numpy.full(512, offset / 10),
+		gender = 'female',
+		age = range(20, 29),
+		race = 'asian',
+		track_id = offset
+	)
+
+
+def test_save_and_load_face_index() -> None:
+	face_index_path = os.path.join(tempfile.mkdtemp(), 'face_index', 'test.npz')
+	face_set : FaceIndexSet =\
+	{
+		2: [ create_test_face(3) ],
+		0: [ create_test_face(1), create_test_face(2) ],
+		1: []
+	}
+
+	assert save_face_index(face_index_path, face_set) is True
+
+	index_face_set = load_face_index(face_index_path)
+
+	assert list(index_face_set.keys()) == [ 0, 1, 2 ]
+	assert len(index_face_set.get(0)) == 2
+	assert index_face_set.get(1) == []
+
+	index_face = index_face_set.get(2)[0]
+
+	assert numpy.array_equal(index_face.bounding_box, [ 13, 23, 113, 143 ])
+	assert index_face.score_set.get('detector') == 0.75
+	assert index_face.landmark_set.get('68').shape == (68, 2)
+	assert index_face.angle == 90
+	assert index_face.embedding.shape == (512,)
+	assert index_face.gender == 'female'
+	assert index_face.age == range(20, 29)
+	assert index_face.race == 'asian'
+	assert index_face.track_id == 3
+
+
+def test_load_face_index_invalid() -> None:
+	assert load_face_index('invalid') == {}
+
+
+def test_get_face_index_directory_path(monkeypatch : pytest.MonkeyPatch) -> None:
+	state_manager.init_item('temp_path', os.path.join(tempfile.gettempdir(), 'job-test'))
+	monkeypatch.setattr(job_manager, 'JOBS_PATH', None)
+
+	assert get_face_index_directory_path() == os.path.join(tempfile.gettempdir(), 'job-test', 'facefusion', 'face_index')
+
+	monkeypatch.setattr(job_manager, 'JOBS_PATH', '.jobs')
+
+	assert get_face_index_directory_path() == os.path.join('.jobs', 'face_index')
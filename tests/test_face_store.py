@@ -0,0 +1,57 @@
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_store import clear_static_faces, create_frame_key, get_face_store, get_index_faces, get_static_face_stats, get_static_faces, scope_static_faces, set_index_faces, set_static_faces
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	state_manager.init_item('face_store_limit', 2)
+	clear_static_faces()
+
+
+def test_create_frame_key() -> None:
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+
+	assert create_frame_key(vision_frame) == create_frame_key(vision_frame.copy())
+	assert create_frame_key(vision_frame) != create_frame_key(vision_frame + 1)
+
+
+def test_get_and_set_static_faces() -> None:
+	set_static_faces('a', [])
+	set_static_faces('b', [])
+
+	assert get_static_faces('a') == []
+	assert get_static_faces('c') is None
+	assert get_static_face_stats().get('hits') == 1
+	assert get_static_face_stats().get('misses') == 1
+
+
+def test_set_static_faces_with_eviction() -> None:
+	set_static_faces('a', [])
+	set_static_faces('b', [])
+	get_static_faces('a')
+	set_static_faces('c', [])
+
+	assert list(get_face_store().get('static_faces').keys()) == [ 'a', 'c' ]
+	assert get_static_face_stats().get('evictions') == 1
+
+
+def test_get_index_faces() -> None:
+	set_index_faces({ 0: [] })
+
+	assert get_index_faces(0) == []
+	assert get_index_faces(1) is None
+
+
+def test_scope_static_faces() -> None:
+	scope_static_faces('target-240p.mp4')
+	set_static_faces('a', [])
+	scope_static_faces('target-240p.mp4')
+
+	assert get_static_faces('a') == []
+
+	scope_static_faces('target-1080p.mp4')
+
+	assert get_static_faces('a') is None
@@ -0,0 +1,114 @@
+from typing import List
+
+import numpy
+import pytest
+
+from facefusion import face_tracker, state_manager
+from facefusion.face_tracker import FACE_TRACKER_SET, assign_track_ids, calc_bounding_box_iou, clear_face_trackers, detect_scene_change, move_bounding_box, track_faces, update_face_tracker
+from facefusion.types import Face
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('target_path', 'target-240p.mp4')
+	state_manager.init_item('face_detector_interval', 2)
+	state_manager.init_item('face_selector_order', 'left-right')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_face_trackers()
+
+
+def create_test_face(bounding_box : List[int], track_id : int = None) -> Face:
+	return Face(
+		bounding_box = numpy.array(bounding_box),
+		score_set = None,
+		landmark_set = None,
+		angle = 0,
+		embedding = None,
+		normed_embedding = None,
+		gender = None,
+		age = None,
+		race = None,
+		track_id = track_id
+	)
+
+
+def test_calc_bounding_box_iou() -> None:
+	assert calc_bounding_box_iou(numpy.array([ 0, 0, 10, 10 ]), numpy.array([ 0, 0, 10, 10 ])) == 1.0
+	assert calc_bounding_box_iou(numpy.array([ 0, 0, 10, 10 ]), numpy.array([ 5, 0, 15, 10 ])) == 50 / 150
+	assert calc_bounding_box_iou(numpy.array([ 0, 0, 10, 10 ]), numpy.array([ 20, 20, 30, 30 ])) == 0.0
+
+
+def test_assign_track_ids() -> None:
+	previous_faces =\
+	[
+		create_test_face([ 0, 0, 100, 100 ], 7),
+		create_test_face([ 200, 0, 300, 100 ], 8)
+	]
+	faces =\
+	[
+		create_test_face([ 205, 5, 305, 105 ]),
+		create_test_face([ 5, 5, 105, 105 ]),
+		create_test_face([ 500, 500, 600, 600 ])
+	]
+	track_faces = assign_track_ids(faces, previous_faces)
+
+	assert track_faces[0].track_id == 8
+	assert track_faces[1].track_id == 7
+	assert track_faces[2].track_id not in [ 7, 8 ]
+
+
+def test_update_face_tracker() -> None:
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+	face = create_test_face([ 0, 0, 100, 100 ])
+	track_id = update_face_tracker(vision_frame, 0, [ face ])[0].track_id
+
+	assert update_face_tracker(vision_frame, 1, [ face ])[0].track_id == track_id
+	assert list(FACE_TRACKER_SET.keys()) == [ ('target-240p.mp4', 1) ]
+	assert update_face_tracker(vision_frame, 3, [ face ])[0].track_id != track_id
+	assert list(FACE_TRACKER_SET.keys()) == [ ('target-240p.mp4', 1), ('target-240p.mp4', 3) ]
+
+
+def test_track_faces_without_previous_frame() -> None:
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+	update_face_tracker(vision_frame, 0, [ create_test_face([ 0, 0, 100, 100 ]) ])
+
+	assert track_faces(vision_frame, 2) is None
+	assert track_faces(vision_frame, 0) is None
+
+
+def test_move_bounding_box() -> None:
+	previous_face_landmark_68 = numpy.array([ [ 10, 10 ], [ 30, 30 ] ])
+	face_landmark_68 = numpy.array([ [ 15, 20 ], [ 55, 60 ] ])
+
+	assert numpy.array_equal(move_bounding_box(numpy.array([ 0, 0, 40, 40 ]), previous_face_landmark_68, face_landmark_68), [ -5, 0, 75, 80 ])
+
+
+def test_detect_scene_change() -> None:
+	scene_vision_frame = numpy.zeros((64, 64), dtype = numpy.uint8)
+
+	assert detect_scene_change(scene_vision_frame, scene_vision_frame) is False
+	assert detect_scene_change(scene_vision_frame, scene_vision_frame + 255) is True
+
+
+def test_update_face_tracker_with_limit(monkeypatch : pytest.MonkeyPatch) -> None:
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+	monkeypatch.setattr(face_tracker, 'FACE_TRACKER_LIMIT', 2)
+
+	for frame_number in [ 0, 2, 4, 6 ]:
+		update_face_tracker(vision_frame, frame_number, [ create_test_face([ 0, 0, 100, 100 ]) ])
+
+	assert list(FACE_TRACKER_SET.keys()) == [ ('target-240p.mp4', 4), ('target-240p.mp4', 6) ]
+
+
+def test_update_face_tracker_without_tracking() -> None:
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+	state_manager.set_item('face_detector_interval', 1)
+
+	assert update_face_tracker(vision_frame, 0, [ create_test_face([ 0, 0, 100, 100 ]) ])[0].track_id is None
+	assert track_faces(vision_frame, 1) is None
+	assert FACE_TRACKER_SET == {}
+
+	state_manager.set_item('face_detector_interval', 2)
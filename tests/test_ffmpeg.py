@@ -7,10 +7,12 @@ import pytest
 import facefusion.ffmpeg
 from facefusion import process_manager, state_manager
 from facefusion.download import conditional_download
-from facefusion.ffmpeg import concat_video, extract_frames, merge_video, read_audio_buffer, replace_audio, restore_audio
+from facefusion.ffmpeg import concat_video, extract_frames, merge_video, open_frame_reader, open_frame_writer, read_audio_buffer, replace_audio, restore_audio
 from facefusion.filesystem import copy_file
+from facefusion.processors.core import multi_stream_frames
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, resolve_temp_frame_paths
 from facefusion.types import EncoderSet
+from facefusion.vision import count_video_frame_total
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -115,6 +117,27 @@ def test_merge_video() -> None:
 	state_manager.init_item('output_video_encoder', 'libx264')
 
 
+def test_stream_video() -> None:
+	test_set =\
+	[
+		(get_test_example_file('target-240p-25fps.mp4'), 0, 270, 324),
+		(get_test_example_file('target-240p-25fps.mp4'), 124, 224, 120),
+		(get_test_example_file('target-240p-30fps.mp4'), 0, 100, 100)
+	]
+	state_manager.init_item('execution_thread_count', 4)
+	state_manager.init_item('execution_queue_count', 1)
+
+	for target_path, trim_frame_start, trim_frame_end, frame_total in test_set:
+		create_temp_directory(target_path)
+		frame_reader = open_frame_reader(target_path, '452x240', 30.0, trim_frame_start, trim_frame_end)
+		frame_writer = open_frame_writer(target_path, 30.0, '452x240', 30.0)
+
+		assert multi_stream_frames(frame_reader, frame_writer, (452, 240), (452, 240), frame_total, lambda frame_number, vision_frame: vision_frame) is True
+		assert count_video_frame_total(get_temp_file_path(target_path)) == frame_total
+
+		clear_temp_directory(target_path)
+
+
 def test_concat_video() -> None:
 	output_path = get_test_output_file('test-concat-video.mp4')
 	temp_output_paths =\
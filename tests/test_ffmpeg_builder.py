@@ -1,7 +1,7 @@
 from shutil import which
 
 from facefusion import ffmpeg_builder
-from facefusion.ffmpeg_builder import chain, run, select_frame_range, set_audio_quality, set_audio_sample_size, set_stream_mode, set_video_quality
+from facefusion.ffmpeg_builder import chain, pipe_video, run, select_frame_range, set_audio_quality, set_audio_sample_size, set_stream_mode, set_video_quality
 
 
 def test_run() -> None:
@@ -17,6 +17,10 @@ def test_set_stream_mode() -> None:
 	assert set_stream_mode('v4l2') == [ '-f', 'v4l2' ]
 
 
+def test_pipe_video() -> None:
+	assert pipe_video() == [ '-f', 'rawvideo', '-pix_fmt', 'bgr24' ]
+
+
 def test_select_frame_range() -> None:
 	assert select_frame_range(0, None, 30) == [ '-vf', 'trim=start_frame=0,fps=30' ]
 	assert select_frame_range(None, 100, 30) == [ '-vf', 'trim=end_frame=100,fps=30' ]
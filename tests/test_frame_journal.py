@@ -0,0 +1,91 @@
+import os
+
+import cv2
+import numpy
+import pytest
+
+from facefusion import process_manager
+from facefusion.frame_journal import append_frame_journal, close_frame_journal, count_frame_journal, create_frame_journal, is_frame_journaled, iterate_frame_journal, open_frame_journal, select_frame_journal_pass, write_journal_frame
+from facefusion.processors.core import create_queue_payloads
+from facefusion.vision import read_image
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	prepare_test_output_directory()
+	close_frame_journal()
+	process_manager.start()
+
+
+def test_open_frame_journal() -> None:
+	journal_path = get_test_output_file('journal.bin')
+
+	assert open_frame_journal(journal_path) is False
+	assert create_frame_journal(journal_path) is True
+	assert open_frame_journal(journal_path) is True
+
+	append_frame_journal(1)
+	select_frame_journal_pass(1)
+	append_frame_journal(2)
+
+	with open(journal_path, 'ab') as journal_file:
+		journal_file.write(b'\x00\x00')
+
+	assert open_frame_journal(journal_path) is True
+	assert count_frame_journal(0) == 1
+	assert count_frame_journal(1) == 1
+	assert is_frame_journaled(1) is True
+	assert is_frame_journaled(2) is False
+
+	select_frame_journal_pass(1)
+
+	assert is_frame_journaled(1) is False
+	assert is_frame_journaled(2) is True
+
+	close_frame_journal()
+
+
+def test_iterate_frame_journal() -> None:
+	journal_path = get_test_output_file('journal.bin')
+	create_frame_journal(journal_path)
+	open_frame_journal(journal_path)
+	temp_frame_paths = [ get_test_output_file(str(index) + '.png') for index in range(4) ]
+	vision_frame = numpy.full((8, 8, 3), 128, dtype = numpy.uint8)
+
+	for queue_payload in iterate_frame_journal(create_queue_payloads(temp_frame_paths)):
+		if queue_payload.get('frame_number') == 2:
+			process_manager.stop()
+			break
+		assert write_journal_frame(queue_payload, vision_frame) is True
+
+	open_frame_journal(journal_path)
+
+	assert [ queue_payload.get('frame_number') for queue_payload in create_queue_payloads(temp_frame_paths) ] == [ 2, 3 ]
+	assert numpy.array_equal(read_image(temp_frame_paths[0]), vision_frame)
+	assert os.path.exists(temp_frame_paths[0] + '.0.tmp') is False
+	assert os.path.exists(temp_frame_paths[2]) is False
+
+	close_frame_journal()
+
+
+def test_restore_journal_frame() -> None:
+	journal_path = get_test_output_file('journal.bin')
+	create_frame_journal(journal_path)
+	open_frame_journal(journal_path)
+	temp_frame_paths = [ get_test_output_file(str(index) + '.png') for index in range(2) ]
+	vision_frame = numpy.full((8, 8, 3), 128, dtype = numpy.uint8)
+
+	select_frame_journal_pass(1)
+
+	with open(temp_frame_paths[0] + '.1.tmp', 'wb') as temp_frame_file:
+		temp_frame_file.write(cv2.imencode('.png', vision_frame)[1].tobytes())
+	append_frame_journal(0)
+	open_frame_journal(journal_path)
+	select_frame_journal_pass(1)
+
+	assert [ queue_payload.get('frame_number') for queue_payload in create_queue_payloads(temp_frame_paths) ] == [ 1 ]
+	assert numpy.array_equal(read_image(temp_frame_paths[0]), vision_frame)
+	assert os.path.exists(temp_frame_paths[0] + '.1.tmp') is False
+
+	close_frame_journal()
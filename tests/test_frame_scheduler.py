@@ -0,0 +1,32 @@
+from facefusion.frame_scheduler import claim_queue_payloads, create_frame_scheduler, finalize_worker_stats, record_worker_stats
+from facefusion.processors.core import create_queue_payloads
+
+
+def test_claim_queue_payloads_with_locality() -> None:
+	frame_scheduler = create_frame_scheduler(create_queue_payloads([ str(index) for index in range(8) ]), 2, 'locality')
+
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 0, 2) ] == [ 0, 1 ]
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 1, 2) ] == [ 4, 5 ]
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 0, 2) ] == [ 2, 3 ]
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 0, 2) ] == [ 7 ]
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 1, 2) ] == [ 6 ]
+	assert claim_queue_payloads(frame_scheduler, 1, 2) == []
+
+
+def test_claim_queue_payloads_with_fifo() -> None:
+	frame_scheduler = create_frame_scheduler(create_queue_payloads([ str(index) for index in range(3) ]), 2, 'fifo')
+
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 1, 2) ] == [ 0, 1 ]
+	assert [ queue_payload.get('frame_number') for queue_payload in claim_queue_payloads(frame_scheduler, 0, 2) ] == [ 2 ]
+	assert claim_queue_payloads(frame_scheduler, 0, 2) == []
+
+
+def test_finalize_worker_stats() -> None:
+	frame_scheduler = create_frame_scheduler([], 2, 'fifo')
+	record_worker_stats(frame_scheduler, 1, 2, 0.0)
+	record_worker_stats(frame_scheduler, 0, 3, 0.0)
+	record_worker_stats(frame_scheduler, 1, 4, 0.0)
+	worker_stats_list = finalize_worker_stats(frame_scheduler)
+
+	assert [ worker_stats.get('frame_total') for worker_stats in worker_stats_list ] == [ 3, 6 ]
+	assert worker_stats_list[0].get('utilization') == 0.0
@@ -1,10 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, sleep
+from types import SimpleNamespace
+from typing import Any, List
 from unittest.mock import patch
 
+import numpy
 import pytest
 from onnxruntime import InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.inference_manager import INFERENCE_POOL_SET, get_inference_pool
+from facefusion.inference_manager import INFERENCE_MEMORY_SET, INFERENCE_POOL_SET, INFERENCE_SESSION_POOL_SET, clear_inference_pool, create_inference_session_pool, get_inference_pool, reserve_inference_session_count, resolve_pooled_model_names, run_inference, warm_up_inference_pool
+from facefusion.types import InferenceInputs, InferenceOutputs
+
+
+class FakeInferenceSession:
+	def __init__(self, batch_size : Any, is_failing : bool = False, run_delay : float = 0) -> None:
+		self.batch_size = batch_size
+		self.is_failing = is_failing
+		self.run_delay = run_delay
+		self.run_batch_sizes : List[int] = []
+
+	def get_inputs(self) -> List[SimpleNamespace]:
+		return [ SimpleNamespace(name = 'input', shape = [ self.batch_size, 2 ], type = 'tensor(float)') ]
+
+	def get_outputs(self) -> List[SimpleNamespace]:
+		return [ SimpleNamespace(name = 'output', shape = [ self.batch_size, 2 ]) ]
+
+	def run(self, output_names : Any, inference_inputs : InferenceInputs) -> InferenceOutputs:
+		self.run_batch_sizes.append(len(inference_inputs.get('input')))
+		sleep(self.run_delay)
+		if self.is_failing:
+			raise RuntimeError('inference failed')
+		return [ numpy.asarray(inference_inputs.get('input')) * 2 ]
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -12,6 +39,8 @@ def before_all() -> None:
 	state_manager.init_item('execution_device_id', '0')
 	state_manager.init_item('execution_providers', [ 'cpu' ])
 	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('execution_batch_size', 1)
+	state_manager.init_item('execution_batch_wait', 50)
 	content_analyser.pre_check()
 
 
@@ -30,3 +59,140 @@ def test_get_inference_pool() -> None:
 		assert isinstance(INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1'), InferenceSession)
 
 	assert INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1') == INFERENCE_POOL_SET.get('ui').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1')
+
+
+def test_get_inference_pool_single_flight() -> None:
+	model_names = [ 'nsfw_1' ]
+	_, model_source_set = content_analyser.collect_model_downloads()
+	inference_pools = []
+
+	def create_inference_pool(*args : Any) -> Any:
+		sleep(0.1)
+		inference_pools.append({ 'nsfw_1': FakeInferenceSession(1) })
+		return inference_pools[-1]
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'), patch('facefusion.inference_manager.create_inference_pool', side_effect = create_inference_pool):
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			inference_pool_list = list(executor.map(lambda _ : get_inference_pool('facefusion.content_analyser', model_names, model_source_set), range(4)))
+
+		clear_inference_pool('facefusion.content_analyser', model_names)
+
+	assert len(inference_pools) == 1
+	assert all(inference_pool is inference_pools[0] for inference_pool in inference_pool_list)
+
+
+def test_resolve_pooled_model_names() -> None:
+	assert resolve_pooled_model_names('facefusion.content_analyser') == [ 'nsfw_1', 'nsfw_2', 'nsfw_3' ]
+	assert resolve_pooled_model_names('facefusion.processors.modules.expression_restorer') == [ 'feature_extractor', 'motion_extractor' ]
+	assert resolve_pooled_model_names('facefusion.face_detector') == []
+
+
+def test_warm_up_inference_pool() -> None:
+	inference_session = FakeInferenceSession('batch')
+
+	assert warm_up_inference_pool({ 'test': inference_session }) is True  # type:ignore[dict-item]
+	assert inference_session.run_batch_sizes == [ 1 ]
+
+
+def test_create_inference_session_pool() -> None:
+	inference_sessions = [ FakeInferenceSession(1), FakeInferenceSession(1) ]
+	inference_inputs_list = [ { 'input': numpy.full((1, 2), index, dtype = numpy.float32) } for index in range(8) ]
+
+	for inference_session in inference_sessions:
+		inference_session.run_delay = 0.05
+
+	with patch('facefusion.inference_manager.create_inference_session', side_effect = inference_sessions):
+		inference_session = create_inference_session_pool('model.onnx', '0', [ 'cpu' ], {}, 2)  # type:ignore[typeddict-item]
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		inference_outputs_list = list(executor.map(lambda inference_inputs : run_inference(inference_session, inference_inputs), inference_inputs_list))
+
+	for index, inference_outputs in enumerate(inference_outputs_list):
+		assert numpy.array_equal(inference_outputs[0], [ [ index * 2, index * 2 ] ])
+	assert inference_session is inference_sessions[0]
+	assert len(inference_sessions[0].run_batch_sizes) + len(inference_sessions[1].run_batch_sizes) == 8
+	assert inference_sessions[1].run_batch_sizes
+	assert warm_up_inference_pool({ 'test': inference_session }) is True  # type:ignore[dict-item]
+	assert inference_sessions[0].run_batch_sizes[-1] == 1
+	assert len(inference_sessions[1].run_batch_sizes) + len(inference_sessions[0].run_batch_sizes) == 10
+
+	INFERENCE_SESSION_POOL_SET.pop(id(inference_session))
+
+
+def test_reserve_inference_session_count() -> None:
+	state_manager.set_item('execution_session_count', 4)
+	state_manager.set_item('session_memory_limit', 1)
+
+	with patch('facefusion.inference_manager.get_file_size', return_value = 256 * 1024 ** 2):
+		assert reserve_inference_session_count('test_1', 'model.onnx', [ 'cpu' ], True) == 4
+		assert reserve_inference_session_count('test_2', 'model.onnx', [ 'cpu' ], True) == 1
+		assert reserve_inference_session_count('test_3', 'model.onnx', [ 'cpu' ], False) == 1
+
+	assert INFERENCE_MEMORY_SET.pop('test_1') == 1024 ** 3
+	assert INFERENCE_MEMORY_SET.pop('test_2') == 256 * 1024 ** 2
+	assert INFERENCE_MEMORY_SET.pop('test_3') == 256 * 1024 ** 2
+
+	state_manager.set_item('execution_session_count', None)
+	state_manager.set_item('session_memory_limit', None)
+
+
+def test_run_inference() -> None:
+	inference_session = FakeInferenceSession('batch', run_delay = 0.1)
+	inference_inputs_list = [ { 'input': numpy.full((1, 2), index, dtype = numpy.float32) } for index in range(4) ]
+
+	assert numpy.array_equal(run_inference(inference_session, inference_inputs_list[1])[0], [ [ 2, 2 ] ])  # type:ignore[arg-type]
+
+	state_manager.set_item('execution_batch_size', 4)
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		inference_outputs_list = list(executor.map(lambda inference_inputs : run_inference(inference_session, inference_inputs), inference_inputs_list))  # type:ignore[arg-type]
+
+	for index, inference_outputs in enumerate(inference_outputs_list):
+		assert numpy.array_equal(inference_outputs[0], [ [ index * 2, index * 2 ] ])
+	assert sum(inference_session.run_batch_sizes[1:]) == 4
+	assert max(inference_session.run_batch_sizes[1:]) > 1
+
+	state_manager.set_item('execution_batch_size', 1)
+
+
+def test_run_inference_with_fixed_batch() -> None:
+	inference_session = FakeInferenceSession(1)
+	inference_inputs_list = [ { 'input': numpy.full((1, 2), index, dtype = numpy.float32) } for index in range(4) ]
+	state_manager.set_item('execution_batch_size', 4)
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		inference_outputs_list = list(executor.map(lambda inference_inputs : run_inference(inference_session, inference_inputs), inference_inputs_list))  # type:ignore[arg-type]
+
+	for index, inference_outputs in enumerate(inference_outputs_list):
+		assert numpy.array_equal(inference_outputs[0], [ [ index * 2, index * 2 ] ])
+	assert inference_session.run_batch_sizes == [ 1, 1, 1, 1 ]
+
+	state_manager.set_item('execution_batch_size', 1)
+
+
+def test_run_inference_with_error() -> None:
+	inference_session = FakeInferenceSession('batch', True)
+	inference_inputs_list = [ { 'input': numpy.full((1, 2), index, dtype = numpy.float32) } for index in range(4) ]
+	state_manager.set_item('execution_batch_size', 4)
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		inference_futures = [ executor.submit(run_inference, inference_session, inference_inputs) for inference_inputs in inference_inputs_list ]  # type:ignore[arg-type]
+
+		for inference_future in inference_futures:
+			with pytest.raises(RuntimeError):
+				inference_future.result(timeout = 5)
+
+	state_manager.set_item('execution_batch_size', 1)
+
+
+def test_run_inference_without_pending() -> None:
+	inference_session = FakeInferenceSession('batch')
+	state_manager.set_item('execution_batch_size', 4)
+	state_manager.set_item('execution_batch_wait', 1000)
+	start_time = perf_counter()
+
+	assert numpy.array_equal(run_inference(inference_session, { 'input': numpy.ones((1, 2), dtype = numpy.float32) })[0], [ [ 2, 2 ] ])  # type:ignore[arg-type]
+	assert perf_counter() - start_time < 0.5
+
+	state_manager.set_item('execution_batch_size', 1)
+	state_manager.set_item('execution_batch_wait', 50)
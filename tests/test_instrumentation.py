@@ -0,0 +1,71 @@
+import tempfile
+import threading
+
+import pytest
+
+from facefusion import instrumentation
+from facefusion.instrumentation import clear_stage_timers, clear_trace_events, collect_stage_metrics, instrument, set_trace_frame, write_trace_events
+from facefusion.json import read_json
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_stage_timers()
+	clear_trace_events()
+
+
+@instrument('test_stage')
+def run_stage(value : int) -> int:
+	return value * 2
+
+
+def test_instrument() -> None:
+	instrumentation.init(False)
+
+	assert run_stage(1) == 2
+	assert collect_stage_metrics() == {}
+
+	instrumentation.init(True)
+
+	for value in range(10):
+		assert run_stage(value) == value * 2
+
+	stage_metrics = collect_stage_metrics().get('test_stage')
+
+	assert stage_metrics.get('count') == 10
+	assert stage_metrics.get('p50') <= stage_metrics.get('p95') <= stage_metrics.get('p99')
+	assert stage_metrics.get('total') >= stage_metrics.get('p99')
+
+	instrumentation.init(False)
+
+
+def test_trace() -> None:
+	_, trace_path = tempfile.mkstemp(suffix = '.json')
+
+	instrumentation.init(False, trace_path)
+
+	def run_frames(frame_numbers : range) -> None:
+		for frame_number in frame_numbers:
+			set_trace_frame(frame_number)
+			run_stage(frame_number)
+
+	thread = threading.Thread(target = run_frames, args = (range(5, 10),))
+	thread.start()
+	run_frames(range(5))
+	thread.join()
+
+	assert collect_stage_metrics() == {}
+	assert write_trace_events() is True
+
+	trace_events = read_json(trace_path).get('traceEvents')
+	stage_events = [ trace_event for trace_event in trace_events if trace_event.get('ph') == 'X' ]
+	thread_events = [ trace_event for trace_event in trace_events if trace_event.get('ph') == 'M' ]
+
+	assert len(stage_events) == 10
+	assert sorted(stage_event.get('args').get('frame_number') for stage_event in stage_events) == list(range(10))
+	assert len(thread_events) == 2
+	assert { thread_event.get('tid') for thread_event in thread_events } == { stage_event.get('tid') for stage_event in stage_events }
+
+	instrumentation.init(False)
+
+	assert write_trace_events() is False
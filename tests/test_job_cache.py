@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.filesystem import is_file
+from facefusion.jobs.job_cache import create_step_cache_key, evict_step_cache, get_step_cache_path, read_step_cache, write_step_cache
+from facefusion.jobs.job_manager import clear_jobs, init_jobs
+from .helper import get_test_jobs_directory, get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_jobs(get_test_jobs_directory())
+	init_jobs(get_test_jobs_directory())
+	prepare_test_output_directory()
+	state_manager.init_item('job_cache_limit', 1)
+
+	for file_name, file_content in [ ('target-1.mp4', b'target'), ('target-2.mp4', b'target'), ('target-3.mp4', b'other') ]:
+		with open(get_test_output_file(file_name), 'wb') as file:
+			file.write(file_content)
+
+
+def test_create_step_cache_key() -> None:
+	step_args_1 =\
+	{
+		'target_path': get_test_output_file('target-1.mp4'),
+		'output_path': get_test_output_file('output-1.mp4')
+	}
+	step_args_2 =\
+	{
+		'target_path': get_test_output_file('target-2.mp4'),
+		'output_path': get_test_output_file('output-2.mp4')
+	}
+	step_args_3 =\
+	{
+		'target_path': get_test_output_file('target-3.mp4'),
+		'output_path': get_test_output_file('output-3.mp4')
+	}
+	step_args_4 =\
+	{
+		'target_path': get_test_output_file('target-1.mp4'),
+		'output_path': get_test_output_file('output-4.mkv')
+	}
+	step_args_5 =\
+	{
+		'target_path': get_test_output_file('target-invalid.mp4'),
+		'output_path': get_test_output_file('output-5.mp4')
+	}
+
+	assert create_step_cache_key(step_args_1) == create_step_cache_key(step_args_2)
+	assert len(create_step_cache_key(step_args_1)) == 64
+	assert create_step_cache_key(step_args_1) != create_step_cache_key(step_args_3)
+	assert create_step_cache_key(step_args_1) != create_step_cache_key(step_args_4)
+	assert create_step_cache_key(step_args_5) is None
+
+	state_manager.init_item('job_cache_limit', 0)
+
+	assert create_step_cache_key(step_args_1) is None
+
+
+def test_read_and_write_step_cache() -> None:
+	assert read_step_cache('cache-key', get_test_output_file('output.mp4')) is False
+	assert write_step_cache('cache-key', get_test_output_file('target-1.mp4')) is True
+	assert read_step_cache('cache-key', get_test_output_file('output.mp4')) is True
+	assert is_file(get_test_output_file('output.mp4')) is True
+
+
+def test_evict_step_cache() -> None:
+	write_step_cache('cache-key-1', get_test_output_file('target-1.mp4'))
+	write_step_cache('cache-key-2', get_test_output_file('target-3.mp4'))
+	os.utime(get_step_cache_path('cache-key-1', 'output.mp4'), (0, 0))
+
+	assert evict_step_cache(5) is True
+	assert is_file(get_step_cache_path('cache-key-1', 'output.mp4')) is False
+	assert is_file(get_step_cache_path('cache-key-2', 'output.mp4')) is True
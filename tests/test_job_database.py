@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from facefusion.filesystem import is_file
+from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, export_jobs, find_job_ids, find_jobs, get_steps, init_jobs, set_step_cache, set_step_metrics, set_step_status, submit_job
+from .helper import get_test_jobs_directory
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_jobs(get_test_jobs_directory())
+
+
+def test_set_step_status() -> None:
+	args_1 =\
+	{
+		'source_path': 'source-1.jpg',
+		'target_path': 'target-1.jpg',
+		'output_path': 'output-1.jpg'
+	}
+
+	init_jobs(get_test_jobs_directory(), 'sqlite')
+	create_job('job-test-set-step-status')
+	add_step('job-test-set-step-status', args_1)
+	add_step('job-test-set-step-status', args_1)
+
+	assert set_step_status('job-test-set-step-status', 1, 'completed') is True
+	assert set_step_status('job-test-set-step-status', 2, 'completed') is False
+	assert set_step_cache('job-test-set-step-status', 1, 'hit') is True
+	assert [ step.get('status') for step in get_steps('job-test-set-step-status') ] == [ 'drafted', 'completed' ]
+	assert [ step.get('cache') for step in get_steps('job-test-set-step-status') ] == [ None, 'hit' ]
+	assert set_step_metrics('job-test-set-step-status', 0, { 'paste_back': { 'count': 1, 'total': 1.0, 'p50': 1.0, 'p95': 1.0, 'p99': 1.0 } }) is True
+	assert [ step.get('metrics') for step in get_steps('job-test-set-step-status') ] == [ { 'paste_back': { 'count': 1, 'total': 1.0, 'p50': 1.0, 'p95': 1.0, 'p99': 1.0 } }, None ]
+
+
+def test_import_and_export_jobs() -> None:
+	args_1 =\
+	{
+		'source_path': 'source-1.jpg',
+		'target_path': 'target-1.jpg',
+		'output_path': 'output-1.jpg'
+	}
+
+	init_jobs(get_test_jobs_directory())
+	create_job('job-test-import-jobs-1')
+	create_job('job-test-import-jobs-2')
+	add_step('job-test-import-jobs-2', args_1)
+	submit_job('job-test-import-jobs-2')
+	init_jobs(get_test_jobs_directory(), 'sqlite')
+
+	assert find_job_ids('drafted') == [ 'job-test-import-jobs-1' ]
+	assert find_job_ids('queued') == [ 'job-test-import-jobs-2' ]
+	assert find_jobs('queued').get('job-test-import-jobs-2').get('steps')[0].get('args') == args_1
+
+	create_job('job-test-export-jobs')
+
+	assert export_jobs() is True
+	assert is_file(os.path.join(get_test_jobs_directory(), 'drafted', 'job-test-export-jobs.json')) is True
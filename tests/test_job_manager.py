@@ -3,7 +3,7 @@ from time import sleep
 import pytest
 
 from facefusion.jobs.job_helper import get_step_output_path
-from facefusion.jobs.job_manager import add_step, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, find_jobs, get_steps, init_jobs, insert_step, move_job_file, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
+from facefusion.jobs.job_manager import add_step, claim_job, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, find_jobs, find_stale_job_ids, get_steps, init_jobs, insert_step, move_job_file, release_job, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
 from .helper import get_test_jobs_directory
 
 
@@ -384,3 +384,30 @@ def test_set_steps_status() -> None:
 	assert steps[0].get('status') == 'queued'
 	assert steps[1].get('status') == 'queued'
 	assert count_step_total('job-test-set-steps-status') == 2
+
+
+def test_claim_job() -> None:
+	args_1 =\
+	{
+		'source_path': 'source-1.jpg',
+		'target_path': 'target-1.jpg',
+		'output_path': 'output-1.jpg'
+	}
+
+	assert claim_job('job-invalid') is False
+
+	create_job('job-test-claim-job')
+	add_step('job-test-claim-job', args_1)
+
+	assert claim_job('job-test-claim-job') is False
+
+	submit_job('job-test-claim-job')
+
+	assert claim_job('job-test-claim-job') is True
+	assert claim_job('job-test-claim-job') is False
+	assert find_job_ids('started') == [ 'job-test-claim-job' ]
+	assert find_stale_job_ids(60) == []
+	assert find_stale_job_ids(-1) == [ 'job-test-claim-job' ]
+	assert release_job('job-test-claim-job') is True
+	assert release_job('job-test-claim-job') is False
+	assert find_job_ids('queued') == [ 'job-test-claim-job' ]
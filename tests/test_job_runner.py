@@ -1,7 +1,9 @@
 import subprocess
+import tempfile
 
 import pytest
 
+from facefusion import state_manager
 from facefusion.download import conditional_download
 from facefusion.filesystem import copy_file
 from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, init_jobs, move_job_file, submit_job, submit_jobs
@@ -18,6 +20,7 @@ def before_all() -> None:
 		'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/target-240p.mp4'
 	])
 	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vframes', '1', get_test_example_file('target-240p.jpg') ])
+	state_manager.init_item('temp_path', tempfile.gettempdir())
 
 
 @pytest.fixture(scope = 'function', autouse = True)
@@ -66,6 +69,27 @@ def test_run_job() -> None:
 	assert run_job('job-test-run-job', process_step) is True
 
 
+def test_run_job_with_step_workers() -> None:
+	args_1 =\
+	{
+		'source_path': get_test_example_file('source.jpg'),
+		'target_path': get_test_example_file('target-240p.mp4'),
+		'output_path': get_test_output_file('output-1.mp4')
+	}
+
+	state_manager.init_item('log_level', 'info')
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('jobs_path', get_test_jobs_directory())
+	create_job('job-test-run-job-with-step-workers')
+	add_step('job-test-run-job-with-step-workers', args_1)
+	add_step('job-test-run-job-with-step-workers', args_1)
+	add_step('job-test-run-job-with-step-workers', args_1)
+	submit_job('job-test-run-job-with-step-workers')
+
+	assert run_job('job-test-run-job-with-step-workers', process_step, 2) is True
+	assert is_test_output_file('output-1.mp4') is True
+
+
 def test_run_jobs() -> None:
 	args_1 =\
 	{
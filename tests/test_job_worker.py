@@ -0,0 +1,93 @@
+import pytest
+
+from facefusion import inference_manager, state_manager
+from facefusion.exit_helper import hard_exit
+from facefusion.filesystem import copy_file
+from facefusion.jobs import job_worker
+from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, find_job_ids, init_jobs, submit_job
+from facefusion.jobs.job_worker import evict_inference_pools, poll_jobs
+from facefusion.types import Args
+from .helper import get_test_jobs_directory, get_test_output_file, get_test_outputs_directory, is_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_jobs(get_test_jobs_directory())
+	init_jobs(get_test_jobs_directory())
+	prepare_test_output_directory()
+	state_manager.init_item('temp_path', get_test_outputs_directory())
+	state_manager.init_item('job_worker_memory_limit', 0)
+
+	with open(get_test_output_file('target.jpg'), 'wb') as file:
+		file.write(b'target')
+
+
+def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
+	return copy_file(step_args.get('target_path'), step_args.get('output_path'))
+
+
+def test_poll_jobs() -> None:
+	for job_id, output_file in [ ('job-test-poll-jobs-1', 'output-1.jpg'), ('job-test-poll-jobs-2', 'output-2.jpg') ]:
+		create_job(job_id)
+		add_step(job_id,
+		{
+			'target_path': get_test_output_file('target.jpg'),
+			'output_path': get_test_output_file(output_file)
+		})
+		submit_job(job_id)
+
+	assert poll_jobs(process_step) is True
+	assert find_job_ids('completed') == [ 'job-test-poll-jobs-1', 'job-test-poll-jobs-2' ]
+	assert is_test_output_file('output-1.jpg') is True
+	assert is_test_output_file('output-2.jpg') is True
+	assert poll_jobs(process_step) is False
+
+
+def test_poll_jobs_with_crash() -> None:
+	def crash_step(job_id : str, step_index : int, step_args : Args) -> bool:
+		if job_id == 'job-test-poll-jobs-1':
+			hard_exit(1)
+		if job_id == 'job-test-poll-jobs-2':
+			raise TypeError('invalid step value')
+		return process_step(job_id, step_index, step_args)
+
+	for job_id, output_file in [ ('job-test-poll-jobs-1', 'output-1.jpg'), ('job-test-poll-jobs-2', 'output-2.jpg'), ('job-test-poll-jobs-3', 'output-3.jpg') ]:
+		create_job(job_id)
+		add_step(job_id,
+		{
+			'target_path': get_test_output_file('target.jpg'),
+			'output_path': get_test_output_file(output_file)
+		})
+		submit_job(job_id)
+
+	assert poll_jobs(crash_step) is True
+	assert find_job_ids('failed') == [ 'job-test-poll-jobs-1', 'job-test-poll-jobs-2' ]
+	assert find_job_ids('completed') == [ 'job-test-poll-jobs-3' ]
+	assert find_job_ids('started') == []
+
+
+def test_evict_inference_pools() -> None:
+	inference_manager.INFERENCE_POOL_SET['cli'] =\
+	{
+		'face_swapper.model_1': { 'face_swapper': object() }, #type:ignore[dict-item]
+		'face_swapper.model_2': { 'face_swapper': object() } #type:ignore[dict-item]
+	}
+	inference_manager.INFERENCE_USAGE_SET.update(
+	{
+		'face_swapper.model_1': 1.0,
+		'face_swapper.model_2': 3.0
+	})
+	job_worker.INFERENCE_SIGNATURE = None
+	state_manager.init_item('face_swapper_model', 'model_1')
+	evict_inference_pools(2.0)
+
+	assert list(inference_manager.INFERENCE_POOL_SET.get('cli')) == [ 'face_swapper.model_1', 'face_swapper.model_2' ]
+
+	state_manager.init_item('face_swapper_model', 'model_2')
+	evict_inference_pools(2.0)
+
+	assert list(inference_manager.INFERENCE_POOL_SET.get('cli')) == [ 'face_swapper.model_2' ]
+	assert list(inference_manager.INFERENCE_USAGE_SET) == [ 'face_swapper.model_2' ]
+
+	inference_manager.INFERENCE_POOL_SET['cli'] = {}
+	inference_manager.INFERENCE_USAGE_SET.clear()
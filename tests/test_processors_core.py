@@ -0,0 +1,301 @@
+import os
+import subprocess
+import sys
+import tempfile
+from functools import partial
+from time import sleep
+from types import ModuleType
+from typing import Any, Iterable, List, Optional, Tuple
+
+import numpy
+import pytest
+
+from facefusion import face_detector, face_landmarker, face_recognizer, process_manager, state_manager
+from facefusion.core import collect_inference_modules
+from facefusion.frame_journal import write_journal_frame
+from facefusion.frame_scheduler import create_frame_scheduler
+from facefusion.processors.core import PROCESSORS_METHODS, create_queue_payloads, get_processors_modules, get_target_faces, iterate_frame_scheduler, multi_process_frames, multi_spawn_frames, multi_stage_frames, multi_stream_frames, process_fused_frames, run_processor_chain
+from facefusion.processors.types import ProcessorInputs
+from facefusion.types import QueuePayload, UpdateProgress, VisionFrame
+from facefusion.vision import read_image, write_image
+
+
+def invert_frame(inputs : ProcessorInputs) -> VisionFrame:
+	return 255 - inputs.get('target_vision_frame')
+
+
+def halve_frame(inputs : ProcessorInputs) -> VisionFrame:
+	return inputs.get('target_vision_frame') // 2 + 10
+
+
+def fail_frame(inputs : ProcessorInputs) -> VisionFrame:
+	raise RuntimeError('processor failed')
+
+
+def stop_frame(inputs : ProcessorInputs) -> VisionFrame:
+	process_manager.stop()
+	return invert_frame(inputs)
+
+
+def analyse_frame(inputs : ProcessorInputs) -> VisionFrame:
+	get_target_faces(inputs)
+	return inputs.get('target_vision_frame')
+
+
+def process_stub_frames(processor : str, source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
+	processor_module = sys.modules.get('facefusion.processors.modules.' + processor)
+
+	for queue_payload in process_manager.manage(queue_payloads):
+		target_vision_frame = read_image(queue_payload.get('frame_path'))
+		output_vision_frame = processor_module.process_frame(
+		{
+			'target_faces': None,
+			'target_vision_frame': target_vision_frame
+		})
+		write_journal_frame(queue_payload, output_vision_frame)
+		update_progress(1)
+
+
+def register_stub_processor(processor : str, process_frame : Any, invalidates_face_geometry : bool = False) -> None:
+	processor_module = ModuleType('facefusion.processors.modules.' + processor)
+
+	for method_name in PROCESSORS_METHODS:
+		setattr(processor_module, method_name, lambda *args : None)
+	processor_module.invalidates_face_geometry = lambda : invalidates_face_geometry #type:ignore[attr-defined]
+	processor_module.requires_target_faces = lambda : False #type:ignore[attr-defined]
+	processor_module.process_frame = process_frame #type:ignore[attr-defined]
+	processor_module.process_frames = partial(process_stub_frames, processor) #type:ignore[attr-defined]
+	processor_module.process_video = lambda source_paths, temp_frame_paths : multi_process_frames(source_paths, temp_frame_paths, processor_module.process_frames) #type:ignore[attr-defined]
+	sys.modules[processor_module.__name__] = processor_module
+
+
+register_stub_processor('stub_invert', invert_frame)
+register_stub_processor('stub_halve', halve_frame)
+register_stub_processor('stub_fail', fail_frame)
+register_stub_processor('stub_stop', stop_frame)
+register_stub_processor('stub_analyse', analyse_frame)
+register_stub_processor('stub_analyse_invalidate', analyse_frame, invalidates_face_geometry = True)
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('execution_thread_count', 2)
+	state_manager.init_item('execution_queue_count', 1)
+	state_manager.init_item('execution_worker_mode', 'thread')
+	state_manager.init_item('execution_schedule_mode', 'locality')
+	state_manager.init_item('pipeline_stage_workers', [ 1, 1, 2, 1 ])
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('face_selector_mode', 'many')
+	state_manager.init_item('target_path', None)
+	state_manager.init_item('source_paths', [])
+	state_manager.init_item('face_mask_types', [ 'box' ])
+	state_manager.init_item('output_video_fps', 25.0)
+	state_manager.init_item('log_level', 'error')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	process_manager.start()
+
+
+def create_temp_frame_paths(frame_total : int) -> List[str]:
+	temp_directory_path = tempfile.mkdtemp()
+	temp_frame_paths = []
+
+	for frame_number in range(frame_total):
+		temp_frame_path = os.path.join(temp_directory_path, str(frame_number).zfill(4) + '.png')
+		write_image(temp_frame_path, numpy.random.randint(0, 255, (8, 8, 3), dtype = numpy.uint8))
+		temp_frame_paths.append(temp_frame_path)
+	return temp_frame_paths
+
+
+def copy_temp_frame_paths(temp_frame_paths : List[str]) -> List[str]:
+	temp_directory_path = tempfile.mkdtemp()
+	copy_frame_paths = []
+
+	for temp_frame_path in temp_frame_paths:
+		copy_frame_path = os.path.join(temp_directory_path, os.path.basename(temp_frame_path))
+		write_image(copy_frame_path, read_image(temp_frame_path))
+		copy_frame_paths.append(copy_frame_path)
+	return copy_frame_paths
+
+
+def process_sequential_frames(processors : List[str], temp_frame_paths : List[str]) -> None:
+	for processor in processors:
+		sys.modules.get('facefusion.processors.modules.' + processor).process_video([], temp_frame_paths)
+
+
+def read_temp_frames(temp_frame_paths : List[str]) -> List[VisionFrame]:
+	return [ read_image(temp_frame_path) for temp_frame_path in temp_frame_paths ]
+
+
+def test_process_fused_frames() -> None:
+	sequential_frame_paths = create_temp_frame_paths(12)
+	fused_frame_paths = copy_temp_frame_paths(sequential_frame_paths)
+
+	process_sequential_frames([ 'stub_invert', 'stub_halve' ], sequential_frame_paths)
+	multi_process_frames([], fused_frame_paths, partial(process_fused_frames, [ 'stub_invert', 'stub_halve' ]))
+
+	for sequential_frame, fused_frame in zip(read_temp_frames(sequential_frame_paths), read_temp_frames(fused_frame_paths)):
+		assert numpy.array_equal(sequential_frame, fused_frame)
+
+
+def test_process_fused_frames_with_error() -> None:
+	temp_frame_paths = create_temp_frame_paths(4)
+
+	with pytest.raises(RuntimeError):
+		multi_process_frames([], temp_frame_paths, partial(process_fused_frames, [ 'stub_invert', 'stub_fail' ]))
+
+
+def test_process_fused_frames_with_stop() -> None:
+	temp_frame_paths = create_temp_frame_paths(12)
+	temp_frames = read_temp_frames(temp_frame_paths)
+	state_manager.set_item('execution_thread_count', 1)
+
+	multi_process_frames([], temp_frame_paths, partial(process_fused_frames, [ 'stub_stop' ]))
+
+	assert process_manager.is_stopping() is True
+	assert sum(not numpy.array_equal(temp_frame, output_frame) for temp_frame, output_frame in zip(temp_frames, read_temp_frames(temp_frame_paths))) == 1
+
+	state_manager.set_item('execution_thread_count', 2)
+
+
+def open_stream(frame_total : int) -> Tuple[subprocess.Popen[bytes], subprocess.Popen[bytes]]:
+	frame_reader = subprocess.Popen([ sys.executable, '-c', 'import sys; sys.stdout.buffer.write(bytes(' + str(4 * 4 * 3 * frame_total) + '))' ], stdout = subprocess.PIPE)
+	frame_writer = subprocess.Popen([ sys.executable, '-c', 'import sys; sys.stdin.buffer.read()' ], stdin = subprocess.PIPE)
+	return frame_reader, frame_writer
+
+
+def test_multi_stream_frames() -> None:
+	frame_reader, frame_writer = open_stream(8)
+
+	assert multi_stream_frames(frame_reader, frame_writer, (4, 4), (4, 4), 8, lambda frame_number, vision_frame : vision_frame) is True
+	assert frame_reader.returncode == 0
+	assert frame_writer.returncode == 0
+
+
+def test_multi_stream_frames_with_error() -> None:
+	frame_reader, frame_writer = open_stream(8)
+
+	def process_stream_frame(frame_number : int, vision_frame : VisionFrame) -> VisionFrame:
+		if frame_number == 3:
+			raise RuntimeError('stream frame failed')
+		return vision_frame
+
+	with pytest.raises(RuntimeError):
+		multi_stream_frames(frame_reader, frame_writer, (4, 4), (4, 4), 8, process_stream_frame)
+
+	assert frame_reader.poll() is not None
+	assert frame_writer.poll() is not None
+	assert frame_reader.stdout.closed is True
+	assert frame_writer.stdin.closed is True
+
+
+def test_multi_spawn_frames() -> None:
+	sequential_frame_paths = create_temp_frame_paths(12)
+	spawn_frame_paths = copy_temp_frame_paths(sequential_frame_paths)
+
+	process_sequential_frames([ 'stub_invert' ], sequential_frame_paths)
+	multi_spawn_frames([], spawn_frame_paths, partial(process_stub_frames, 'stub_invert'))
+
+	for sequential_frame, spawn_frame in zip(read_temp_frames(sequential_frame_paths), read_temp_frames(spawn_frame_paths)):
+		assert numpy.array_equal(sequential_frame, spawn_frame)
+
+
+def test_multi_spawn_frames_with_error() -> None:
+	temp_frame_paths = create_temp_frame_paths(4)
+
+	with pytest.raises(RuntimeError):
+		multi_spawn_frames([], temp_frame_paths, partial(process_stub_frames, 'stub_fail'))
+
+
+def test_multi_spawn_frames_with_stop() -> None:
+	temp_frame_paths = create_temp_frame_paths(4)
+	temp_frames = read_temp_frames(temp_frame_paths)
+	process_manager.stop()
+
+	multi_spawn_frames([], temp_frame_paths, partial(process_stub_frames, 'stub_invert'))
+
+	for temp_frame, output_frame in zip(temp_frames, read_temp_frames(temp_frame_paths)):
+		assert numpy.array_equal(temp_frame, output_frame)
+
+
+def test_multi_stage_frames() -> None:
+	sequential_frame_paths = create_temp_frame_paths(12)
+	stage_frame_paths = copy_temp_frame_paths(sequential_frame_paths)
+
+	process_sequential_frames([ 'stub_invert', 'stub_halve' ], sequential_frame_paths)
+	multi_stage_frames([ 'stub_invert', 'stub_halve' ], [], stage_frame_paths)
+
+	for sequential_frame, stage_frame in zip(read_temp_frames(sequential_frame_paths), read_temp_frames(stage_frame_paths)):
+		assert numpy.array_equal(sequential_frame, stage_frame)
+
+
+def test_multi_stage_frames_with_error() -> None:
+	temp_frame_paths = create_temp_frame_paths(12)
+
+	with pytest.raises(RuntimeError):
+		multi_stage_frames([ 'stub_invert', 'stub_fail' ], [], temp_frame_paths)
+
+
+def test_multi_stage_frames_with_stop() -> None:
+	temp_frame_paths = create_temp_frame_paths(12)
+	temp_frames = read_temp_frames(temp_frame_paths)
+
+	multi_stage_frames([ 'stub_stop' ], [], temp_frame_paths)
+
+	assert process_manager.is_stopping() is True
+	assert sum(not numpy.array_equal(temp_frame, output_frame) for temp_frame, output_frame in zip(temp_frames, read_temp_frames(temp_frame_paths))) < 12
+
+
+@pytest.mark.parametrize('processors, detect_total',
+[
+	([ 'stub_analyse', 'stub_analyse' ], 1),
+	([ 'stub_analyse', 'stub_invert', 'stub_analyse' ], 1),
+	([ 'stub_analyse_invalidate', 'stub_analyse' ], 2),
+	([ 'stub_analyse_invalidate', 'stub_analyse_invalidate', 'stub_analyse' ], 3)
+])
+def test_run_processor_chain(monkeypatch : pytest.MonkeyPatch, processors : List[str], detect_total : int) -> None:
+	detect_calls : List[Optional[int]] = []
+
+	def get_frame_faces(vision_frame : VisionFrame, frame_number : Optional[int]) -> List[Any]:
+		detect_calls.append(frame_number)
+		return []
+
+	monkeypatch.setattr('facefusion.processors.core.get_frame_faces', get_frame_faces)
+	target_vision_frame = numpy.zeros((8, 8, 3), dtype = numpy.uint8)
+
+	run_processor_chain(get_processors_modules(processors),
+	{
+		'target_frame_number': 0,
+		'target_faces': None,
+		'target_vision_frame': target_vision_frame
+	}) #type:ignore[typeddict-item]
+
+	assert len(detect_calls) == detect_total
+	assert detect_calls == [ 0 ] + [ None ] * (detect_total - 1)
+
+
+def test_collect_inference_modules() -> None:
+	state_manager.set_item('processors', [ 'stub_invert' ])
+	state_manager.set_item('demanded_face_attributes', [])
+
+	assert collect_inference_modules() == get_processors_modules([ 'stub_invert' ])
+
+	state_manager.set_item('demanded_face_attributes', [ 'embedding' ])
+
+	assert collect_inference_modules()[:3] == [ face_detector, face_landmarker, face_recognizer ]
+
+	state_manager.set_item('demanded_face_attributes', None)
+	state_manager.set_item('processors', None)
+
+
+def test_iterate_frame_scheduler() -> None:
+	frame_scheduler = create_frame_scheduler(create_queue_payloads([ 'frame-0.png', 'frame-1.png' ]), 1, 'locality')
+
+	for _ in iterate_frame_scheduler(frame_scheduler, 0):
+		sleep(0.05)
+	worker_stats = frame_scheduler.get('worker_stats').get(0)
+
+	assert worker_stats.get('frame_total') == 2
+	assert 0.1 <= worker_stats.get('busy_time') < 0.2
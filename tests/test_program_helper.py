@@ -2,7 +2,7 @@ from argparse import ArgumentParser
 
 import pytest
 
-from facefusion.program_helper import find_argument_group, validate_actions
+from facefusion.program_helper import find_argument_group, validate_actions, validate_step_args
 
 
 def test_find_argument_group() -> None:
@@ -38,3 +38,21 @@ def test_validate_actions() -> None:
 			action.default = args[action.dest]
 
 	assert validate_actions(program) is False
+
+
+def test_validate_step_args() -> None:
+	program = ArgumentParser()
+	program.add_argument('--test-1', choices = [ 'test_1', 'test_2' ], nargs = '+')
+	program.add_argument('--test-2', type = float, choices = [ 0.0, 0.5, 1.0 ])
+	program.add_argument('--test-3', type = int, nargs = 2)
+	program.add_argument('--test-4', action = 'store_true')
+
+	assert validate_step_args(program, { 'test_1': [ 'test_2' ], 'test_2': 1, 'test_3': [ 1, 2 ], 'test_4': True }) is True
+	assert validate_step_args(program, { 'test_1': [ 'invalid' ] }) is False
+	assert validate_step_args(program, { 'test_1': 'test_1' }) is False
+	assert validate_step_args(program, { 'test_2': 'invalid' }) is False
+	assert validate_step_args(program, { 'test_2': 0.25 }) is False
+	assert validate_step_args(program, { 'test_3': [ 1 ] }) is False
+	assert validate_step_args(program, { 'test_3': [ 1, True ] }) is False
+	assert validate_step_args(program, { 'test_4': 'true' }) is False
+	assert validate_step_args(program, { 'invalid': True }) is False
@@ -0,0 +1,14 @@
+from facefusion.segment_helper import create_video_segments
+
+
+def test_create_video_segments() -> None:
+	assert create_video_segments(0, 100, [], 1) == [ (0, 100) ]
+	assert create_video_segments(0, 100, [], 4) == [ (0, 25), (25, 50), (50, 75), (75, 100) ]
+	assert create_video_segments(10, 20, [], 20) == [ (10, 11), (11, 12), (12, 13), (13, 14), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20) ]
+
+
+def test_create_video_segments_on_keyframes() -> None:
+	assert create_video_segments(0, 100, [ 0, 30, 60, 90 ], 2) == [ (0, 60), (60, 100) ]
+	assert create_video_segments(0, 100, [ 0, 30, 60, 90 ], 3) == [ (0, 30), (30, 60), (60, 100) ]
+	assert create_video_segments(0, 100, [ 0, 40 ], 4) == [ (0, 40), (40, 100) ]
+	assert create_video_segments(50, 100, [ 0, 40 ], 2) == [ (50, 75), (75, 100) ]
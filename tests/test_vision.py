@@ -1,9 +1,10 @@
 import subprocess
 
+import numpy
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.vision import calc_histogram_difference, count_trim_frame_total, count_video_frame_total, create_image_resolutions, create_video_resolutions, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution, write_image
+from facefusion.vision import calc_histogram_difference, count_trim_frame_total, count_video_frame_total, create_image_resolutions, create_tile_frames, create_video_resolutions, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, merge_tile_frames, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution, write_image
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -177,3 +178,12 @@ def test_match_frame_color() -> None:
 	output_vision_frame = match_frame_color(source_vision_frame, target_vision_frame)
 
 	assert calc_histogram_difference(source_vision_frame, output_vision_frame) > 0.5
+
+
+def test_create_and_merge_tile_frames() -> None:
+	vision_frame = numpy.random.randint(0, 255, (100, 130, 3), dtype = numpy.uint8)
+	tile_vision_frames, pad_width, pad_height = create_tile_frames(vision_frame, (32, 8, 4))
+	merge_vision_frame = numpy.zeros((pad_height, pad_width, 3), dtype = numpy.uint8)
+
+	assert numpy.array_equal(merge_tile_frames(tile_vision_frames, 130, 100, pad_width, pad_height, (32, 8, 4)), vision_frame)
+	assert numpy.array_equal(merge_tile_frames(tile_vision_frames, 130, 100, pad_width, pad_height, (32, 8, 4), merge_vision_frame), vision_frame)